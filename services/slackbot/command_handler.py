@@ -5,16 +5,24 @@ Simplified handler that uses prompts.yml and Slack's native history.
 """
 
 import asyncio
+import collections
+import functools
+import hashlib
+import io
 import json
-import requests
+import os
+import string
 import sys
-import traceback
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+import time
+from typing import Dict, Any, Callable, List, Optional, Tuple
+from datetime import datetime
+from operator import attrgetter
 import logging
 
+import httpx
+
 from shared.core.config import Config
-from shared.core.utils import load_prompts
+from shared.core.utils import dump_json_bytes, load_prompts, parse_json
 from shared.services.slack_service import SlackService
 from shared.services.ai_service import OpenAIService
 from shared.services.linear_service import LinearService
@@ -22,17 +30,224 @@ from shared.services.notion_service import NotionService
 from shared.services.supabase_service import SupabaseService
 from shared.core.models import LinearContext
 
+
+class TTLStore:
+    """
+    Bounded per-user store whose entries expire a fixed time after they were set.
+    
+    Entries are kept in insertion order, which with a single TTL is also expiry
+    order, so expired and over-capacity entries are evicted from the front in O(1).
+    """
+    
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data: "collections.OrderedDict[str, Tuple[float, Any]]" = collections.OrderedDict()
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._data.pop(key, None)
+        self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._evict()
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        if entry[0] <= time.monotonic():
+            del self._data[key]
+            return default
+        return entry[1]
+    
+    def pop(self, key: str, default: Any = None) -> Any:
+        value = self.get(key, default)
+        self._data.pop(key, None)
+        return value
+    
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, self) is not self
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def _evict(self) -> None:
+        now = time.monotonic()
+        while self._data:
+            expires_at, _ = next(iter(self._data.values()))
+            if len(self._data) <= self.maxsize and expires_at > now:
+                break
+            self._data.popitem(last=False)
+
+
+# Per-user state is capped so a click storm can't grow it without bound
+USER_STATE_MAX_ENTRIES = 10_000
+
 # Global storage for user transcript selections (in production, use Redis or database)
-USER_TRANSCRIPT_SELECTIONS = {}
 SELECTION_TIMEOUT_MINUTES = 10
+USER_TRANSCRIPT_SELECTIONS = TTLStore(USER_STATE_MAX_ENTRIES, SELECTION_TIMEOUT_MINUTES * 60)
 
 # Global storage for pending ticket creations
-USER_PENDING_TICKETS = {}
 PENDING_TICKET_TIMEOUT_MINUTES = 10
+USER_PENDING_TICKETS = TTLStore(USER_STATE_MAX_ENTRIES, PENDING_TICKET_TIMEOUT_MINUTES * 60)
+
+# Meeting summaries keyed on (transcript id, prompt version) so repeat /summarize calls skip the LLM
+MEETING_SUMMARY_CACHE: "collections.OrderedDict[str, str]" = collections.OrderedDict()
+MEETING_SUMMARY_CACHE_SIZE = 64
+# Transcript budget for /summarize meeting, in characters (roughly 750 tokens of English)
+MEETING_TRANSCRIPT_MAX_CHARS = 3000
+
+# Streaming: push a chat.update after N deltas or on a sentence boundary, but never more
+# often than the minimum interval, to stay under Slack's ~1 update/s per-channel limit
+STREAM_UPDATE_TOKENS = 40
+STREAM_MIN_UPDATE_INTERVAL_SECONDS = 1.0
+# Appended when the stream fails part-way, so a cut-off answer doesn't pass for a complete one
+STREAM_INTERRUPTED_NOTICE = "\n\n⚠️ Response interrupted"
+
+# Back-to-back commands share one Supabase + Linear fetch within this window
+CONTEXT_CACHE_TTL_SECONDS = 60
+# Conversational replies (mentions/DMs) may use a context up to this old while a refresh runs in the background
+CONTEXT_STALE_MAX_SECONDS = 600
+
+# Supabase projection for selectors, which only list transcripts
+TRANSCRIPT_LIST_COLUMNS = 'id, filename, created_at'
+
+# Horizontal rule framing the Linear context report
+SECTION_RULE = "=" * 50
+
+# Static pieces of the transcript context blocks, built once instead of per request
+RECENT_MEETINGS_HEADER = "📋 RECENT MEETINGS (Last 7 Days):\n" + "-" * 35
+SELECTED_TRANSCRIPTS_RULE = "=" * 60
+TRANSCRIPT_RULE = "-" * 40
+
+# Linear priority (1 = urgent, 2 = high, 3 = medium) to the emoji used in context listings
+PRIORITY_EMOJI = {1: "🔴", 2: "🟡", 3: "🟢"}
+
+# prompts.yml configs the slash commands depend on; validated when the handler is built
+REQUIRED_PROMPTS = (
+    'slack_bot_chat',
+    'slack_bot_create_tickets',
+    'slack_bot_create_tickets_structured',
+    'slack_bot_update_tickets',
+    'slack_bot_teammember',
+    'slack_bot_weekly_summary',
+    'slack_bot_summarize_meeting',
+    'slack_bot_client_status',
+)
+
+# Prompt configs whose prefix is system prompt + comprehensive context, primed on startup
+WARMUP_PROMPT_NAMES = (
+    'slack_bot_chat',
+    'slack_bot_create_tickets',
+    'slack_bot_update_tickets',
+    'slack_bot_teammember',
+    'slack_bot_weekly_summary',
+    'slack_bot_client_status',
+)
+
+# Headers for JSON bodies that are serialized up front with dump_json_bytes
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# response_url deliveries are queued and posted by a few worker tasks, retrying
+# timeouts, 429s and 5xx with exponential backoff so a slow Slack never holds up a handler
+RESPONSE_WORKERS = 4
+RESPONSE_MAX_ATTEMPTS = 3
+RESPONSE_RETRY_BACKOFF_SECONDS = 0.5
+# How long shutdown waits for queued responses to go out
+RESPONSE_DRAIN_TIMEOUT_SECONDS = 5.0
+
+# Slash commands are run by a fixed pool of workers fed from a bounded queue, so a burst
+# waits its turn (or is turned away when full) instead of spawning a task per request
+COMMAND_WORKERS = 8
+COMMAND_QUEUE_MAX_SIZE = 1000
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=1)
+def _load_prompts_for_mtime(prompts_file: str, mtime: float) -> Dict[str, Any]:
+    """Parse prompts.yml once per file version; the mtime is part of the cache key."""
+    return load_prompts(prompts_file)
+
+
+def _compile_prompt_template(template: str) -> Callable[..., str]:
+    """
+    Pre-parse a str.format template into (literal, field) pieces once.
+    
+    Rendering is then a single join over the pieces instead of re-parsing the
+    format string on every request. Templates using format specs, conversions or
+    attribute/index lookups fall back to str.format.
+    """
+    pieces = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if field is not None and (spec or conversion or not field.isidentifier()):
+            return template.format
+        pieces.append((literal, field))
+    
+    def render(**kwargs: Any) -> str:
+        return "".join(
+            literal if field is None else literal + str(kwargs[field])
+            for literal, field in pieces
+        )
+    
+    return render
+
+
+@functools.lru_cache(maxsize=512)
+def _format_created_date(created_date: Optional[str], fmt: str, unknown: str = 'Unknown date') -> str:
+    """
+    Format a Supabase created_at timestamp for display.
+    
+    The same handful of recent transcripts is rendered by every selector and
+    context build, so parsed results are memoized per (timestamp, format).
+    """
+    try:
+        if created_date and created_date != unknown:
+            return datetime.fromisoformat(created_date.replace('Z', '+00:00')).strftime(fmt)
+        return unknown
+    except Exception:
+        return str(created_date)[:10] if created_date else unknown
+
+
+def _ephemeral(text: str) -> Dict[str, Any]:
+    """Build a Slack reply visible only to the invoking user."""
+    return {"response_type": "ephemeral", "text": text}
+
+
+def _context_footer(updated_at: Optional[datetime] = None) -> str:
+    """Timestamp line closing every context block."""
+    return f"🕐 Last updated: {(updated_at or datetime.now()).strftime('%Y-%m-%d %H:%M')}"
+
+
+def _cached_prompts() -> Dict[str, Any]:
+    """Return the parsed prompts, re-reading the YAML only when the file changes."""
+    prompts_file = str(Config.PROMPTS_FILE)
+    try:
+        mtime = os.stat(prompts_file).st_mtime
+    except OSError:
+        # Let load_prompts raise its usual error for a missing file
+        mtime = 0.0
+    return _load_prompts_for_mtime(prompts_file, mtime)
+
+
+def _filter_linear_context(linear_context: LinearContext, issue_filter: Callable[[Any], bool]) -> LinearContext:
+    """
+    Narrow a workspace to the issues matching issue_filter and the projects/milestones they touch.
+    
+    Falls back to the full workspace when nothing matches, so an unrecognized
+    name still gets useful context instead of an empty one.
+    """
+    issues = [issue for issue in linear_context.issues if issue_filter(issue)]
+    if not issues:
+        return linear_context
+    project_ids = {issue.project_id for issue in issues}
+    milestone_ids = {issue.milestone_id for issue in issues}
+    return LinearContext(
+        projects=[p for p in linear_context.projects if p.id in project_ids],
+        milestones=[m for m in linear_context.milestones if m.id in milestone_ids],
+        issues=issues
+    )
+
+
 def format_linear_context_comprehensive(linear_context: LinearContext) -> str:
     """
     Format Linear context into a comprehensive, highly organized text structure
@@ -42,138 +257,150 @@ def format_linear_context_comprehensive(linear_context: LinearContext) -> str:
     if not linear_context.projects and not linear_context.issues:
         return "📝 LINEAR: No workspace data available"
     
-    sections = []
+    # Lines go straight into one growing buffer instead of a list that is joined at the end
+    buf = io.StringIO()
+    write = buf.write
+    
+    # Single pass over issues: group active work by project, milestone and assignee
+    # so no section below has to rescan linear_context.issues
+    active_by_project: Dict[Optional[str], List[Any]] = {}
+    active_count_by_milestone: Dict[Optional[str], int] = {}
+    assignee_workload: Dict[str, List[Any]] = {}
+    # Active issues are rendered twice (project + workload), so normalize descriptions once
+    desc_lines_by_issue: Dict[Optional[str], List[str]] = {}
+    active_issues = 0
+    for issue in linear_context.issues:
+        if issue.state_type == 'completed':
+            continue
+        active_issues += 1
+        active_by_project.setdefault(issue.project_id, []).append(issue)
+        active_count_by_milestone[issue.milestone_id] = active_count_by_milestone.get(issue.milestone_id, 0) + 1
+        assignee_workload.setdefault(issue.assignee_name or "Unassigned", []).append(issue)
+        if issue.description:
+            desc_lines_by_issue[issue.id] = [line.strip() for line in issue.description.split('\n') if line.strip()]
+    milestones_by_project: Dict[Optional[str], List[Any]] = {}
+    for milestone in linear_context.milestones:
+        milestones_by_project.setdefault(milestone.project_id, []).append(milestone)
     
     # ============================================================================
     # EXECUTIVE SUMMARY
     # ============================================================================
     total_issues = len(linear_context.issues)
-    active_issues = len([i for i in linear_context.issues if i.state_type != 'completed'])
     completed_issues = total_issues - active_issues
     
-    sections.append("🎯 LINEAR WORKSPACE CONTEXT")
-    sections.append("=" * 50)
-    sections.append(f"📊 SUMMARY: {len(linear_context.projects)} projects | {active_issues} active issues | {completed_issues} completed")
-    sections.append(f"📈 Completion Rate: {(completed_issues/total_issues*100) if total_issues > 0 else 0:.1f}%")
-    sections.append("")
+    write(
+        "🎯 LINEAR WORKSPACE CONTEXT\n"
+        f"{SECTION_RULE}\n"
+        f"📊 SUMMARY: {len(linear_context.projects)} projects | {active_issues} active issues | {completed_issues} completed\n"
+        f"📈 Completion Rate: {(completed_issues/total_issues*100) if total_issues > 0 else 0:.1f}%\n"
+        "\n"
+    )
     
     # ============================================================================
     # PROJECTS SECTION - DETAILED VIEW
     # ============================================================================
-    sections.append("🚀 ACTIVE PROJECTS:")
+    write("🚀 ACTIVE PROJECTS:\n")
     
     if not linear_context.projects:
-        sections.append("• No projects found")
+        write("• No projects found\n")
     else:
         # Focus on projects with active work
-        active_projects = [p for p in linear_context.projects if p.state == 'started']
-        backlog_projects = [p for p in linear_context.projects if p.state != 'started']
+        active_projects = []
+        backlog_projects = []
+        for project in linear_context.projects:
+            (active_projects if project.state == 'started' else backlog_projects).append(project)
         
         for project in active_projects:
-            sections.append(f"📋 {project.name} ({project.progress or 0:.1f}% complete)")
-            if project.description:
-                sections.append(f"   📝 {project.description}")
-            else:
-                sections.append(f"   📝 No description")
+            write(
+                f"📋 {project.name} ({project.progress or 0:.1f}% complete)\n"
+                f"   📝 {project.description or 'No description'}\n"
+            )
             
             # Project milestones
-            project_milestones = [m for m in linear_context.milestones if m.project_id == project.id]
+            project_milestones = milestones_by_project.get(project.id)
             if project_milestones:
-                sections.append(f"   🎯 Milestones:")
+                write("   🎯 Milestones:\n")
                 for milestone in project_milestones:
-                    sections.append(f"     • {milestone.name} (Target: {milestone.target_date or 'TBD'})")
+                    write(f"     • {milestone.name} (Target: {milestone.target_date or 'TBD'})\n")
                     if milestone.description:
-                        sections.append(f"       📝 {milestone.description}")
+                        write(f"       📝 {milestone.description}\n")
             
             # Project issues - focus on active
-            project_issues = [iss for iss in linear_context.issues if iss.project_id == project.id]
-            active_project_issues = [iss for iss in project_issues if iss.state_type != 'completed']
+            active_project_issues = active_by_project.get(project.id)
             
             if active_project_issues:
-                sections.append(f"   🔥 Active Issues ({len(active_project_issues)}):")
+                write(f"   🔥 Active Issues ({len(active_project_issues)}):\n")
                 for i, issue in enumerate(active_project_issues, 1):  # Show ALL issues with numbering
-                    priority_emoji = "🔴" if issue.priority == 1 else "🟡" if issue.priority == 2 else "🟢" if issue.priority == 3 else "⚪"
+                    priority_emoji = PRIORITY_EMOJI.get(issue.priority, "⚪")
                     assignee = issue.assignee_name or "Unassigned"
                     
                     # Clear issue separator with title
-                    sections.append(f"   ┌─ Issue #{i}: {priority_emoji} {issue.title}")
-                    sections.append(f"   │  👤 {assignee} | ⏱️ {issue.estimate or 'No'}h | Status: {issue.state_name}")
-                    if issue.description:
-                        # Properly indent description within the box
-                        desc_lines = issue.description.split('\n')
-                        for desc_line in desc_lines:
-                            if desc_line.strip():
-                                sections.append(f"   │  📝 {desc_line.strip()}")
-                    sections.append(f"   └─────────────────────────────────────────────")
-                    sections.append("")  # Extra spacing between issues
+                    write(
+                        f"   ┌─ Issue #{i}: {priority_emoji} {issue.title}\n"
+                        f"   │  👤 {assignee} | ⏱️ {issue.estimate or 'No'}h | Status: {issue.state_name}\n"
+                    )
+                    # Properly indent description within the box
+                    buf.writelines([f"   │  📝 {desc_line}\n" for desc_line in desc_lines_by_issue.get(issue.id, ())])
+                    write("   └─────────────────────────────────────────────\n\n")  # Extra spacing between issues
             else:
-                sections.append(f"   📋 No active issues")
+                write("   📋 No active issues\n")
             
-            sections.append("")
+            write("\n")
     
     # ============================================================================
     # TEAM WORKLOAD SECTION
     # ============================================================================
-    sections.append("👥 TEAM WORKLOAD:")
-    
-    # Group active issues by assignee
-    assignee_workload = {}
-    active_issues_list = [iss for iss in linear_context.issues if iss.state_type != 'completed']
-    
-    for issue in active_issues_list:
-        assignee = issue.assignee_name or "Unassigned"
-        if assignee not in assignee_workload:
-            assignee_workload[assignee] = []
-        assignee_workload[assignee].append(issue)
+    write("👥 TEAM WORKLOAD:\n")
     
     if not assignee_workload:
-        sections.append("• No active issues assigned")
+        write("• No active issues assigned\n")
     else:
-        for assignee, issues in sorted(assignee_workload.items(), key=lambda x: len(x[1]), reverse=True):
+        # Stable sort on the precomputed counts keeps ties in first-seen order, as before
+        workload_counts = {assignee: len(issues) for assignee, issues in assignee_workload.items()}
+        for assignee in sorted(workload_counts, key=workload_counts.__getitem__, reverse=True):
+            issues = assignee_workload[assignee]
             total_estimate = sum(iss.estimate or 0 for iss in issues)
-            high_priority = len([iss for iss in issues if iss.priority == 1])
+            high_priority = sum(1 for iss in issues if iss.priority == 1)
             
-            sections.append(f"👤 {assignee}: {len(issues)} issues | {total_estimate}h total | {high_priority} high priority")
+            write(f"👤 {assignee}: {len(issues)} issues | {total_estimate}h total | {high_priority} high priority\n")
             
             # Show ALL issues for this person with clear separation
             for i, issue in enumerate(issues, 1):
-                priority_emoji = "🔴" if issue.priority == 1 else "🟡" if issue.priority == 2 else "🟢"
-                sections.append(f"   ├─ #{i}: {priority_emoji} {issue.title}")
-                if issue.description:
-                    # Properly indent description for team workload
-                    desc_lines = issue.description.split('\n')
-                    for desc_line in desc_lines:
-                        if desc_line.strip():
-                            sections.append(f"   │    📝 {desc_line.strip()}")
-                sections.append(f"   │")  # Spacing between issues
-    
-    sections.append("")
+                priority_emoji = PRIORITY_EMOJI.get(issue.priority, "🟢")
+                write(f"   ├─ #{i}: {priority_emoji} {issue.title}\n")
+                # Properly indent description for team workload
+                buf.writelines([f"   │    📝 {desc_line}\n" for desc_line in desc_lines_by_issue.get(issue.id, ())])
+                write("   │\n")  # Spacing between issues
+    
+    write("\n")
     
     # ============================================================================
     # UPCOMING MILESTONES
     # ============================================================================
     if linear_context.milestones:
-        sections.append("🎯 UPCOMING MILESTONES:")
+        write("🎯 UPCOMING MILESTONES:\n")
         
         # Sort by target date
         sorted_milestones = sorted(
             [m for m in linear_context.milestones if m.target_date], 
-            key=lambda m: m.target_date
+            key=attrgetter('target_date')
         )
         
         for milestone in sorted_milestones:
-            milestone_issues = [iss for iss in linear_context.issues if iss.milestone_id == milestone.id and iss.state_type != 'completed']
-            sections.append(f"📍 {milestone.name} (Target: {milestone.target_date})")
-            sections.append(f"   🚀 Project: {milestone.project_name}")
+            milestone_active_count = active_count_by_milestone.get(milestone.id, 0)
+            write(
+                f"📍 {milestone.name} (Target: {milestone.target_date})\n"
+                f"   🚀 Project: {milestone.project_name}\n"
+            )
             if milestone.description:
-                sections.append(f"   📝 {milestone.description}")
-            sections.append(f"   📋 Active Issues: {len(milestone_issues)}")
+                write(f"   📝 {milestone.description}\n")
+            write(f"   📋 Active Issues: {milestone_active_count}\n")
         
-        sections.append("")
+        write("\n")
     
-    sections.append("=" * 50)
+    write(SECTION_RULE)
     
-    return "\n".join(sections)
+    return buf.getvalue()
 
 class SlackCommandHandler:
     """
@@ -185,9 +412,31 @@ class SlackCommandHandler:
     - This prevents accidental writes to the production Linear workspace.
     """
     
+    # Static replies are built once and shared; nothing downstream mutates a returned response
+    _ERR_CHAT_NO_TEXT = _ephemeral("Please provide a question or message to chat about.\n\n💡 **Tips**:\n• `/chat select` - Choose specific transcripts\n• `/chat with [question]` - Choose transcripts for your question\n• `/chat [question]` - Use all recent context")
+    _ERR_CHAT_WITH_NO_TEXT = _ephemeral("Please provide your question.\n\n💡 **Usage**: `/chat-with What budget decisions were made?`")
+    _ERR_NO_TRANSCRIPTS = _ephemeral("📭 No transcripts available for selection.")
+    _ERR_SELECTED_TRANSCRIPTS_MISSING = _ephemeral("❌ Could not retrieve selected transcripts.")
+    _ERR_CREATE_NO_TEXT = _ephemeral("Please describe what you want to create in Linear.")
+    _ERR_NO_PENDING_TICKETS = _ephemeral("❌ **No pending ticket creation found.** Please use `/create` again to generate new tickets.")
+    _MSG_TICKETS_CANCELLED = _ephemeral("✅ **Ticket creation cancelled.** No tickets were created in Linear.")
+    _ERR_UPDATE_NO_TEXT = _ephemeral("Please describe what you want to update in Linear.\n\nExamples:\n• `/update ticket ABC-123 to in progress`\n• `/update ABC-123: change title to 'New Task Name'`\n• `/update mark ticket XYZ-456 as completed`")
+    _ERR_UPDATE_UNPARSEABLE = _ephemeral("❌ **Unable to parse update request.** Please be more specific about which ticket to update and what changes to make.")
+    _ERR_TEAMMEMBER_NO_TEXT = _ephemeral("Please specify a team member name or @username.")
+    _ERR_NO_RECENT_MEETINGS = _ephemeral("📭 No recent meetings found.")
+    _ERR_NO_MEETING_CONTENT = _ephemeral("📭 No transcript content found for recent meeting.")
+    _ERR_CLIENT_NO_NAME = _ephemeral("Please specify a client name: `/summarize client [client_name]`")
+    _ERR_RESPONSE_TIMEOUT = _ephemeral("⚠️ Response took longer than expected. The operation may still be processing.")
+    
     def __init__(self):
         """Initialize all required services."""
-        self.slack_service = SlackService()
+        # One pooled async HTTP client (HTTP/2, keep-alive) shared by every outbound Slack webhook post
+        self._http = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=64)
+        )
+        self.slack_service = SlackService(http_client=self._http)
         self.ai_service = OpenAIService(
             api_key=Config.OPENAI_API_KEY,
             model=Config.OPENAI_MODEL,
@@ -200,61 +449,165 @@ class SlackCommandHandler:
         )
         self.notion_service = NotionService()
         self.supabase_service = SupabaseService()
-        self.prompts = load_prompts(Config.PROMPTS_FILE)
-    
-    def _store_user_selection(self, user_id: str, transcript_ids: List[str]) -> None:
-        """Store user's transcript selection with timestamp."""
-        USER_TRANSCRIPT_SELECTIONS[user_id] = {
-            'transcript_ids': transcript_ids,
-            'timestamp': datetime.now()
+        self.prompts = _cached_prompts()
+        # Resolve every prompt config up front so a missing/broken entry fails at startup, not on first use
+        missing = [
+            name for name in REQUIRED_PROMPTS
+            if not isinstance(self.prompts.get(name), dict)
+            or 'system_prompt' not in self.prompts[name]
+            or 'user_prompt' not in self.prompts[name]
+        ]
+        if missing:
+            raise ValueError(f"Missing prompt configuration in {Config.PROMPTS_FILE}: {', '.join(missing)}")
+        self._p_chat = self.prompts['slack_bot_chat']
+        self._p_create = self.prompts['slack_bot_create_tickets']
+        self._p_create_structured = self.prompts['slack_bot_create_tickets_structured']
+        self._p_update = self.prompts['slack_bot_update_tickets']
+        self._p_teammember = self.prompts['slack_bot_teammember']
+        self._p_weekly = self.prompts['slack_bot_weekly_summary']
+        self._p_meeting = self.prompts['slack_bot_summarize_meeting']
+        self._p_client = self.prompts['slack_bot_client_status']
+        # user_prompt renderers keyed by prompt name, parsed once instead of per request
+        self._templates: Dict[str, Callable[..., str]] = {
+            name: _compile_prompt_template(config['user_prompt'])
+            for name, config in self.prompts.items()
+            if isinstance(config, dict) and 'user_prompt' in config
+        }
+        # Slash command -> handler; /create is an alias of /create-ticket
+        self._routes: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "/chat": self._handle_chat_command,
+            "/summarize": self._handle_summarize_command,
+            "/create-ticket": self._handle_create_ticket_command,
+            "/create": self._handle_create_ticket_command,
+            "/update": self._handle_update_ticket_command,
+            "/teammember": self._handle_teammember_command,
+            "/weekly-summary": self._handle_weekly_summary_command,
         }
+        # Short-lived cache of the comprehensive context:
+        # (context body, wall-clock fetch time for the footer, monotonic fetch time for the TTL)
+        self._context_cache: Optional[Tuple[str, datetime, float]] = None
+        self._context_lock = asyncio.Lock()
+        self._context_cache_hits = 0
+        self._context_cache_misses = 0
+        self._context_refresh_task: Optional[asyncio.Task] = None
+        # Bumped on invalidation so a build that started before a Linear write isn't cached
+        self._context_generation = 0
+        # Inputs of the last full build (transcript lines, Linear context or its fetch error), so
+        # /teammember can narrow the Linear section of the cached context without fetching again
+        self._context_sections: Optional[Tuple[List[str], Any]] = None
+        # Formatted Linear section for the LinearContext object it was built from; LinearService
+        # hands back the same object while its cache is valid, so identity marks a cache generation
+        self._linear_formatted: Optional[Tuple[LinearContext, str]] = None
+        # Outgoing response_url posts; queue and workers are created on first use inside the running loop
+        self._response_queue: Optional[asyncio.Queue] = None
+        self._response_workers: List[asyncio.Task] = []
+        # Incoming slash commands, likewise created on first use
+        self._command_queue: Optional[asyncio.Queue] = None
+        self._command_workers: List[asyncio.Task] = []
     
-    def _get_user_selection(self, user_id: str) -> Optional[List[str]]:
-        """Get user's stored transcript selection if still valid."""
-        if user_id not in USER_TRANSCRIPT_SELECTIONS:
-            return None
+    async def aclose(self) -> None:
+        """Stop the command workers, flush queued Slack responses, then close the pooled HTTP clients."""
+        if self._command_queue is not None and self._command_queue.qsize():
+            logger.warning("Shutting down with %d slash commands unprocessed", self._command_queue.qsize())
+        for worker in self._command_workers:
+            worker.cancel()
+        await asyncio.gather(*self._command_workers, return_exceptions=True)
+        self._command_workers = []
+        if self._response_queue is not None and any(not worker.done() for worker in self._response_workers):
+            try:
+                await asyncio.wait_for(self._response_queue.join(), timeout=RESPONSE_DRAIN_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                logger.warning("Shutting down with %d Slack responses undelivered", self._response_queue.qsize())
+        for worker in self._response_workers:
+            worker.cancel()
+        await asyncio.gather(*self._response_workers, return_exceptions=True)
+        self._response_workers = []
+        await self._http.aclose()
+        self.ai_service.close()
+
+    async def warm_up(self) -> None:
+        """
+        Pre-populate the context cache and prime OpenAI's prompt-prefix cache.
+        
+        Issues a one-token completion per prompt config with the real system prompt and
+        context so the first user-facing command doesn't pay the cold prefill.
+        """
+        try:
+            context = await self._get_comprehensive_context()
+        except Exception as e:
+            logger.warning("Warmup: context prefetch failed: %s", e)
+            return
         
-        selection_data = USER_TRANSCRIPT_SELECTIONS[user_id]
-        timestamp = selection_data['timestamp']
+        if not Config.OPENAI_API_KEY:
+            return
         
-        # Check if selection has expired
-        if datetime.now() - timestamp > timedelta(minutes=SELECTION_TIMEOUT_MINUTES):
-            del USER_TRANSCRIPT_SELECTIONS[user_id]
-            return None
+        async def _prime(name: str) -> None:
+            prompt_config = self.prompts.get(name)
+            if not prompt_config:
+                return
+            # Only the leading context matters for the cached prefix; leave other fields blank
+            user_prompt = prompt_config['user_prompt'].format_map(collections.defaultdict(str, context=context))
+            try:
+                await self.ai_service.generate_text_async(
+                    prompt_config['system_prompt'], user_prompt, cache_key=name, max_tokens=1
+                )
+            except Exception as e:
+                logger.warning("Warmup: priming %s failed: %s", name, e)
         
-        return selection_data['transcript_ids']
+        await asyncio.gather(*(_prime(name) for name in WARMUP_PROMPT_NAMES))
+        logger.info("Warmup complete: context cached and prompt prefixes primed")
+    
+    def _store_user_selection(self, user_id: str, transcript_ids: List[str]) -> None:
+        """Store user's transcript selection; it expires after SELECTION_TIMEOUT_MINUTES."""
+        USER_TRANSCRIPT_SELECTIONS[user_id] = transcript_ids
+    
+    def _get_user_selection(self, user_id: str) -> Optional[List[str]]:
+        """Get user's stored transcript selection if still valid."""
+        return USER_TRANSCRIPT_SELECTIONS.get(user_id)
     
     def _clear_user_selection(self, user_id: str) -> None:
         """Clear user's transcript selection."""
-        if user_id in USER_TRANSCRIPT_SELECTIONS:
-            del USER_TRANSCRIPT_SELECTIONS[user_id]
+        USER_TRANSCRIPT_SELECTIONS.pop(user_id, None)
+    
+    def submit_command(self, payload: Dict[str, Any]) -> bool:
+        """Queue a slash command for the command workers; False if the queue is full."""
+        self._ensure_command_workers()
+        try:
+            self._command_queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            return False
+        return True
+    
+    def _ensure_command_workers(self) -> None:
+        """Start the command workers (and their queue) in the running loop if they aren't alive."""
+        if self._command_workers and not all(worker.done() for worker in self._command_workers):
+            return
+        self._command_queue = asyncio.Queue(maxsize=COMMAND_QUEUE_MAX_SIZE)
+        self._command_workers = [
+            asyncio.create_task(self._command_worker()) for _ in range(COMMAND_WORKERS)
+        ]
+    
+    async def _command_worker(self) -> None:
+        """Run queued slash commands until cancelled."""
+        queue = self._command_queue
+        while True:
+            payload = await queue.get()
+            try:
+                await self.handle_command(payload)
+            except Exception:
+                logger.exception("Error processing slash command")
+            finally:
+                queue.task_done()
     
     async def handle_command(self, payload: Dict[str, Any]) -> None:
         """Route command to appropriate handler."""
         command = payload.get("command", "")
         response_url = payload.get("response_url", "")
         
-        logger.info(f"BACKGROUND TASK: Starting to process command: {command}")
-        print(f"=== BACKGROUND TASK: Starting to process command: {command} ===", flush=True)
+        logger.info("BACKGROUND TASK: Starting to process command: %s", command)
         
         try:
-            if command == "/chat":
-                response = await self._handle_chat_command(payload)
-            elif command == "/summarize":
-                response = await self._handle_summarize_command(payload)
-            elif command == "/create-ticket" or command == "/create":
-                response = await self._handle_create_ticket_command(payload)
-            elif command == "/update":
-                response = await self._handle_update_ticket_command(payload)
-            elif command == "/teammember":
-                response = await self._handle_teammember_command(payload)
-            elif command == "/weekly-summary":
-                response = await self._handle_weekly_summary_command(payload)
-            else:
-                response = {
-                    "response_type": "ephemeral",
-                    "text": f"Unknown command: {command}"
-                }
+            response = await self._routes.get(command, self._handle_unknown_command)(payload)
             
             # Convert string responses to proper Slack format
             if isinstance(response, str):
@@ -263,56 +616,43 @@ class SlackCommandHandler:
                     "text": response
                 }
             
-            logger.info(f"BACKGROUND TASK: About to send response to {response_url}")
-            print(f"=== BACKGROUND TASK: About to send response to Slack ===", flush=True)
+            logger.debug("BACKGROUND TASK: About to send response to %s", response_url)
             await self._send_response(response_url, response)
-            logger.info(f"BACKGROUND TASK: Response sent successfully")
-            print(f"=== BACKGROUND TASK: Response sent successfully ===", flush=True)
+            logger.info("BACKGROUND TASK: Response queued for delivery")
             
         except Exception as e:
-            logger.error(f"BACKGROUND TASK ERROR: {type(e).__name__}: {str(e)}")
-            print(f"=== BACKGROUND TASK ERROR: {type(e).__name__}: {str(e)} ===", flush=True)
-            print(f"=== BACKGROUND TASK TRACEBACK: {traceback.format_exc()} ===", flush=True)
-            error_response = {
-                "response_type": "ephemeral",
-                "text": f"❌ Error processing {command}: {str(e)}"
-            }
-            await self._send_response(response_url, error_response)
+            logger.error("BACKGROUND TASK ERROR: %s: %s", type(e).__name__, e)
+            # Only pay for formatting the stack when debug logging is on
+            logger.debug("BACKGROUND TASK TRACEBACK", exc_info=True)
+            await self._send_response(response_url, _ephemeral(f"❌ Error processing {command}: {str(e)}"))
+    
+    async def _handle_unknown_command(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Reply for slash commands that have no route."""
+        return _ephemeral(f"Unknown command: {payload.get('command', '')}")
     
     async def handle_command_sync(self, payload: Dict[str, Any]) -> str:
         """SYNCHRONOUS version - returns AI response text directly (for testing)."""
         command = payload.get("command", "")
         
-        print(f"=== SYNC HANDLER: Processing {command} ===", flush=True)
+        logger.info("SYNC HANDLER: Processing %s", command)
         
         try:
-            if command == "/chat":
-                response = await self._handle_chat_command(payload)
-
-            elif command == "/summarize":
-                response = await self._handle_summarize_command(payload)
-            elif command == "/create-ticket" or command == "/create":
-                response = await self._handle_create_ticket_command(payload)
-            elif command == "/update":
-                response = await self._handle_update_ticket_command(payload)
-            elif command == "/teammember":
-                response = await self._handle_teammember_command(payload)
-            elif command == "/weekly-summary":
-                response = await self._handle_weekly_summary_command(payload)
-            else:
+            handler = self._routes.get(command)
+            if handler is None:
                 return f"Unknown command: {command}"
+            response = await handler(payload)
             
             # Extract just the text from the response
             if isinstance(response, str):
                 response_text = response
             else:
                 response_text = response.get("text", "No response text")
-            print(f"=== SYNC HANDLER: Generated response: {response_text[:100]}... ===", flush=True)
+            logger.debug("SYNC HANDLER: Generated response: %.100s...", response_text)
             return response_text
             
         except Exception as e:
-            print(f"=== SYNC HANDLER ERROR: {str(e)} ===", flush=True)
-            print(f"=== SYNC HANDLER TRACEBACK: {traceback.format_exc()} ===", flush=True)
+            logger.error("SYNC HANDLER ERROR: %s: %s", type(e).__name__, e)
+            logger.debug("SYNC HANDLER TRACEBACK", exc_info=True)
             return f"❌ Error processing {command}: {str(e)}"
     
     async def _handle_chat_command(self, payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -333,62 +673,48 @@ class SlackCommandHandler:
                 return await self._show_transcript_selector_for_chat(channel_id, user_id)
         
         if not text:
-            return {
-                "response_type": "ephemeral",
-                "text": "Please provide a question or message to chat about.\n\n💡 **Tips**:\n• `/chat select` - Choose specific transcripts\n• `/chat with [question]` - Choose transcripts for your question\n• `/chat [question]` - Use all recent context"
-            }
+            return self._ERR_CHAT_NO_TEXT
         
         # Check if user has selected specific transcripts
         selected_transcript_ids = self._get_user_selection(user_id)
         
         if selected_transcript_ids:
             # Use selected transcripts and clear the selection
-            print(f"=== CHAT: Using {len(selected_transcript_ids)} selected transcripts for user {user_id} ===", flush=True)
+            logger.info("CHAT: Using %s selected transcripts for user %s", len(selected_transcript_ids), user_id)
             self._clear_user_selection(user_id)  # Clear after use
             return await self._handle_chat_with_selected_transcripts(selected_transcript_ids, text)
         
-        # Get context and recent Slack history (default behavior)
+        # Get context (Supabase and Linear run on worker threads); the Slack history is a local placeholder
         context = await self._get_comprehensive_context()
         slack_history = self._get_recent_slack_history(channel_id, user_id)
         
         # Use prompts.yml
-        prompt_config = self.prompts.get('slack_bot_chat')
-        if not prompt_config:
-            return {
-                "response_type": "ephemeral",
-                "text": "❌ Chat prompt configuration not found."
-            }
+        prompt_config = self._p_chat
         
         system_prompt = prompt_config['system_prompt']
-        user_prompt = prompt_config['user_prompt'].format(
+        user_prompt = self._templates['slack_bot_chat'](
             context=f"{context}\n\nRecent Slack History:\n{slack_history}",
             user_message=text
         )
         
         try:
             # Use the async text generation method for chat responses
-            print(f"=== CHAT: About to call AI service with model: {self.ai_service.model} ===", flush=True)
-            print(f"=== CHAT: AI service client type: {type(self.ai_service.client)} ===", flush=True)
-            print(f"=== CHAT: System prompt length: {len(system_prompt)} ===", flush=True)
-            print(f"=== CHAT: User prompt length: {len(user_prompt)} ===", flush=True)
+            logger.debug("CHAT: About to call AI service with model: %s", self.ai_service.model)
+            logger.debug("CHAT: AI service client type: %s", type(self.ai_service.client))
+            logger.debug("CHAT: System prompt length: %s", len(system_prompt))
+            logger.debug("CHAT: User prompt length: %s", len(user_prompt))
             
             # Call AI service to generate response
-            response_text = await self.ai_service.generate_text_async(system_prompt, user_prompt)
+            response_text = await self.ai_service.generate_text_async(system_prompt, user_prompt, cache_key='slack_bot_chat')
             
-            print(f"=== CHAT: AI service returned response of length: {len(response_text)} ===", flush=True)
-            print(f"=== CHAT: AI RESPONSE CONTENT: {response_text} ===", flush=True)
+            logger.info("CHAT: AI service returned response of length: %s", len(response_text))
+            logger.debug("CHAT: AI RESPONSE CONTENT: %s", response_text)
             
-            return {
-                "response_type": "ephemeral",
-                "text": f"🤖 **AI Response:**\n{response_text}"
-            }
+            return _ephemeral(f"🤖 **AI Response:**\n{response_text}")
             
         except Exception as e:
-            print(f"=== CHAT ERROR: {str(e)} ===", flush=True)
-            return {
-                "response_type": "ephemeral",
-                "text": f"❌ Error generating response: {str(e)}"
-            }
+            logger.error("CHAT ERROR: %s", e)
+            return _ephemeral(f"❌ Error generating response: {str(e)}")
 
     async def _handle_chat_with_selector(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle /chat-with command - shows transcript selector with user's question."""
@@ -397,20 +723,14 @@ class SlackCommandHandler:
         user_id = payload.get("user_id", "")
         
         if not text:
-            return {
-                "response_type": "ephemeral",
-                "text": "Please provide your question.\n\n💡 **Usage**: `/chat-with What budget decisions were made?`"
-            }
+            return self._ERR_CHAT_WITH_NO_TEXT
         
         try:
             # Get recent transcripts for selection
-            transcripts = self.supabase_service.get_recent_transcripts(limit=10)
+            transcripts = self.supabase_service.get_recent_transcripts(limit=10, columns=TRANSCRIPT_LIST_COLUMNS)
             
             if not transcripts:
-                return {
-                    "response_type": "ephemeral",
-                    "text": "📭 No transcripts available for selection."
-                }
+                return self._ERR_NO_TRANSCRIPTS
             
             # Build options for the dropdown
             options = []
@@ -420,14 +740,7 @@ class SlackCommandHandler:
                 transcript_id = transcript.get('id', '')
                 
                 # Format date for display
-                try:
-                    if created_date and created_date != 'Unknown date':
-                        date_obj = datetime.fromisoformat(created_date.replace('Z', '+00:00'))
-                        formatted_date = date_obj.strftime('%m/%d %H:%M')
-                    else:
-                        formatted_date = 'Unknown date'
-                except:
-                    formatted_date = str(created_date)[:10] if created_date else 'Unknown date'
+                formatted_date = _format_created_date(created_date, '%m/%d %H:%M')
                 
                 # Create option for dropdown
                 option_text = f"{filename} ({formatted_date})"
@@ -505,22 +818,16 @@ class SlackCommandHandler:
             }
             
         except Exception as e:
-            return {
-                "response_type": "ephemeral",
-                "text": f"❌ Error showing transcript selector: {str(e)}"
-            }
+            return _ephemeral(f"❌ Error showing transcript selector: {str(e)}")
 
     async def _handle_chat_with_selector_inline(self, payload: Dict[str, Any], question: str) -> Dict[str, Any]:
         """Handle inline /chat with [question] - shows selector with the question embedded."""
         try:
             # Get recent transcripts for selection
-            transcripts = self.supabase_service.get_recent_transcripts(limit=10)
+            transcripts = self.supabase_service.get_recent_transcripts(limit=10, columns=TRANSCRIPT_LIST_COLUMNS)
             
             if not transcripts:
-                return {
-                    "response_type": "ephemeral",
-                    "text": "📭 No transcripts available for selection."
-                }
+                return self._ERR_NO_TRANSCRIPTS
             
             # Build options for the dropdown
             options = []
@@ -530,14 +837,7 @@ class SlackCommandHandler:
                 transcript_id = transcript.get('id', '')
                 
                 # Format date for display
-                try:
-                    if created_date and created_date != 'Unknown date':
-                        date_obj = datetime.fromisoformat(created_date.replace('Z', '+00:00'))
-                        formatted_date = date_obj.strftime('%m/%d %H:%M')
-                    else:
-                        formatted_date = 'Unknown date'
-                except:
-                    formatted_date = str(created_date)[:10] if created_date else 'Unknown date'
+                formatted_date = _format_created_date(created_date, '%m/%d %H:%M')
                 
                 # Create option for dropdown
                 option_text = f"{filename} ({formatted_date})"
@@ -615,22 +915,16 @@ class SlackCommandHandler:
             }
             
         except Exception as e:
-            return {
-                "response_type": "ephemeral",
-                "text": f"❌ Error showing transcript selector: {str(e)}"
-            }
+            return _ephemeral(f"❌ Error showing transcript selector: {str(e)}")
 
     async def _show_transcript_selector_for_chat(self, channel_id: str, user_id: str) -> Dict[str, Any]:
         """Show transcript selector for /chat select (without a predefined question)."""
         try:
             # Get recent transcripts for selection
-            transcripts = self.supabase_service.get_recent_transcripts(limit=10)
+            transcripts = self.supabase_service.get_recent_transcripts(limit=10, columns=TRANSCRIPT_LIST_COLUMNS)
             
             if not transcripts:
-                return {
-                    "response_type": "ephemeral",
-                    "text": "📭 No transcripts available for selection."
-                }
+                return self._ERR_NO_TRANSCRIPTS
             
             # Build options for the dropdown
             options = []
@@ -640,14 +934,7 @@ class SlackCommandHandler:
                 transcript_id = transcript.get('id', '')
                 
                 # Format date for display
-                try:
-                    if created_date and created_date != 'Unknown date':
-                        date_obj = datetime.fromisoformat(created_date.replace('Z', '+00:00'))
-                        formatted_date = date_obj.strftime('%m/%d %H:%M')
-                    else:
-                        formatted_date = 'Unknown date'
-                except:
-                    formatted_date = str(created_date)[:10] if created_date else 'Unknown date'
+                formatted_date = _format_created_date(created_date, '%m/%d %H:%M')
                 
                 # Create option for dropdown
                 option_text = f"{filename} ({formatted_date})"
@@ -708,22 +995,16 @@ class SlackCommandHandler:
             }
             
         except Exception as e:
-            return {
-                "response_type": "ephemeral",
-                "text": f"❌ Error showing transcript selector: {str(e)}"
-            }
+            return _ephemeral(f"❌ Error showing transcript selector: {str(e)}")
 
     async def _show_transcript_selector(self, channel_id: str, user_id: str) -> Dict[str, Any]:
         """Show interactive transcript selection dropdown."""
         try:
             # Get recent transcripts for selection
-            transcripts = self.supabase_service.get_recent_transcripts(limit=10)
+            transcripts = self.supabase_service.get_recent_transcripts(limit=10, columns=TRANSCRIPT_LIST_COLUMNS)
             
             if not transcripts:
-                return {
-                    "response_type": "ephemeral",
-                    "text": "📭 No transcripts available for selection."
-                }
+                return self._ERR_NO_TRANSCRIPTS
             
             # Build options for the dropdown
             options = []
@@ -733,14 +1014,7 @@ class SlackCommandHandler:
                 transcript_id = transcript.get('id', '')
                 
                 # Format date for display
-                try:
-                    if created_date and created_date != 'Unknown date':
-                        date_obj = datetime.fromisoformat(created_date.replace('Z', '+00:00'))
-                        formatted_date = date_obj.strftime('%m/%d %H:%M')
-                    else:
-                        formatted_date = 'Unknown date'
-                except:
-                    formatted_date = str(created_date)[:10] if created_date else 'Unknown date'
+                formatted_date = _format_created_date(created_date, '%m/%d %H:%M')
                 
                 # Create option for dropdown
                 option_text = f"{filename} ({formatted_date})"
@@ -818,41 +1092,41 @@ class SlackCommandHandler:
             }
             
         except Exception as e:
-            return {
-                "response_type": "ephemeral",
-                "text": f"❌ Error showing transcript selector: {str(e)}"
-            }
+            return _ephemeral(f"❌ Error showing transcript selector: {str(e)}")
 
     async def _handle_chat_with_selected_transcripts(self, transcript_ids: List[str], user_question: str) -> Dict[str, Any]:
         """Handle chat command with user-selected transcripts."""
+        # Nothing selected (or an expired selection) can't produce context, so skip all I/O
+        transcript_ids = list(dict.fromkeys(tid for tid in transcript_ids if tid))
+        if not transcript_ids:
+            return self._ERR_SELECTED_TRANSCRIPTS_MISSING
+        
         try:
-            print(f"=== SELECTED TRANSCRIPTS: Processing {len(transcript_ids)} transcript(s) ===", flush=True)
-            start_time = datetime.now()
-            
-            # Get selected transcripts
-            selected_transcripts = []
-            for transcript_id in transcript_ids:
-                transcript = self.supabase_service.get_transcript_by_id(transcript_id)
-                if transcript:
-                    selected_transcripts.append(transcript)
+            logger.info("SELECTED TRANSCRIPTS: Processing %s transcript(s)", len(transcript_ids))
+            start_time = time.perf_counter()
+            
+            # Fetch every selected transcript and the Linear workspace concurrently on worker threads
+            *transcripts, linear_context = await asyncio.gather(
+                *(asyncio.to_thread(self.supabase_service.get_transcript_by_id, transcript_id) for transcript_id in transcript_ids),
+                asyncio.to_thread(self.linear_service.get_workspace_context),
+                return_exceptions=True
+            )
+            selected_transcripts = [t for t in transcripts if t and not isinstance(t, Exception)]
             
-            fetch_time = datetime.now()
-            print(f"=== SELECTED TRANSCRIPTS: Fetched in {(fetch_time - start_time).total_seconds():.2f}s ===", flush=True)
+            fetch_time = time.perf_counter()
+            logger.info("SELECTED TRANSCRIPTS: Fetched in %.2fs", fetch_time - start_time)
             
             if not selected_transcripts:
-                return {
-                    "response_type": "ephemeral",
-                    "text": "❌ Could not retrieve selected transcripts."
-                }
+                return self._ERR_SELECTED_TRANSCRIPTS_MISSING
             
             # Build custom context with selected transcripts
-            context_parts = []
-            
             # Selected transcripts context (FULL CONTENT)
-            context_parts.append("📋 SELECTED MEETING TRANSCRIPTS (COMPLETE CONTENT):")
-            context_parts.append("=" * 60)
-            context_parts.append(f"NOTE: You have access to ONLY these {len(selected_transcripts)} selected transcript(s). Do NOT reference any other meetings or transcripts.")
-            context_parts.append("=" * 60)
+            context_parts = [
+                "📋 SELECTED MEETING TRANSCRIPTS (COMPLETE CONTENT):",
+                SELECTED_TRANSCRIPTS_RULE,
+                f"NOTE: You have access to ONLY these {len(selected_transcripts)} selected transcript(s). Do NOT reference any other meetings or transcripts.",
+                SELECTED_TRANSCRIPTS_RULE,
+            ]
             
             for i, transcript in enumerate(selected_transcripts, 1):
                 filename = transcript.get('filename', 'Unknown Meeting')
@@ -860,77 +1134,56 @@ class SlackCommandHandler:
                 transcript_content = transcript.get('filtered_transcript', '')
                 
                 # Format date
-                try:
-                    if created_date and created_date != 'Unknown date':
-                        date_obj = datetime.fromisoformat(created_date.replace('Z', '+00:00'))
-                        formatted_date = date_obj.strftime('%Y-%m-%d %H:%M')
-                    else:
-                        formatted_date = 'Unknown date'
-                except:
-                    formatted_date = str(created_date)[:10] if created_date else 'Unknown date'
-                
-                context_parts.append(f"📄 TRANSCRIPT #{i}: {filename}")
-                context_parts.append(f"📅 Date: {formatted_date}")
-                context_parts.append("-" * 40)
+                formatted_date = _format_created_date(created_date, '%Y-%m-%d %H:%M')
                 
                 # Include COMPLETE transcript content (no truncation)
-                if transcript_content:
-                    context_parts.append(transcript_content.strip())
-                else:
-                    context_parts.append("No content available")
-                
-                context_parts.append("-" * 40)
-                context_parts.append("")
+                context_parts.extend([
+                    f"📄 TRANSCRIPT #{i}: {filename}",
+                    f"📅 Date: {formatted_date}",
+                    TRANSCRIPT_RULE,
+                    transcript_content.strip() if transcript_content else "No content available",
+                    TRANSCRIPT_RULE,
+                    "",
+                ])
             
             # Add Linear context
             try:
-                linear_context = self.linear_service.get_workspace_context()
+                if isinstance(linear_context, Exception):
+                    raise linear_context
                 linear_formatted = format_linear_context_comprehensive(linear_context)
                 context_parts.append(linear_formatted)
             except Exception as e:
                 context_parts.append(f"🎯 LINEAR: unavailable ({str(e)[:50]})")
             
-            context_parts.append(f"🕐 Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+            context_parts.append(_context_footer())
             
             custom_context = "\n".join(context_parts)
-            context_time = datetime.now()
-            print(f"=== SELECTED TRANSCRIPTS: Context built in {(context_time - fetch_time).total_seconds():.2f}s ===", flush=True)
+            context_time = time.perf_counter()
+            logger.info("SELECTED TRANSCRIPTS: Context built in %.2fs", context_time - fetch_time)
             
             # Generate AI response with custom context
-            prompt_config = self.prompts.get('slack_bot_chat')
-            if not prompt_config:
-                return {
-                    "response_type": "ephemeral",
-                    "text": "❌ Chat prompt configuration not found."
-                }
+            prompt_config = self._p_chat
             
             system_prompt = prompt_config['system_prompt']
-            user_prompt = prompt_config['user_prompt'].format(
+            user_prompt = self._templates['slack_bot_chat'](
                 context=custom_context,
                 user_message=user_question
             )
             
-            print(f"=== SELECTED TRANSCRIPTS: Calling AI with context size: {len(custom_context)} chars ===", flush=True)
-            response_text = await self.ai_service.generate_text_async(system_prompt, user_prompt)
-            ai_time = datetime.now()
-            print(f"=== SELECTED TRANSCRIPTS: AI response in {(ai_time - context_time).total_seconds():.2f}s ===", flush=True)
+            logger.info("SELECTED TRANSCRIPTS: Calling AI with context size: %s chars", len(custom_context))
+            response_text = await self.ai_service.generate_text_async(system_prompt, user_prompt, cache_key='slack_bot_chat')
+            ai_time = time.perf_counter()
+            logger.info("SELECTED TRANSCRIPTS: AI response in %.2fs", ai_time - context_time)
             
             # Build transcript list for response header
             transcript_list = ", ".join([t.get('filename', 'Unknown') for t in selected_transcripts])
             
-            total_time = datetime.now()
-            print(f"=== SELECTED TRANSCRIPTS: Total processing time: {(total_time - start_time).total_seconds():.2f}s ===", flush=True)
+            logger.info("SELECTED TRANSCRIPTS: Total processing time: %.2fs", time.perf_counter() - start_time)
             
-            return {
-                "response_type": "ephemeral",
-                "text": f"🎯 **AI Response** (using ONLY {len(selected_transcripts)} selected transcript(s): {transcript_list}):\n\n{response_text}"
-            }
+            return _ephemeral(f"🎯 **AI Response** (using ONLY {len(selected_transcripts)} selected transcript(s): {transcript_list}):\n\n{response_text}")
             
         except Exception as e:
-            return {
-                "response_type": "ephemeral",
-                "text": f"❌ Error processing chat with selected transcripts: {str(e)}"
-            }
+            return _ephemeral(f"❌ Error processing chat with selected transcripts: {str(e)}")
     
     async def _handle_summarize_command(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle /summarize command using prompts.yml."""
@@ -961,60 +1214,45 @@ class SlackCommandHandler:
         user_id = payload.get("user_id")
         
         if not text:
-            return {
-                "response_type": "ephemeral",
-                "text": "Please describe what you want to create in Linear."
-            }
+            return self._ERR_CREATE_NO_TEXT
         
         # Add timing to identify bottlenecks
-        start_time = datetime.now()
-        print(f"=== CREATE TICKET TIMING: Starting at {start_time} ===")
+        logger.debug("Create ticket: starting")
+        start_time = time.perf_counter()
         
-        context_start = datetime.now()
         context = await self._get_comprehensive_context()
-        context_time = datetime.now()
-        print(f"=== CREATE TICKET TIMING: Context fetched in {(context_time - context_start).total_seconds():.2f}s ===")
+        context_time = time.perf_counter()
+        logger.info("Create ticket: context fetched in %.2fs", context_time - start_time)
         
-        prompt_config = self.prompts.get('slack_bot_create_tickets')
-        if not prompt_config:
-            return {
-                "response_type": "ephemeral",
-                "text": "❌ Create tickets prompt configuration not found."
-            }
+        prompt_config = self._p_create
         
         system_prompt = prompt_config['system_prompt']
-        user_prompt = prompt_config['user_prompt'].format(
-            context=context,
-            ticket_description=text
-        )
         
         try:
             # Use async text generation for create tickets analysis
-            ai_start = datetime.now()
-            print(f"=== CREATE TICKET TIMING: Starting AI call at {ai_start} ===")
+            ai_start = time.perf_counter()
+            logger.debug("Create ticket: starting AI call")
             
             # Truncate context to reduce OpenAI call time
             max_context_length = 8000  # Limit context to avoid slow API calls
             truncated_context = context[:max_context_length] + "..." if len(context) > max_context_length else context
             
-            truncated_user_prompt = prompt_config['user_prompt'].format(
+            truncated_user_prompt = self._templates['slack_bot_create_tickets'](
                 context=truncated_context,
                 ticket_description=text
             )
             
-            ai_response = await self.ai_service._call_openai_structured_async(system_prompt, truncated_user_prompt)
-            ai_end = datetime.now()
+            ai_response = await self.ai_service._call_openai_structured_async(system_prompt, truncated_user_prompt, cache_key='slack_bot_create_tickets')
             analysis = ai_response[0]
-            print(f"=== CREATE TICKET TIMING: AI completed in {(ai_end - ai_start).total_seconds():.2f}s ===")
-            print(f"=== CREATE TICKET TIMING: Analysis length: {len(analysis)} chars ===")
-            print(f"=== CREATE TICKET TIMING: Context length: {len(truncated_context)} chars ===")
+            logger.info("Create ticket: AI completed in %.2fs", time.perf_counter() - ai_start)
+            logger.debug("Create ticket: analysis length %d chars", len(analysis))
+            logger.debug("Create ticket: context length %d chars", len(truncated_context))
             
             # Store the pending ticket creation data
             ticket_data = {
                 "context": context,
                 "original_request": text,
                 "analysis": analysis,
-                "timestamp": datetime.now(),
                 "user_id": user_id
             }
             
@@ -1031,8 +1269,7 @@ class SlackCommandHandler:
             # Clean the analysis text for Slack markdown (escape problematic characters)
             cleaned_analysis = truncated_analysis.replace('*', '•').replace('`', "'")
             
-            total_time = datetime.now()
-            print(f"=== CREATE TICKET TIMING: Total time {(total_time - start_time).total_seconds():.2f}s ===")
+            logger.info("Create ticket: total time %.2fs", time.perf_counter() - start_time)
             
             # Prepare compact payload for interactive button value to avoid cross-instance state loss
             # Limit analysis to keep under Slack's 2000 char value limit
@@ -1041,7 +1278,8 @@ class SlackCommandHandler:
                 "original_request": text,
                 "analysis": (analysis[:1400] + "..." if len(analysis) > 1400 else analysis)
             }
-            compact_payload_str = json.dumps(compact_payload)
+            # Compact separators and raw UTF-8 (no \uXXXX escapes) leave more of the 2000 chars for content
+            compact_payload_str = dump_json_bytes(compact_payload).decode("utf-8")
 
             return {
                 "response_type": "ephemeral",
@@ -1083,77 +1321,51 @@ class SlackCommandHandler:
             }
                 
         except Exception as e:
-            return {
-                "response_type": "ephemeral", 
-                "text": f"❌ Error processing ticket creation: {str(e)}"
-            }
+            return _ephemeral(f"❌ Error processing ticket creation: {str(e)}")
 
     def _get_pending_tickets(self, user_id: str) -> Optional[Dict[str, Any]]:
-        """Get pending ticket creation data for a user, checking timeout."""
-        if user_id not in USER_PENDING_TICKETS:
-            return None
-        
-        ticket_data = USER_PENDING_TICKETS[user_id]
-        
-        # Check if the selection has expired
-        if datetime.now() - ticket_data["timestamp"] > timedelta(minutes=PENDING_TICKET_TIMEOUT_MINUTES):
-            del USER_PENDING_TICKETS[user_id]
-            return None
-        
-        return ticket_data
+        """Get pending ticket creation data for a user, if it hasn't expired."""
+        return USER_PENDING_TICKETS.get(user_id)
 
     def _clear_pending_tickets(self, user_id: str) -> None:
         """Clear pending ticket creation data for a user."""
-        if user_id in USER_PENDING_TICKETS:
-            del USER_PENDING_TICKETS[user_id]
+        USER_PENDING_TICKETS.pop(user_id, None)
 
     async def handle_create_tickets_confirmation(self, user_id: str, confirmed: bool) -> Dict[str, Any]:
         """Handle YES/NO confirmation for ticket creation."""
         ticket_data = self._get_pending_tickets(user_id)
         
         if not ticket_data:
-            return {
-                "response_type": "ephemeral",
-                "text": "❌ **No pending ticket creation found.** Please use `/create` again to generate new tickets."
-            }
+            return self._ERR_NO_PENDING_TICKETS
         
         # Clear the pending data
         self._clear_pending_tickets(user_id)
         
         if not confirmed:
-            return {
-                "response_type": "ephemeral",
-                "text": "✅ **Ticket creation cancelled.** No tickets were created in Linear."
-            }
+            return self._MSG_TICKETS_CANCELLED
         
         # User confirmed - create the tickets
         try:
             # Use the structured prompt to convert analysis to JSON
-            structured_prompt_config = self.prompts.get('slack_bot_create_tickets_structured')
-            if not structured_prompt_config:
-                return {
-                    "response_type": "ephemeral",
-                    "text": "❌ Structured tickets prompt configuration not found."
-                }
+            structured_prompt_config = self._p_create_structured
             
-            print(f"=== TICKET CREATION: Starting structured conversion ===")
-            conversion_start = datetime.now()
+            logger.debug("Ticket creation: starting structured conversion")
+            conversion_start = time.perf_counter()
             
             # Use minimal context for faster conversion
             system_prompt = structured_prompt_config['system_prompt']
-            user_prompt = structured_prompt_config['user_prompt'].format(
+            user_prompt = self._templates['slack_bot_create_tickets_structured'](
                 context="", # Empty context for faster processing
                 ticket_description=ticket_data["original_request"],
                 analysis=ticket_data["analysis"][:4000]  # Limit analysis length
             )
             
             # Get structured JSON response
-            structured_response = await self.ai_service._call_openai_structured_async(system_prompt, user_prompt)
-            conversion_end = datetime.now()
-            print(f"=== TICKET CREATION: Conversion completed in {(conversion_end - conversion_start).total_seconds():.2f}s ===")
+            structured_response = await self.ai_service._call_openai_structured_async(system_prompt, user_prompt, cache_key='slack_bot_create_tickets_structured')
+            logger.info("Ticket creation: conversion completed in %.2fs", time.perf_counter() - conversion_start)
             
             # Parse JSON tickets
-            tickets_json = json.loads(structured_response[0])
+            tickets_json = parse_json(structured_response[0])
             
             # Create tickets in Linear
             created_tickets = []
@@ -1187,6 +1399,8 @@ class SlackCommandHandler:
                     created_tickets.append(created_issue)
             
             if created_tickets:
+                # The cached workspace context no longer reflects Linear
+                self._invalidate_context_cache()
                 ticket_list = "\n".join([f"• **{t['title']}** (ID: {t['id']})" for t in created_tickets])
                 test_mode_note = " (TEST MODE)" if Config.LINEAR_TEST_MODE else ""
                 return {
@@ -1194,21 +1408,12 @@ class SlackCommandHandler:
                     "text": f"✅ **{len(created_tickets)} Ticket(s) Created in Linear{test_mode_note}:**\n\n{ticket_list}"
                 }
             else:
-                return {
-                    "response_type": "ephemeral",
-                    "text": f"❌ **Failed to create Linear tickets.** The analysis was:\n\n{ticket_data['analysis']}"
-                }
+                return _ephemeral(f"❌ **Failed to create Linear tickets.** The analysis was:\n\n{ticket_data['analysis']}")
                 
         except json.JSONDecodeError as e:
-            return {
-                "response_type": "ephemeral",
-                "text": f"❌ **Error:** Failed to parse ticket data. {str(e)}"
-            }
+            return _ephemeral(f"❌ **Error:** Failed to parse ticket data. {str(e)}")
         except Exception as e:
-            return {
-                "response_type": "ephemeral",
-                "text": f"❌ Error creating tickets: {str(e)}"
-            }
+            return _ephemeral(f"❌ Error creating tickets: {str(e)}")
     
     async def _handle_update_ticket_command(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -1220,132 +1425,107 @@ class SlackCommandHandler:
         text = payload.get("text", "").strip()
         
         if not text:
-            return {
-                "response_type": "ephemeral",
-                "text": "Please describe what you want to update in Linear.\n\nExamples:\n• `/update ticket ABC-123 to in progress`\n• `/update ABC-123: change title to 'New Task Name'`\n• `/update mark ticket XYZ-456 as completed`"
-            }
+            return self._ERR_UPDATE_NO_TEXT
         
         context = await self._get_comprehensive_context()
         
-        prompt_config = self.prompts.get('slack_bot_update_tickets')
-        if not prompt_config:
-            return {
-                "response_type": "ephemeral",
-                "text": "❌ Update tickets prompt configuration not found."
-            }
+        prompt_config = self._p_update
         
         system_prompt = prompt_config['system_prompt']
-        user_prompt = prompt_config['user_prompt'].format(
+        user_prompt = self._templates['slack_bot_update_tickets'](
             context=context,
             update_request=text
         )
         
         try:
             # Use async text generation for update tickets
-            ai_response = await self.ai_service._call_openai_structured_async(system_prompt, user_prompt)
+            ai_response = await self.ai_service._call_openai_structured_async(system_prompt, user_prompt, cache_key='slack_bot_update_tickets')
             
             # If not in test mode, return the analysis
             if not Config.LINEAR_TEST_MODE:
-                return {
-                    "response_type": "ephemeral",
-                    "text": f"📝 **Linear Ticket Update Analysis (Test Mode Disabled):**\n\n{ai_response[0]}"
-                }
+                return _ephemeral(f"📝 **Linear Ticket Update Analysis (Test Mode Disabled):**\n\n{ai_response[0]}")
             
             # In test mode, parse the AI response and update the ticket
-            update_data = json.loads(ai_response[0])
+            update_data = parse_json(ai_response[0])
             ticket_id = update_data.get('ticket_id')
             updates = update_data.get('updates', {})
             summary = update_data.get('summary', 'Ticket update')
             
             if not ticket_id or not updates:
-                return {
-                    "response_type": "ephemeral",
-                    "text": "❌ **Unable to parse update request.** Please be more specific about which ticket to update and what changes to make."
-                }
+                return self._ERR_UPDATE_UNPARSEABLE
             
             # Update the ticket
             updated_issue = self.linear_service.update_issue(ticket_id, updates)
             
             if updated_issue:
+                self._invalidate_context_cache()
                 return {
                     "response_type": "in_channel",
                     "text": f"✅ **Ticket Updated in Linear:**\n\n**Ticket:** {ticket_id}\n**Summary:** {summary}\n**URL:** {updated_issue.get('url', 'N/A')}"
                 }
             else:
-                return {
-                    "response_type": "ephemeral",
-                    "text": f"❌ **Failed to update Linear ticket.** The AI analysis was:\n\n{ai_response[0]}"
-                }
+                return _ephemeral(f"❌ **Failed to update Linear ticket.** The AI analysis was:\n\n{ai_response[0]}")
                 
         except json.JSONDecodeError:
-            return {
-                "response_type": "ephemeral",
-                "text": f"❌ **Error:** The AI returned an invalid format. Analysis:\n\n{ai_response[0] if 'ai_response' in locals() else 'No response'}"
-            }
+            return _ephemeral(f"❌ **Error:** The AI returned an invalid format. Analysis:\n\n{ai_response[0] if 'ai_response' in locals() else 'No response'}")
         except Exception as e:
-            return {
-                "response_type": "ephemeral", 
-                "text": f"❌ Error processing ticket update: {str(e)}"
-            }
+            return _ephemeral(f"❌ Error processing ticket update: {str(e)}")
     
     async def _handle_teammember_command(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle /teammember command using prompts.yml."""
         text = payload.get("text", "").strip()
         
         if not text:
-            return {
-                "response_type": "ephemeral",
-                "text": "Please specify a team member name or @username."
-            }
+            return self._ERR_TEAMMEMBER_NO_TEXT
         
-        context = await self._get_comprehensive_context()
+        # Only the member's own issues are relevant, which keeps the prompt a fraction of the full workspace
+        member = text.lstrip('@').lower()
+        context = await self._get_comprehensive_context(
+            issue_filter=lambda issue: bool(issue.assignee_name) and member in issue.assignee_name.lower()
+        )
         
-        prompt_config = self.prompts.get('slack_bot_teammember')
-        if not prompt_config:
-            return {
-                "response_type": "ephemeral",
-                "text": "❌ Team member prompt configuration not found."
-            }
+        prompt_config = self._p_teammember
         
         system_prompt = prompt_config['system_prompt']
-        user_prompt = prompt_config['user_prompt'].format(
+        user_prompt = self._templates['slack_bot_teammember'](
             context=context,
             member_name=text
         )
         
         try:
             # Use async text generation for team member info
-            ai_response = await self.ai_service.generate_text_async(system_prompt, user_prompt)
+            ai_response = await self.ai_service.generate_text_async(system_prompt, user_prompt, cache_key='slack_bot_teammember')
             ai_response = ai_response if ai_response else "No information found for this team member."
             
-            return {
-                "response_type": "ephemeral",
-                "text": f"👤 **Team Member Info:**\n\n{ai_response}"
-            }
+            return _ephemeral(f"👤 **Team Member Info:**\n\n{ai_response}")
             
         except Exception as e:
-            return {
-                "response_type": "ephemeral", 
-                "text": f"❌ Error getting team member info: {str(e)}"
-            }
+            return _ephemeral(f"❌ Error getting team member info: {str(e)}")
     
     async def _handle_weekly_summary_command(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle /weekly-summary command using prompts.yml."""
         context = await self._get_comprehensive_context()
         
-        prompt_config = self.prompts.get('slack_bot_weekly_summary')
-        if not prompt_config:
-            return {
-                "response_type": "ephemeral",
-                "text": "❌ Weekly summary prompt configuration not found."
-            }
+        prompt_config = self._p_weekly
         
         system_prompt = prompt_config['system_prompt']
-        user_prompt = prompt_config['user_prompt'].format(context=context)
+        user_prompt = self._templates['slack_bot_weekly_summary'](context=context)
         
         try:
+            # Stream into a channel message when possible so users see output immediately
+            streamed = await self._stream_ai_response(
+                payload.get("channel_id", ""),
+                system_prompt,
+                user_prompt,
+                placeholder="📈 Generating weekly summary...",
+                cache_key='slack_bot_weekly_summary'
+            )
+            if streamed is not None:
+                # The summary is already in the channel; just remove the ephemeral ack
+                return {"delete_original": True, "text": streamed}
+            
             # Use async text generation for weekly summary
-            ai_response = await self.ai_service.generate_text_async(system_prompt, user_prompt)
+            ai_response = await self.ai_service.generate_text_async(system_prompt, user_prompt, cache_key='slack_bot_weekly_summary')
             ai_response = ai_response if ai_response else "Unable to generate weekly summary."
             
             return {
@@ -1354,22 +1534,16 @@ class SlackCommandHandler:
             }
             
         except Exception as e:
-            return {
-                "response_type": "ephemeral",
-                "text": f"❌ Error generating weekly summary: {str(e)}"
-            }
+            return _ephemeral(f"❌ Error generating weekly summary: {str(e)}")
     
     async def _handle_meeting_summary(self, args: List[str]) -> Dict[str, Any]:
         """Handle meeting summary using prompts.yml."""
         try:
-            # Use the correct method to get recent transcripts
-            transcripts = self.supabase_service.get_recent_transcripts(limit=1)
+            # Only the latest row is needed; fetch it off the event loop
+            transcripts = await asyncio.to_thread(self.supabase_service.get_recent_transcripts, limit=1)
             
             if not transcripts:
-                return {
-                    "response_type": "ephemeral",
-                    "text": "📭 No recent meetings found."
-                }
+                return self._ERR_NO_RECENT_MEETINGS
             
             recent_meeting = transcripts[0]
             # Use the correct database schema columns
@@ -1378,48 +1552,43 @@ class SlackCommandHandler:
             transcript_content = recent_meeting.get('filtered_transcript', '')
             
             if not transcript_content:
-                return {
-                    "response_type": "ephemeral", 
-                    "text": "📭 No transcript content found for recent meeting."
-                }
+                return self._ERR_NO_MEETING_CONTENT
             
             # Format the date for display
-            try:
-                if created_date and created_date != 'Unknown date':
-                    date_obj = datetime.fromisoformat(created_date.replace('Z', '+00:00'))
-                    formatted_date = date_obj.strftime('%Y-%m-%d %H:%M')
-                else:
-                    formatted_date = 'Unknown date'
-            except:
-                formatted_date = str(created_date)[:10] if created_date else 'Unknown date'
-            
-            prompt_config = self.prompts.get('slack_bot_summarize_meeting')
-            if not prompt_config:
-                return {
-                    "response_type": "ephemeral",
-                    "text": "❌ Meeting summary prompt configuration not found."
-                }
+            formatted_date = _format_created_date(created_date, '%Y-%m-%d %H:%M')
+            
+            prompt_config = self._p_meeting
             
             system_prompt = prompt_config['system_prompt']
-            user_prompt = prompt_config['user_prompt'].format(
-                context=f"Meeting: {filename} | Date: {formatted_date}",
-                meeting_transcript=transcript_content[:3000]
-            )
             
-            # Use async text generation for meeting summary
-            summary = await self.ai_service.generate_text_async(system_prompt, user_prompt)
-            summary = summary if summary else "Unable to generate meeting summary."
+            # Same meeting + same prompt => same summary; the prompt text is hashed so edits to prompts.yml invalidate
+            summary_key = hashlib.blake2b(
+                f"{recent_meeting.get('id', filename)}:{recent_meeting.get('updated_at', created_date)}:"
+                f"{system_prompt}:{prompt_config['user_prompt']}".encode(),
+                digest_size=16
+            ).hexdigest()
+            summary = MEETING_SUMMARY_CACHE.get(summary_key)
             
-            return {
-                "response_type": "ephemeral",
-                "text": f"📅 **Meeting Summary - {filename}**\n*{formatted_date}*\n\n{summary}"
-            }
+            if summary:
+                MEETING_SUMMARY_CACHE.move_to_end(summary_key)
+            else:
+                user_prompt = self._templates['slack_bot_summarize_meeting'](
+                    context=f"Meeting: {filename} | Date: {formatted_date}",
+                    meeting_transcript=transcript_content[:MEETING_TRANSCRIPT_MAX_CHARS]
+                )
+                
+                # Use async text generation for meeting summary
+                summary = await self.ai_service.generate_text_async(system_prompt, user_prompt, cache_key='slack_bot_summarize_meeting')
+                if summary:
+                    MEETING_SUMMARY_CACHE[summary_key] = summary
+                    if len(MEETING_SUMMARY_CACHE) > MEETING_SUMMARY_CACHE_SIZE:
+                        MEETING_SUMMARY_CACHE.popitem(last=False)
+                summary = summary if summary else "Unable to generate meeting summary."
+            
+            return _ephemeral(f"📅 **Meeting Summary - {filename}**\n*{formatted_date}*\n\n{summary}")
             
         except Exception as e:
-            return {
-                "response_type": "ephemeral",
-                "text": f"❌ Error generating meeting summary: {str(e)}"
-            }
+            return _ephemeral(f"❌ Error generating meeting summary: {str(e)}")
     
     async def _handle_client_summary(self, text: str) -> Dict[str, Any]:
         """Handle client status summary using prompts.yml."""
@@ -1427,95 +1596,227 @@ class SlackCommandHandler:
             client_name = text.replace("client", "").strip()
             
             if not client_name:
-                return {
-                    "response_type": "ephemeral",
-                    "text": "Please specify a client name: `/summarize client [client_name]`"
-                }
+                return self._ERR_CLIENT_NO_NAME
             
             context = await self._get_comprehensive_context()
             
-            prompt_config = self.prompts.get('slack_bot_client_status')
-            if not prompt_config:
-                return {
-                    "response_type": "ephemeral",
-                    "text": "❌ Client status prompt configuration not found."
-                }
+            prompt_config = self._p_client
             
             system_prompt = prompt_config['system_prompt']
-            user_prompt = prompt_config['user_prompt'].format(
+            user_prompt = self._templates['slack_bot_client_status'](
                 context=context,
                 client_name=client_name
             )
             
             # Use async text generation for client summary
-            summary = await self.ai_service.generate_text_async(system_prompt, user_prompt)
+            summary = await self.ai_service.generate_text_async(system_prompt, user_prompt, cache_key='slack_bot_client_status')
             summary = summary if summary else f"No information found for client: {client_name}"
             
-            return {
-                "response_type": "ephemeral",
-                "text": f"📊 **Client Status: {client_name.title()}**\n\n{summary}"
-            }
+            return _ephemeral(f"📊 **Client Status: {client_name.title()}**\n\n{summary}")
             
         except Exception as e:
-            return {
-                "response_type": "ephemeral",
-                "text": f"❌ Error generating client summary: {str(e)}"
-            }
+            return _ephemeral(f"❌ Error generating client summary: {str(e)}")
+    
+    async def _get_comprehensive_context(self, issue_filter: Optional[Callable[[Any], bool]] = None, allow_stale: bool = False) -> str:
+        """Get comprehensive context from all sources, closed with a "Last updated" footer."""
+        body, fetched_at = await self._get_comprehensive_context_body(issue_filter, allow_stale=allow_stale)
+        return f"{body}\n{_context_footer(fetched_at)}"
+    
+    async def _get_comprehensive_context_body(self, issue_filter: Optional[Callable[[Any], bool]] = None, allow_stale: bool = False) -> Tuple[str, datetime]:
+        """
+        Get the context body and when it was fetched, cached briefly so concurrent commands share one fetch.
+        
+        The timestamp footer is kept out of the cached body so identical data yields an
+        identical string. Passing issue_filter narrows the Linear section to matching
+        issues, re-formatted from the sources behind the cached body rather than refetched.
+        
+        With allow_stale, an expired (but not invalidated) context is returned right away
+        and rebuilt in the background, so the AI call doesn't wait on Supabase and Linear.
+        """
+        body, fetched_at = await self._get_cached_context_body(allow_stale)
+        if issue_filter is None or self._context_sections is None:
+            return body, fetched_at
+        transcript_parts, linear_context = self._context_sections
+        return self._join_context_parts(transcript_parts, linear_context, issue_filter), fetched_at
+    
+    async def _get_cached_context_body(self, allow_stale: bool) -> Tuple[str, datetime]:
+        """Serve the full context body from the TTL cache, rebuilding it (single flight) when expired."""
+        if self._context_cache:
+            body, fetched_at, ts = self._context_cache
+            age = time.monotonic() - ts
+            if age < CONTEXT_CACHE_TTL_SECONDS:
+                self._context_cache_hits += 1
+                return body, fetched_at
+            if allow_stale and age < CONTEXT_STALE_MAX_SECONDS:
+                self._context_cache_hits += 1
+                self._schedule_context_refresh()
+                return body, fetched_at
+        
+        return await self._refresh_context_cache()
+    
+    def _schedule_context_refresh(self) -> None:
+        """Rebuild the context cache in the background unless a refresh is already running."""
+        if self._context_refresh_task is None or self._context_refresh_task.done():
+            self._context_refresh_task = asyncio.create_task(self._refresh_context_cache())
+            self._context_refresh_task.add_done_callback(self._log_context_refresh_failure)
+    
+    @staticmethod
+    def _log_context_refresh_failure(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Background context refresh failed: %s", task.exception())
     
-    async def _get_comprehensive_context(self) -> str:
-        """Get comprehensive context from all sources with full Linear workspace detail."""
+    async def _refresh_context_cache(self) -> Tuple[str, datetime]:
+        """Build the context under the lock (single flight) and store it."""
+        async with self._context_lock:
+            # Another caller may have refreshed the cache while we waited for the lock
+            if self._context_cache:
+                body, fetched_at, ts = self._context_cache
+                if time.monotonic() - ts < CONTEXT_CACHE_TTL_SECONDS:
+                    self._context_cache_hits += 1
+                    return body, fetched_at
+            
+            self._context_cache_misses += 1
+            generation = self._context_generation
+            body = await self._build_comprehensive_context()
+            fetched_at = datetime.now()
+            if generation == self._context_generation:
+                self._context_cache = (body, fetched_at, time.monotonic())
+            return body, fetched_at
+    
+    def _invalidate_context_cache(self) -> None:
+        """Drop the cached context so the next command sees freshly written Linear data."""
+        self._context_cache = None
+        self._context_generation += 1
+    
+    def context_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for the comprehensive context cache."""
+        lookups = self._context_cache_hits + self._context_cache_misses
+        return {
+            "hits": self._context_cache_hits,
+            "misses": self._context_cache_misses,
+            "hit_rate": round(self._context_cache_hits / lookups, 3) if lookups else None,
+        }
+    
+    async def _get_summary_context(self, max_len: int = 500) -> str:
+        """
+        Get a short context preview for quick summaries.
+        
+        Served like any allow_stale read: a context up to CONTEXT_STALE_MAX_SECONDS old
+        answers without touching Linear or Supabase (refreshed in the background once
+        past its TTL); anything older is rebuilt first.
+        """
+        body, _ = await self._get_comprehensive_context_body(allow_stale=True)
+        return body[:max_len]
+    
+    async def _build_comprehensive_context(self) -> str:
+        """Build the context body from all sources with full Linear workspace detail (no timestamp footer)."""
         context_parts = []
         
+        # Supabase and Linear are independent, so fetch them concurrently on worker threads
+        fetch_started = time.perf_counter()
+        transcripts, linear_context = await asyncio.gather(
+            # Most recent transcripts (using created_at since meeting_date doesn't exist)
+            asyncio.to_thread(self.supabase_service.get_recent_transcript_previews, limit=3),
+            asyncio.to_thread(self.linear_service.get_workspace_context),
+            return_exceptions=True
+        )
+        logger.info("Context fetch took %.2fs", time.perf_counter() - fetch_started)
+        
         # Recent transcripts (handle database errors gracefully)
         try:
-            # Get most recent transcripts (using created_at since meeting_date doesn't exist)
-            transcripts = self.supabase_service.get_recent_transcripts(limit=3)
+            if isinstance(transcripts, Exception):
+                raise transcripts
             
             if transcripts:
-                context_parts.append("📋 RECENT MEETINGS (Last 7 Days):")
-                context_parts.append("-" * 35)
+                context_parts.append(RECENT_MEETINGS_HEADER)
                 for transcript in transcripts:
                     # Use actual database schema columns
                     filename = transcript.get('filename', 'Unknown Meeting')
                     created_date = transcript.get('created_at', 'Unknown Date')
-                    transcript_content = transcript.get('filtered_transcript', '')
+                    # Already cut to 300 chars by the database (or the service fallback)
+                    transcript_preview = transcript.get('filtered_transcript_preview') or ''
                     
                     # Extract first few lines as summary since no ai_analysis exists
-                    content_preview = transcript_content[:300].replace('\n', ' ').strip() if transcript_content else 'No content available'
+                    content_preview = transcript_preview.replace('\n', ' ').strip() if transcript_preview else 'No content available'
                     
                     # Format the date for display
-                    try:
-                        if created_date and created_date != 'Unknown Date':
-                            date_obj = datetime.fromisoformat(created_date.replace('Z', '+00:00'))
-                            formatted_date = date_obj.strftime('%Y-%m-%d %H:%M')
-                        else:
-                            formatted_date = 'Unknown Date'
-                    except:
-                        formatted_date = str(created_date)[:10] if created_date else 'Unknown Date'
+                    formatted_date = _format_created_date(created_date, '%Y-%m-%d %H:%M', 'Unknown Date')
                     
-                    context_parts.append(f"• {filename} ({formatted_date})")
-                    context_parts.append(f"  📝 {content_preview}...")
+                    context_parts.extend([f"• {filename} ({formatted_date})", f"  📝 {content_preview}..."])
                 context_parts.append("")
         except Exception as e:
             # Don't let database errors stop the entire context retrieval
-            print(f"=== CONTEXT: Transcript retrieval failed: {str(e)} ===", flush=True)
-            context_parts.append("📋 MEETINGS: Database unavailable")
-            context_parts.append("")
+            logger.warning("CONTEXT: Transcript retrieval failed: %s", e)
+            context_parts.extend(["📋 MEETINGS: Database unavailable", ""])
+        
+        self._context_sections = (context_parts, linear_context)
+        return self._join_context_parts(context_parts, linear_context)
+    
+    def _join_context_parts(self, transcript_parts: List[str], linear_context: Any, issue_filter: Optional[Callable[[Any], bool]] = None) -> str:
+        """Close the transcript lines with the Linear section, narrowed to issue_filter when given."""
+        context_parts = list(transcript_parts)
         
         # Comprehensive Linear workspace context
         try:
-            linear_context = self.linear_service.get_workspace_context()
-            linear_formatted = format_linear_context_comprehensive(linear_context)
+            if isinstance(linear_context, Exception):
+                raise linear_context
+            if issue_filter is not None:
+                linear_formatted = format_linear_context_comprehensive(_filter_linear_context(linear_context, issue_filter))
+            else:
+                linear_formatted = self._format_linear_context_cached(linear_context)
             context_parts.append(linear_formatted)
                 
         except Exception as e:
             context_parts.append(f"🎯 LINEAR: unavailable ({str(e)[:50]})")
             context_parts.append("")
         
-        context_parts.append(f"🕐 Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-        
         return "\n".join(context_parts) if context_parts else "📝 Basic AI assistant ready to help"
     
+    def _format_linear_context_cached(self, linear_context: LinearContext) -> str:
+        """Format the workspace, reusing the previous string while Linear serves the same cached context."""
+        if self._linear_formatted and self._linear_formatted[0] is linear_context:
+            return self._linear_formatted[1]
+        linear_formatted = format_linear_context_comprehensive(linear_context)
+        self._linear_formatted = (linear_context, linear_formatted)
+        return linear_formatted
+    
+    async def _stream_ai_response(self, channel_id: str, system_prompt: str, user_prompt: str, placeholder: str, cache_key: Optional[str] = None, prefix: str = "") -> Optional[str]:
+        """
+        Post a placeholder message and fill it in with chat.update as the AI response streams.
+        
+        Returns the final text (without prefix), or None if a placeholder could not be
+        posted so the caller can fall back to the non-streaming path. A stream that fails
+        part-way keeps what arrived, marked with STREAM_INTERRUPTED_NOTICE.
+        """
+        if not channel_id:
+            return None
+        
+        ts = await self.slack_service.post_message_async(channel_id, placeholder)
+        if not ts:
+            return None
+        
+        chunks: List[str] = []
+        pending = 0
+        last_update = time.monotonic()
+        try:
+            async for delta in self.ai_service.generate_text_stream(system_prompt, user_prompt, cache_key=cache_key):
+                chunks.append(delta)
+                pending += 1
+                at_boundary = delta.rstrip(" ").endswith((".", "!", "?", "\n"))
+                now = time.monotonic()
+                # Either trigger only fires once the interval has passed; the final update below always goes out
+                if (pending >= STREAM_UPDATE_TOKENS or at_boundary) and now - last_update >= STREAM_MIN_UPDATE_INTERVAL_SECONDS:
+                    await self.slack_service.update_message_async(channel_id, ts, prefix + "".join(chunks))
+                    pending = 0
+                    last_update = now
+        except Exception as e:
+            logger.error("Error streaming AI response: %s", e)
+            chunks.append(STREAM_INTERRUPTED_NOTICE if chunks else "❌ I couldn't generate a response at this time.")
+        
+        final_text = "".join(chunks) or "I couldn't generate a response at this time."
+        await self.slack_service.update_message_async(channel_id, ts, prefix + final_text)
+        return final_text
+    
     def _get_recent_slack_history(self, channel_id: str, user_id: str, limit: int = 5) -> str:
         """Get recent Slack message history for context."""
         try:
@@ -1526,26 +1827,66 @@ class SlackCommandHandler:
             return f"Could not retrieve Slack history: {str(e)}"
     
     async def _send_response(self, response_url: str, response: Dict[str, Any]) -> None:
-        """Send response back to Slack using response URL."""
-        try:
-            headers = {"Content-Type": "application/json"}
-            # Prefer replacing the initial ack message to keep ordering tidy in the channel UI
-            if "replace_original" not in response:
-                response["replace_original"] = True
-            # Use a shorter timeout for the response to Slack
-            response_result = requests.post(response_url, json=response, headers=headers, timeout=5)
-            if response_result.status_code != 200:
-                logger.warning(f"Failed to send response to Slack: {response_result.status_code} - {response_result.text}")
-        except requests.exceptions.Timeout:
-            logger.warning(f"Timeout sending response to Slack: {response_url}")
-            # Try once more with a fallback message
+        """Queue a response for delivery to Slack's response URL and return without waiting on the POST."""
+        self._ensure_response_workers()
+        self._response_queue.put_nowait((response_url, response))
+    
+    def _ensure_response_workers(self) -> None:
+        """Start the response workers (and their queue) in the running loop if they aren't alive."""
+        if self._response_workers and not all(worker.done() for worker in self._response_workers):
+            return
+        self._response_queue = asyncio.Queue()
+        self._response_workers = [
+            asyncio.create_task(self._response_worker()) for _ in range(RESPONSE_WORKERS)
+        ]
+    
+    async def _response_worker(self) -> None:
+        """Drain the response queue until cancelled."""
+        queue = self._response_queue
+        while True:
+            response_url, response = await queue.get()
             try:
-                fallback_response = {
-                    "response_type": "ephemeral",
-                    "text": "⚠️ Response took longer than expected. The operation may still be processing."
-                }
-                requests.post(response_url, json=fallback_response, headers=headers, timeout=3)
+                await self._deliver_response(response_url, response)
+            except Exception:
+                logger.exception("Error sending response to Slack")
+            finally:
+                queue.task_done()
+    
+    async def _deliver_response(self, response_url: str, response: Dict[str, Any]) -> None:
+        """POST a response to Slack, retrying transient failures with exponential backoff."""
+        # Prefer replacing the initial ack message to keep ordering tidy in the channel UI
+        # (copy rather than mutate, since static responses are shared class constants)
+        if "replace_original" not in response and not response.get("delete_original"):
+            response = {**response, "replace_original": True}
+        body = dump_json_bytes(response)
+        
+        timed_out = False
+        for attempt in range(RESPONSE_MAX_ATTEMPTS):
+            if attempt:
+                await asyncio.sleep(RESPONSE_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+            try:
+                response_result = await self._http.post(response_url, content=body, headers=JSON_HEADERS)
+            except httpx.TimeoutException:
+                logger.warning("Timeout sending response to Slack (attempt %d/%d)", attempt + 1, RESPONSE_MAX_ATTEMPTS)
+                timed_out = True
+                continue
+            except httpx.TransportError as e:
+                logger.warning("Transport error sending response to Slack (attempt %d/%d): %s", attempt + 1, RESPONSE_MAX_ATTEMPTS, e)
+                timed_out = False
+                continue
+            
+            if response_result.status_code == 200:
+                return
+            if response_result.status_code != 429 and response_result.status_code < 500:
+                logger.warning("Failed to send response to Slack: %s - %s", response_result.status_code, response_result.text)
+                return
+            logger.warning("Slack returned %s for response (attempt %d/%d)", response_result.status_code, attempt + 1, RESPONSE_MAX_ATTEMPTS)
+            timed_out = False
+        
+        logger.error("Giving up sending response to Slack after %d attempts", RESPONSE_MAX_ATTEMPTS)
+        if timed_out:
+            # The last attempt timed out: try a short fallback notice so the user isn't left waiting
+            try:
+                await self._http.post(response_url, content=dump_json_bytes(self._ERR_RESPONSE_TIMEOUT), headers=JSON_HEADERS, timeout=3.0)
             except Exception as fallback_error:
-                logger.error(f"Failed to send fallback response: {fallback_error}")
-        except Exception as e:
-            logger.error(f"Error sending response to Slack: {e}") 
\ No newline at end of file
+                logger.error("Failed to send fallback response: %s", fallback_error)
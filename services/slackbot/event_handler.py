@@ -4,36 +4,236 @@ Slack Event Handler for Alpha Machine Bot
 Handles Slack events like mentions, messages, reactions, etc.
 """
 
-from typing import Dict, Any
-import json
-from datetime import datetime
-import traceback
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+import asyncio
+import re
+import time
+from collections import OrderedDict
+import logging
 
 from shared.core.config import Config
-from shared.services.slack_service import SlackService
-from shared.services.ai_service import OpenAIService
-from command_handler import SlackCommandHandler, USER_PENDING_TICKETS
+from shared.core.utils import parse_json
+from command_handler import SlackCommandHandler, TTLStore, USER_PENDING_TICKETS, USER_STATE_MAX_ENTRIES
+
+logger = logging.getLogger(__name__)
+
+# Cap on events processed at once; extra deliveries wait their turn instead of piling onto upstream APIs
+EVENT_CONCURRENCY = 16
+# Slack retries unacknowledged deliveries with the same event_id; remember recent ids to drop repeats
+EVENT_DEDUPE_MAX_SIZE = 4096
+EVENT_DEDUPE_WINDOW_SECONDS = 300
+# A ticket preview's Yes/No buttons are honoured once; the claim outlives the pending entry because
+# the button value alone can re-seed it
+TICKET_CLAIM_TTL_SECONDS = 24 * 60 * 60
+
+# Bot mention as Slack renders it, including the <@U123|name> alias form; the bot id is fixed per process
+_BOT_MENTION_RE = re.compile(rf"<@{re.escape(Config.SLACK_BOT_USER_ID or 'bot')}(?:\|[^>]*)?>")
+
+# Canned replies for small talk that needs no context or AI call, keyed by normalized text
+_GREETING_REPLY = "Hi there! Ask me about projects, meetings, or the team, or try a slash command like /chat."
+_THANKS_REPLY = "You're welcome! 🙌"
+_TRIVIAL_REPLIES = {
+    "": _GREETING_REPLY,
+    "hi": _GREETING_REPLY,
+    "hello": _GREETING_REPLY,
+    "hey": _GREETING_REPLY,
+    "yo": _GREETING_REPLY,
+    "thanks": _THANKS_REPLY,
+    "thank you": _THANKS_REPLY,
+    "thx": _THANKS_REPLY,
+    "ty": _THANKS_REPLY,
+    "ok": "👍",
+    "okay": "👍",
+    "👍": "👍",
+    ":+1:": "👍",
+}
+
+
+def _is_ignored_message(event: Dict[str, Any]) -> bool:
+    """True for message events the bot never answers: non-DMs, bot posts, and empty text."""
+    return (
+        event.get("channel_type") != "im"
+        or bool(event.get("bot_id"))
+        or event.get("subtype") == "bot_message"
+        or not (event.get("text") or "").strip()
+    )
+
+
+def _trivial_reply(text: str) -> Optional[str]:
+    """Return a canned reply when the message is just a greeting, thanks or acknowledgement."""
+    return _TRIVIAL_REPLIES.get(text.strip().lower().rstrip("!. "))
+
+
+# Static system prompts: identical bytes on every call so concurrent mentions/DMs share OpenAI's cached prefix
+MENTION_SYSTEM_PROMPT = """You are Alpha Machine, an AI assistant for a consulting firm. 
+Someone just mentioned you in Slack. Respond helpfully and conversationally.
+You have access to meeting transcripts, Linear projects, and team information.
+Keep responses concise but helpful. Use emojis appropriately."""
+
+DM_SYSTEM_PROMPT = """You are Alpha Machine, an AI assistant for a consulting firm.
+Someone sent you a direct message. Respond helpfully and conversationally.
+You have access to meeting transcripts, Linear projects, and team information.
+Keep responses concise but helpful."""
+
+# User prompt templates; only the context and the user's text vary per event
+MENTION_USER_TEMPLATE = """Context: {context}
+
+User mentioned me and said: {text}
+
+Please respond helpfully."""
+
+DM_USER_TEMPLATE = """Context: {context}
+
+User sent me a DM: {text}
+
+Please respond helpfully."""
+
+WELCOME_TEMPLATE = """🎉 Welcome to the team, {user_name}!
+
+I'm Alpha Machine, your AI assistant. I can help you with:
+
+🤖 `/chat` - Ask me anything about projects, meetings, or the team
+📊 `/summarize` - Get meeting summaries or client status updates  
+🎯 `/create` - Analyze and create Linear tickets
+👤 `/teammember` - Get info about team members and their work
+📈 `/weekly-summary` - Generate comprehensive weekly reports
+
+Feel free to mention me (@Alpha Machine) in any channel or send me a DM anytime!"""
+
+_SELECTION_STORED_TEMPLATE = "📋 Selected {count} transcript(s). {next_step}"
+_USE_ALL_TRANSCRIPTS_REPLY = (
+    "🔄 **Using all recent transcripts!** This is the default behavior.\n"
+    "Use `/chat [your question]` normally to get context from all recent meetings.\n\n"
+    "💡 **Example**: `/chat What are our current project priorities?`"
+)
+
+# What to click after picking transcripts, by the dropdown's action_id
+_SELECTION_NEXT_STEP = {
+    "transcript_selection": "Click '✅ Use Selected' to confirm, then use `/chat [your question]`.",
+    "chat_with_transcript_selection": "Click '🚀 Answer with Selected' to get your AI response.",
+    "chat_inline_transcript_selection": "Click '🚀 Answer with Selected' to get your AI response.",
+    "chat_select_transcript_selection": "Click '✅ Set Selection' to confirm.",
+}
+
+# Confirmation once a selection is locked in, by the button's action_id
+_SELECTION_CONFIRMED = {
+    "use_selected_transcripts": (
+        "🎯 **{count} transcript(s) selected!** \n\n"
+        "✅ **Ready!** Now use `/chat [your question]` and I'll analyze only the selected transcripts.\n\n"
+        "💡 **Example**: `/chat What budget decisions were made in the selected meetings?`\n\n"
+        "⏰ Selection expires in 10 minutes."
+    ),
+    "set_transcript_selection": (
+        "✅ **{count} transcript(s) selected!** \n\n"
+        "🎯 **Ready!** Now use `/chat [your question]` and I'll analyze only the selected transcripts.\n\n"
+        "💡 **Example**: `/chat What budget decisions were made?`\n\n"
+        "⏰ Selection expires in 10 minutes."
+    ),
+}
+_NO_SELECTION = "❌ **No transcripts selected.** Please select transcripts from the dropdown first, then click this button."
+_TICKETS_ALREADY_HANDLED = "ℹ️ This ticket request was already handled."
 
 
 class SlackEventHandler:
     """Handles processing of Slack events."""
     
-    def __init__(self):
-        """Initialize services."""
-        self.slack_service = SlackService()
-        self.ai_service = OpenAIService(
-            api_key=Config.OPENAI_API_KEY,
-            model=Config.OPENAI_MODEL,
-            max_tokens=Config.OPENAI_MAX_TOKENS,
-            temperature=Config.OPENAI_TEMPERATURE
-        )
-        self.command_handler = SlackCommandHandler()
+    def __init__(self, command_handler: Optional[SlackCommandHandler] = None):
+        """Initialize services, reusing the command handler's clients when one is provided."""
+        self.command_handler = command_handler or SlackCommandHandler()
+        # Share one set of service clients (HTTP sessions, thread pool, prompts) with the command handler
+        self.slack_service = self.command_handler.slack_service
+        self.ai_service = self.command_handler.ai_service
+        # Strong references to in-flight event tasks so they aren't garbage collected mid-run
+        self._event_tasks: Set[asyncio.Task] = set()
+        self._event_semaphore = asyncio.Semaphore(EVENT_CONCURRENCY)
+        # event_id -> monotonic time first seen, oldest first
+        self._seen_events: "OrderedDict[str, float]" = OrderedDict()
+        # Block action_id -> handler(action, user, channel, payload)
+        ActionHandler = Callable[[Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any]], Awaitable[None]]
+        self._action_dispatch: Dict[str, ActionHandler] = {
+            "generate_summary": self._action_generate_summary,
+            "transcript_selection": self._action_store_selection,
+            "chat_with_transcript_selection": self._action_store_selection,
+            "chat_inline_transcript_selection": self._action_store_selection,
+            "chat_select_transcript_selection": self._action_store_selection,
+            "use_selected_transcripts": self._action_confirm_selection,
+            "set_transcript_selection": self._action_confirm_selection,
+            "use_all_transcripts": self._action_use_all_transcripts,
+            "answer_with_selected": self._action_answer_selected,
+            "answer_inline_selected": self._action_answer_selected,
+            "answer_with_all": self._action_answer_all,
+            "answer_inline_all": self._action_answer_all,
+            "create_tickets_yes": self._action_confirm_tickets,
+            "create_tickets_no": self._action_confirm_tickets,
+        }
+        # "user_id:preview" keys of ticket previews whose Yes/No has already been acted on
+        self._claimed_ticket_previews = TTLStore(USER_STATE_MAX_ENTRIES, TICKET_CLAIM_TTL_SECONDS)
+        # Strong references to fire-and-forget Slack sends (interaction acks)
+        self._bg_tasks: Set[asyncio.Task] = set()
+    
+    def dispatch_event(self, payload: Dict[str, Any]) -> Optional[asyncio.Task]:
+        """
+        Schedule handle_event as a detached task and return immediately.
+        
+        The webhook can then ACK Slack within its 3 second budget without tying
+        the request (and its keep-alive connection) to the AI round-trip.
+        Message events the bot would ignore are dropped here without a task.
+        """
+        event = payload.get("event", {})
+        if event.get("type") == "message" and _is_ignored_message(event):
+            return None
+        
+        task = asyncio.create_task(self._run_event(payload))
+        self._event_tasks.add(task)
+        task.add_done_callback(self._event_tasks.discard)
+        return task
+    
+    def dispatch_interaction(self, payload: Dict[str, Any]) -> asyncio.Task:
+        """
+        Schedule handle_interaction as a detached task and return immediately.
+        
+        Unlike a request BackgroundTask this doesn't keep the /interactive request
+        cycle (and its connection) open while tickets are created.
+        """
+        task = asyncio.create_task(self.handle_interaction(payload))
+        self._event_tasks.add(task)
+        task.add_done_callback(self._event_tasks.discard)
+        return task
+    
+    async def _run_event(self, payload: Dict[str, Any]) -> None:
+        async with self._event_semaphore:
+            await self.handle_event(payload)
+    
+    def _is_duplicate_event(self, event_id: Optional[str]) -> bool:
+        """Record event_id and report whether it was already seen within the dedupe window."""
+        if not event_id:
+            return False
+        
+        now = time.monotonic()
+        # Evict in insertion order: anything past the window or beyond the size cap
+        while self._seen_events:
+            oldest_id, first_seen = next(iter(self._seen_events.items()))
+            if now - first_seen < EVENT_DEDUPE_WINDOW_SECONDS and len(self._seen_events) < EVENT_DEDUPE_MAX_SIZE:
+                break
+            self._seen_events.popitem(last=False)
+        
+        if event_id in self._seen_events:
+            return True
+        self._seen_events[event_id] = now
+        return False
     
     async def handle_event(self, payload: Dict[str, Any]) -> None:
         """Route event to appropriate handler."""
         event = payload.get("event", {})
         event_type = event.get("type", "")
         
+        if event_type == "message" and _is_ignored_message(event):
+            return
+        
+        if self._is_duplicate_event(payload.get("event_id")):
+            logger.info("Skipping duplicate delivery of event %s", payload.get("event_id"))
+            return
+        
         try:
             if event_type == "app_mention":
                 await self._handle_app_mention(event)
@@ -44,32 +244,30 @@ class SlackEventHandler:
             elif event_type == "team_join":
                 await self._handle_team_join(event)
             else:
-                print(f"Unhandled event type: {event_type}")
+                logger.info("Unhandled event type: %s", event_type)
                 
         except Exception as e:
-            print(f"Error handling event {event_type}: {e}")
+            logger.error("Error handling event %s: %s", event_type, e)
     
     async def handle_interaction(self, payload: Dict[str, Any]) -> None:
         """Handle interactive components (buttons, modals, etc.)."""
         interaction_type = payload.get("type", "")
         
-        print(f"=== HANDLE_INTERACTION CALLED ===")
-        print(f"Interaction type: {interaction_type}")
-        print(f"Full payload: {payload}")
+        logger.debug("Interaction type: %s", interaction_type)
+        logger.debug("Full payload: %s", payload)
         
         try:
             if interaction_type == "block_actions":
-                print("Calling _handle_block_actions")
+                logger.debug("Calling _handle_block_actions")
                 await self._handle_block_actions(payload)
             elif interaction_type == "view_submission":
-                print("Calling _handle_view_submission")
+                logger.debug("Calling _handle_view_submission")
                 await self._handle_view_submission(payload)
             else:
-                print(f"Unhandled interaction type: {interaction_type}")
+                logger.info("Unhandled interaction type: %s", interaction_type)
                 
         except Exception as e:
-            print(f"Error handling interaction {interaction_type}: {e}")
-            print(f"Exception details: {traceback.format_exc()}")
+            logger.error("Error handling interaction %s: %s", interaction_type, e, exc_info=logger.isEnabledFor(logging.DEBUG))
     
     async def _handle_app_mention(self, event: Dict[str, Any]) -> None:
         """Handle when the bot is mentioned."""
@@ -78,88 +276,88 @@ class SlackEventHandler:
         text = event.get("text", "")
         
         # Remove the bot mention from the text
-        bot_user_id = Config.SLACK_BOT_USER_ID or "bot"
-        text = text.replace(f"<@{bot_user_id}>", "").strip()
+        text = _BOT_MENTION_RE.sub("", text).strip()
         
-        if not text:
-            text = "Hello! How can I help you?"
+        # Small talk gets a canned reply without building context or calling OpenAI
+        canned_reply = _trivial_reply(text)
+        if canned_reply is not None:
+            await self.slack_service.send_message_async(channel=channel_id, text=f"👋 {canned_reply}")
+            return
         
         try:
-            # Get comprehensive context and generate response
-            context = await self.command_handler._get_comprehensive_context()
+            # Get comprehensive context and generate response; a recently expired context is
+            # used as-is (refreshed in the background) rather than making the reply wait on it
+            context = await self.command_handler._get_comprehensive_context(allow_stale=True)
             
-            system_prompt = """You are Alpha Machine, an AI assistant for a consulting firm. 
-Someone just mentioned you in Slack. Respond helpfully and conversationally.
-You have access to meeting transcripts, Linear projects, and team information.
-Keep responses concise but helpful. Use emojis appropriately."""
-
-            user_prompt = f"""Context: {context}
-
-User mentioned me and said: {text}
-
-Please respond helpfully."""
+            user_prompt = MENTION_USER_TEMPLATE.format_map({"context": context, "text": text})
+            
+            # Stream into a placeholder so the first words show up at first-token latency
+            streamed = await self.command_handler._stream_ai_response(
+                channel_id,
+                MENTION_SYSTEM_PROMPT,
+                user_prompt,
+                placeholder="👋 ...",
+                cache_key='slack_bot_mention',
+                prefix="👋 "
+            )
+            if streamed is not None:
+                return
 
-            ai_response = await self.ai_service.generate_text_async(system_prompt, user_prompt)
+            ai_response = await self.ai_service.generate_text_async(MENTION_SYSTEM_PROMPT, user_prompt, cache_key='slack_bot_mention')
             response_text = ai_response if ai_response else "Hi there! I'm here to help with your questions."
             
             # Send response to the channel
-            self.slack_service.send_message(
+            await self.slack_service.send_message_async(
                 channel=channel_id,
                 text=f"👋 {response_text}"
             )
             
         except Exception as e:
             # Send error message
-            self.slack_service.send_message(
+            await self.slack_service.send_message_async(
                 channel=channel_id,
                 text=f"❌ Sorry, I encountered an error: {str(e)}"
             )
     
     async def _handle_message(self, event: Dict[str, Any]) -> None:
-        """Handle direct messages to the bot."""
-        # Only handle direct messages (DMs)
-        channel_type = event.get("channel_type")
-        if channel_type != "im":
-            return
-        
+        """Handle direct messages to the bot (non-DMs and bot posts are filtered out by handle_event)."""
         user_id = event.get("user")
         channel_id = event.get("channel")
         text = event.get("text", "")
         
-        # Ignore bot messages
-        if event.get("bot_id") or event.get("subtype") == "bot_message":
-            return
-        
-        if not text.strip():
+        canned_reply = _trivial_reply(text)
+        if canned_reply is not None:
+            await self.slack_service.send_message_async(channel=channel_id, text=canned_reply)
             return
         
         try:
-            # Get context and generate response
-            context = await self.command_handler._get_comprehensive_context()
+            # Get context and generate response, tolerating a recently expired context
+            context = await self.command_handler._get_comprehensive_context(allow_stale=True)
             
-            system_prompt = """You are Alpha Machine, an AI assistant for a consulting firm.
-Someone sent you a direct message. Respond helpfully and conversationally.
-You have access to meeting transcripts, Linear projects, and team information.
-Keep responses concise but helpful."""
-
-            user_prompt = f"""Context: {context}
-
-User sent me a DM: {text}
-
-Please respond helpfully."""
+            user_prompt = DM_USER_TEMPLATE.format_map({"context": context, "text": text})
+            
+            streamed = await self.command_handler._stream_ai_response(
+                channel_id,
+                DM_SYSTEM_PROMPT,
+                user_prompt,
+                placeholder="...",
+                cache_key='slack_bot_dm'
+            )
+            if streamed is not None:
+                return
 
-            ai_response = await self.ai_service.generate_text_async(system_prompt, user_prompt)
+            ai_response = await self.ai_service.generate_text_async(DM_SYSTEM_PROMPT, user_prompt, cache_key='slack_bot_dm')
             response_text = ai_response if ai_response else "Hi! I'm here to help. You can ask me about projects, meetings, or use slash commands like /chat."
             
             # Send response to the DM
-            self.slack_service.send_message(
+            await self.slack_service.send_message_async(
                 channel=channel_id,
                 text=response_text
             )
             
         except Exception as e:
             # Send error message
-            self.slack_service.send_message(
+            await self.slack_service.send_message_async(
                 channel=channel_id,
                 text=f"❌ Sorry, I encountered an error: {str(e)}"
             )
@@ -175,13 +373,13 @@ Please respond helpfully."""
             channel_id = item.get("channel")
             if channel_id:
                 try:
-                    self.slack_service.send_ephemeral_message(
+                    await self.slack_service.send_ephemeral_message_async(
                         channel=channel_id,
                         user=user_id,
                         text="📝 I noticed you added a memo reaction! Use `/summarize` to get AI summaries of meetings or client status."
                     )
                 except Exception as e:
-                    print(f"Error sending reaction response: {e}")
+                    logger.error("Error sending reaction response: %s", e)
     
     async def _handle_team_join(self, event: Dict[str, Any]) -> None:
         """Handle when someone joins the team."""
@@ -191,28 +389,18 @@ Please respond helpfully."""
         
         try:
             # Send welcome message via DM
-            welcome_message = f"""🎉 Welcome to the team, {user_name}!
-
-I'm Alpha Machine, your AI assistant. I can help you with:
-
-🤖 `/chat` - Ask me anything about projects, meetings, or the team
-📊 `/summarize` - Get meeting summaries or client status updates  
-🎯 `/create` - Analyze and create Linear tickets
-👤 `/teammember` - Get info about team members and their work
-📈 `/weekly-summary` - Generate comprehensive weekly reports
-
-Feel free to mention me (@Alpha Machine) in any channel or send me a DM anytime!"""
+            welcome_message = WELCOME_TEMPLATE.format_map({"user_name": user_name})
 
             # Get user's DM channel
-            dm_channel = self.slack_service.open_dm(user_id)
+            dm_channel = await self.slack_service.open_dm_async(user_id)
             if dm_channel:
-                self.slack_service.send_message(
+                await self.slack_service.send_message_async(
                     channel=dm_channel,
                     text=welcome_message
                 )
                 
         except Exception as e:
-            print(f"Error sending welcome message: {e}")
+            logger.error("Error sending welcome message: %s", e)
     
     async def _handle_block_actions(self, payload: Dict[str, Any]) -> None:
         """Handle button clicks and other block actions."""
@@ -220,498 +408,248 @@ Feel free to mention me (@Alpha Machine) in any channel or send me a DM anytime!
         user = payload.get("user", {})
         channel = payload.get("channel", {})
         
-        print(f"Block actions payload: {payload}")
+        if logger.isEnabledFor(logging.DEBUG):
+            for action in actions:
+                logger.debug("Processing action_id: '%s' with value: '%s'", action.get("action_id", ""), action.get("value", ""))
         
-        for action in actions:
-            action_id = action.get("action_id", "")
-            value = action.get("value", "")
+        # Independent actions in one payload run concurrently; one failing doesn't cancel the rest
+        dispatched = [action for action in actions if action.get("action_id") in self._action_dispatch]
+        results = await asyncio.gather(
+            *(self._action_dispatch[action["action_id"]](action, user, channel, payload) for action in dispatched),
+            return_exceptions=True
+        )
+        for action, result in zip(dispatched, results):
+            if isinstance(result, Exception):
+                logger.error("Block action %s failed: %s", action["action_id"], result)
+    
+    def _spawn_background(self, coro: Awaitable[Any]) -> asyncio.Task:
+        """Run a non-critical Slack call without waiting on it; failures are logged, not raised."""
+        task = asyncio.ensure_future(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._finish_background)
+        return task
+    
+    def _finish_background(self, task: asyncio.Task) -> None:
+        self._bg_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Background Slack call failed: %s", task.exception())
+    
+    async def _send_ephemeral(self, channel: Dict[str, Any], user: Dict[str, Any], text: str) -> None:
+        """Reply to the clicking user only, in the channel the action came from."""
+        await self.slack_service.send_ephemeral_message_async(
+            channel=channel.get("id"),
+            user=user.get("id"),
+            text=text
+        )
+    
+    async def _action_generate_summary(self, action: Dict[str, Any], user: Dict[str, Any], channel: Dict[str, Any], payload: Dict[str, Any]) -> None:
+        """Handle the summary generation button."""
+        try:
+            # Reuse the cached context rather than rebuilding it for a 500 char preview
+            context = await self.command_handler._get_summary_context(max_len=500)
             
-            print(f"Processing action_id: '{action_id}' with value: '{value}'")
+            summary_response = {
+                "response_type": "ephemeral",
+                "text": f"📊 **Quick Summary Generated:**\n\n{context}..."
+            }
             
-            if action_id == "generate_summary":
-                # Handle summary generation button
-                try:
-                    # Get context and generate summary
-                    context = await self.command_handler._get_comprehensive_context()
-                    
-                    summary_response = {
-                        "response_type": "ephemeral",
-                        "text": f"📊 **Quick Summary Generated:**\n\n{context[:500]}..."
-                    }
-                    
-                    # Update the original message
-                    self.slack_service.update_message(
-                        channel=channel.get("id"),
-                        ts=payload.get("message", {}).get("ts"),
-                        text="Summary generated! ✅"
-                    )
-                    
-                except Exception as e:
-                    print(f"Error handling summary button: {e}")
+            # Update the original message
+            await self.slack_service.update_message_async(
+                channel=channel.get("id"),
+                ts=payload.get("message", {}).get("ts"),
+                text="Summary generated! ✅"
+            )
             
-            elif action_id == "transcript_selection":
-                # Handle transcript dropdown selection - store the selection
-                try:
-                    selected_values = action.get("selected_options", [])
-                    transcript_ids = [opt.get("value") for opt in selected_values]
-                    user_id = user.get("id")
-                    
-                    # Store selection for this user
-                    self.command_handler._store_user_selection(user_id, transcript_ids)
-                    
-                    selected_count = len(transcript_ids)
-                    response_text = f"📋 Selected {selected_count} transcript(s). Click '✅ Use Selected' to confirm, then use `/chat [your question]`."
-                    
-                    # Send ephemeral response
-                    self.slack_service.send_message(
-                        channel=channel.get("id"),
-                        text=response_text,
-                        user=user_id
-                    )
-                    
-                except Exception as e:
-                    print(f"Error handling transcript selection: {e}")
+        except Exception as e:
+            logger.error("Error handling summary button: %s", e)
+    
+    async def _action_store_selection(self, action: Dict[str, Any], user: Dict[str, Any], channel: Dict[str, Any], payload: Dict[str, Any]) -> None:
+        """Store a transcript dropdown selection and tell the user what to click next."""
+        action_id = action.get("action_id", "")
+        try:
+            transcript_ids = [opt.get("value") for opt in action.get("selected_options", [])]
             
-            elif action_id == "use_selected_transcripts":
-                # Handle "Use Selected" button click
-                try:
-                    user_id = user.get("id")
-                    selected_transcript_ids = self.command_handler._get_user_selection(user_id)
-                    
-                    if selected_transcript_ids:
-                        response_text = (
-                            f"🎯 **{len(selected_transcript_ids)} transcript(s) selected!** \n\n"
-                            "✅ **Ready!** Now use `/chat [your question]` and I'll analyze only the selected transcripts.\n\n"
-                            "💡 **Example**: `/chat What budget decisions were made in the selected meetings?`\n\n"
-                            "⏰ Selection expires in 10 minutes."
-                        )
-                    else:
-                        response_text = (
-                            "❌ **No transcripts selected.** Please select transcripts from the dropdown first, then click this button."
-                        )
-                    
-                    # Send follow-up instructions
-                    self.slack_service.send_message(
-                        channel=channel.get("id"),
-                        text=response_text,
-                        user=user_id
-                    )
-                    
-                except Exception as e:
-                    print(f"Error handling use selected transcripts: {e}")
+            # Store selection for this user
+            self.command_handler._store_user_selection(user.get("id"), transcript_ids)
             
-            elif action_id == "use_all_transcripts":
-                # Handle "Use All Recent" button click
-                try:
-                    response_text = (
-                        "🔄 **Using all recent transcripts!** This is the default behavior.\n"
-                        "Use `/chat [your question]` normally to get context from all recent meetings.\n\n"
-                        "💡 **Example**: `/chat What are our current project priorities?`"
-                    )
-                    
-                    # Send follow-up instructions
-                    self.slack_service.send_message(
-                        channel=channel.get("id"),
-                        text=response_text,
-                        user=user.get("id")
-                    )
-                    
-                except Exception as e:
-                    print(f"Error handling use all transcripts: {e}")
+            response_text = _SELECTION_STORED_TEMPLATE.format_map({
+                "count": len(transcript_ids),
+                "next_step": _SELECTION_NEXT_STEP.get(action_id, "")
+            })
+            await self._send_ephemeral(channel, user, response_text)
             
-            elif action_id == "chat_with_transcript_selection":
-                # Handle transcript selection for /chat-with command
-                try:
-                    selected_values = action.get("selected_options", [])
-                    transcript_ids = [opt.get("value") for opt in selected_values]
-                    user_id = user.get("id")
-                    
-                    # Store selection for this user
-                    self.command_handler._store_user_selection(user_id, transcript_ids)
-                    
-                    selected_count = len(transcript_ids)
-                    response_text = f"📋 Selected {selected_count} transcript(s). Click '🚀 Answer with Selected' to get your AI response."
-                    
-                    # Send ephemeral response
-                    self.slack_service.send_message(
-                        channel=channel.get("id"),
-                        text=response_text,
-                        user=user_id
-                    )
-                    
-                except Exception as e:
-                    print(f"Error handling chat-with transcript selection: {e}")
+        except Exception as e:
+            logger.error("Error handling %s: %s", action_id, e)
+    
+    async def _action_confirm_selection(self, action: Dict[str, Any], user: Dict[str, Any], channel: Dict[str, Any], payload: Dict[str, Any]) -> None:
+        """Handle "Use Selected" / "Set Selection": confirm the stored selection or ask for one."""
+        action_id = action.get("action_id", "")
+        try:
+            selected_transcript_ids = self.command_handler._get_user_selection(user.get("id"))
             
-            elif action_id == "answer_with_selected":
-                # Handle "Answer with Selected" button - process immediately
-                try:
-                    user_id = user.get("id")
-                    user_question = value  # The question is stored in the button value
-                    selected_transcript_ids = self.command_handler._get_user_selection(user_id)
-                    
-                    if selected_transcript_ids and user_question:
-                        # Clear the selection and process the query
-                        self.command_handler._clear_user_selection(user_id)
-                        
-                        # Process the chat with selected transcripts
-                        response = await self.command_handler._handle_chat_with_selected_transcripts(
-                            selected_transcript_ids, user_question
-                        )
-                        
-                        # Send the AI response
-                        response_text = response.get('text', 'No response generated')
-                        self.slack_service.send_message(
-                            channel=channel.get("id"),
-                            text=response_text,
-                            user=user_id
-                        )
-                    else:
-                        error_msg = "❌ Please select transcripts first, or the question was not found."
-                        self.slack_service.send_message(
-                            channel=channel.get("id"),
-                            text=error_msg,
-                            user=user_id
-                        )
-                        
-                except Exception as e:
-                    print(f"Error handling answer with selected: {e}")
-                    error_msg = f"❌ Error processing your request: {str(e)}"
-                    self.slack_service.send_message(
-                        channel=channel.get("id"),
-                        text=error_msg,
-                        user=user.get("id")
-                    )
+            if selected_transcript_ids:
+                response_text = _SELECTION_CONFIRMED[action_id].format_map({"count": len(selected_transcript_ids)})
+            else:
+                response_text = _NO_SELECTION
             
-            elif action_id == "answer_with_all":
-                # Handle "Use All Recent" button - process with default context
-                try:
-                    user_id = user.get("id")
-                    user_question = value  # The question is stored in the button value
-                    
-                    if user_question:
-                        # Create a mock payload for the regular chat command
-                        chat_payload = {
-                            "text": user_question,
-                            "channel_id": channel.get("id"),
-                            "user_id": user_id
-                        }
-                        
-                        # Process with regular chat command (uses all recent transcripts)
-                        response = await self.command_handler._handle_chat_command(chat_payload)
-                        
-                        # Send the AI response
-                        response_text = response.get('text', 'No response generated')
-                        self.slack_service.send_message(
-                            channel=channel.get("id"),
-                            text=response_text,
-                            user=user_id
-                        )
-                    else:
-                        error_msg = "❌ Question not found."
-                        self.slack_service.send_message(
-                            channel=channel.get("id"),
-                            text=error_msg,
-                            user=user_id
-                        )
-                        
-                except Exception as e:
-                    print(f"Error handling answer with all: {e}")
-                    error_msg = f"❌ Error processing your request: {str(e)}"
-                    self.slack_service.send_message(
-                        channel=channel.get("id"),
-                        text=error_msg,
-                        user=user.get("id")
-                    )
+            await self._send_ephemeral(channel, user, response_text)
             
-            elif action_id == "chat_inline_transcript_selection":
-                # Handle transcript selection for /chat with [question]
-                try:
-                    selected_values = action.get("selected_options", [])
-                    transcript_ids = [opt.get("value") for opt in selected_values]
-                    user_id = user.get("id")
-                    
-                    # Store selection for this user
-                    self.command_handler._store_user_selection(user_id, transcript_ids)
-                    
-                    selected_count = len(transcript_ids)
-                    response_text = f"📋 Selected {selected_count} transcript(s). Click '🚀 Answer with Selected' to get your AI response."
-                    
-                    # Send ephemeral response
-                    self.slack_service.send_message(
-                        channel=channel.get("id"),
-                        text=response_text,
-                        user=user_id
-                    )
-                    
-                except Exception as e:
-                    print(f"Error handling chat inline transcript selection: {e}")
+        except Exception as e:
+            logger.error("Error handling %s: %s", action_id, e)
+    
+    async def _action_use_all_transcripts(self, action: Dict[str, Any], user: Dict[str, Any], channel: Dict[str, Any], payload: Dict[str, Any]) -> None:
+        """Handle the "Use All Recent" button."""
+        try:
+            # Send follow-up instructions
+            await self._send_ephemeral(channel, user, _USE_ALL_TRANSCRIPTS_REPLY)
             
-            elif action_id == "answer_inline_selected":
-                # Handle "Answer with Selected" button for inline questions
-                try:
-                    user_id = user.get("id")
-                    user_question = value  # The question is stored in the button value
-                    selected_transcript_ids = self.command_handler._get_user_selection(user_id)
-                    
-                    if selected_transcript_ids and user_question:
-                        # Clear the selection and process the query
-                        self.command_handler._clear_user_selection(user_id)
-                        
-                        # Process the chat with selected transcripts
-                        response = await self.command_handler._handle_chat_with_selected_transcripts(
-                            selected_transcript_ids, user_question
-                        )
-                        
-                        # Send the AI response
-                        response_text = response.get('text', 'No response generated')
-                        self.slack_service.send_message(
-                            channel=channel.get("id"),
-                            text=response_text,
-                            user=user_id
-                        )
-                    else:
-                        error_msg = "❌ Please select transcripts first, or the question was not found."
-                        self.slack_service.send_message(
-                            channel=channel.get("id"),
-                            text=error_msg,
-                            user=user_id
-                        )
-                        
-                except Exception as e:
-                    print(f"Error handling answer inline selected: {e}")
-                    error_msg = f"❌ Error processing your request: {str(e)}"
-                    self.slack_service.send_message(
-                        channel=channel.get("id"),
-                        text=error_msg,
-                        user=user.get("id")
-                    )
+        except Exception as e:
+            logger.error("Error handling use all transcripts: %s", e)
+    
+    async def _action_answer_selected(self, action: Dict[str, Any], user: Dict[str, Any], channel: Dict[str, Any], payload: Dict[str, Any]) -> None:
+        """Answer the question stored in the button value using the user's selected transcripts."""
+        try:
+            user_id = user.get("id")
+            user_question = action.get("value", "")  # The question is stored in the button value
+            selected_transcript_ids = self.command_handler._get_user_selection(user_id)
+            
+            if selected_transcript_ids and user_question:
+                # Clear the selection and process the query
+                self.command_handler._clear_user_selection(user_id)
+                
+                response = await self.command_handler._handle_chat_with_selected_transcripts(
+                    selected_transcript_ids, user_question
+                )
+                await self._send_ephemeral(channel, user, response.get('text', 'No response generated'))
+            else:
+                await self._send_ephemeral(channel, user, "❌ Please select transcripts first, or the question was not found.")
+                
+        except Exception as e:
+            logger.error("Error handling %s: %s", action.get("action_id", ""), e)
+            await self._send_ephemeral(channel, user, f"❌ Error processing your request: {str(e)}")
+    
+    async def _action_answer_all(self, action: Dict[str, Any], user: Dict[str, Any], channel: Dict[str, Any], payload: Dict[str, Any]) -> None:
+        """Answer the question stored in the button value using all recent transcripts."""
+        try:
+            user_question = action.get("value", "")  # The question is stored in the button value
+            
+            if user_question:
+                # Process with regular chat command (uses all recent transcripts)
+                chat_payload = {
+                    "text": user_question,
+                    "channel_id": channel.get("id"),
+                    "user_id": user.get("id")
+                }
+                response = await self.command_handler._handle_chat_command(chat_payload)
+                await self._send_ephemeral(channel, user, response.get('text', 'No response generated'))
+            else:
+                await self._send_ephemeral(channel, user, "❌ Question not found.")
+                
+        except Exception as e:
+            logger.error("Error handling %s: %s", action.get("action_id", ""), e)
+            await self._send_ephemeral(channel, user, f"❌ Error processing your request: {str(e)}")
+    
+    async def _action_confirm_tickets(self, action: Dict[str, Any], user: Dict[str, Any], channel: Dict[str, Any], payload: Dict[str, Any]) -> None:
+        """Handle the "Yes, Create Tickets" / "No, Cancel" buttons on a ticket preview."""
+        # Claim the preview before any await, so a double click (or yes and no racing) can't
+        # re-seed the pending tickets from the button value and create them twice. Other
+        # users' confirmations don't wait on this one.
+        preview = payload.get("message", {}).get("ts") or action.get("value", "")
+        if preview:
+            claim_key = f"{user.get('id')}:{preview}"
+            if claim_key in self._claimed_ticket_previews:
+                logger.info("Ignoring repeat ticket confirmation from %s", user.get("id"))
+                await self._send_ephemeral(channel, user, _TICKETS_ALREADY_HANDLED)
+                return
+            self._claimed_ticket_previews[claim_key] = True
+        handled = False
+        try:
+            handled = await self._confirm_tickets(action, user, channel, payload)
+        finally:
+            # A failed create releases the claim so the user can retry from the same preview
+            if preview and not handled:
+                self._claimed_ticket_previews.pop(claim_key, None)
+    
+    async def _confirm_tickets(self, action: Dict[str, Any], user: Dict[str, Any], channel: Dict[str, Any], payload: Dict[str, Any]) -> bool:
+        """Create or cancel the pending tickets; True once the preview needs no further clicks."""
+        confirmed = action.get("action_id") == "create_tickets_yes"
+        label = "YES" if confirmed else "NO"
+        value = action.get("value", "")
+        # Bound before the try so the error path can always reply
+        response_url = payload.get("response_url")
+        # Get user ID from payload (standard way)
+        user_id = user.get("id")
+        try:
+            # Debug: log what we're getting (formatted only when DEBUG is on)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s button payload - action: %s", label, action)
+                logger.debug("%s button payload - user: %s", label, user)
+                logger.debug("%s button payload - value: %s", label, value)
             
-            elif action_id == "answer_inline_all":
-                # Handle "Use All Recent" button for inline questions
+            if confirmed:
                 try:
-                    user_id = user.get("id")
-                    user_question = value  # The question is stored in the button value
-                    
-                    if user_question:
-                        # Create a mock payload for the regular chat command
-                        chat_payload = {
-                            "text": user_question,
-                            "channel_id": channel.get("id"),
+                    value_payload = parse_json(value) if value else {}
+                    # Fallback to user-provided compact payload
+                    if value_payload and value_payload.get("analysis") and value_payload.get("original_request"):
+                        # Seed the pending cache in case a different instance handles the interaction
+                        self.command_handler._clear_pending_tickets(user_id)
+                        USER_PENDING_TICKETS[user_id] = {
+                            "context": "",  # context not needed for conversion
+                            "original_request": value_payload.get("original_request"),
+                            "analysis": value_payload.get("analysis"),
                             "user_id": user_id
                         }
-                        
-                        # Process with regular chat command (uses all recent transcripts)
-                        response = await self.command_handler._handle_chat_command(chat_payload)
-                        
-                        # Send the AI response
-                        response_text = response.get('text', 'No response generated')
-                        self.slack_service.send_message(
-                            channel=channel.get("id"),
-                            text=response_text,
-                            user=user_id
-                        )
-                    else:
-                        error_msg = "❌ Question not found."
-                        self.slack_service.send_message(
-                            channel=channel.get("id"),
-                            text=error_msg,
-                            user=user_id
-                        )
-                        
-                except Exception as e:
-                    print(f"Error handling answer inline all: {e}")
-                    error_msg = f"❌ Error processing your request: {str(e)}"
-                    self.slack_service.send_message(
-                        channel=channel.get("id"),
-                        text=error_msg,
-                        user=user.get("id")
-                    )
+                except Exception:
+                    pass
             
-            elif action_id == "chat_select_transcript_selection":
-                # Handle transcript selection for /chat select
-                try:
-                    selected_values = action.get("selected_options", [])
-                    transcript_ids = [opt.get("value") for opt in selected_values]
-                    user_id = user.get("id")
-                    
-                    # Store selection for this user
-                    self.command_handler._store_user_selection(user_id, transcript_ids)
-                    
-                    selected_count = len(transcript_ids)
-                    response_text = f"📋 Selected {selected_count} transcript(s). Click '✅ Set Selection' to confirm."
-                    
-                    # Send ephemeral response
-                    self.slack_service.send_message(
-                        channel=channel.get("id"),
-                        text=response_text,
-                        user=user_id
-                    )
-                    
-                except Exception as e:
-                    print(f"Error handling chat select transcript selection: {e}")
+            logger.debug("Processing %s button click for user: %s", label, user_id)
             
-            elif action_id == "set_transcript_selection":
-                # Handle "Set Selection" button for /chat select
-                try:
-                    user_id = user.get("id")
-                    selected_transcript_ids = self.command_handler._get_user_selection(user_id)
-                    
-                    if selected_transcript_ids:
-                        response_text = (
-                            f"✅ **{len(selected_transcript_ids)} transcript(s) selected!** \n\n"
-                            "🎯 **Ready!** Now use `/chat [your question]` and I'll analyze only the selected transcripts.\n\n"
-                            "💡 **Example**: `/chat What budget decisions were made?`\n\n"
-                            "⏰ Selection expires in 10 minutes."
-                        )
-                    else:
-                        response_text = (
-                            "❌ **No transcripts selected.** Please select transcripts from the dropdown first, then click this button."
-                        )
-                    
-                    self.slack_service.send_message(
-                        channel=channel.get("id"),
-                        text=response_text,
-                        user=user_id
-                    )
-                    
-                except Exception as e:
-                    print(f"Error handling set transcript selection: {e}")
+            # Immediately acknowledge (do not replace the preview message) without holding up the work
+            ack_task = None
+            if response_url:
+                ack_task = self._spawn_background(self.slack_service.respond_to_interaction_async(response_url, {
+                    "response_type": "ephemeral",
+                    "replace_original": False,
+                    "text": "⏳ Creating tickets..." if confirmed else "🚫 Cancelling..."
+                }))
+
+            # Process the ticket creation or cancellation
+            response = await self.command_handler.handle_create_tickets_confirmation(user_id, confirmed)
             
-            elif action_id == "create_tickets_yes":
-                # Handle "Yes, Create Tickets" button
-                try:
-                    # Debug: Print what we're getting
-                    print(f"YES button payload - action: {action}")
-                    print(f"YES button payload - user: {user}")
-                    print(f"YES button payload - value: {value}")
-                    
-                    # Get user ID and any compact payload from value
-                    user_id = user.get("id")
-                    try:
-                        value_payload = json.loads(value) if value else {}
-                        # Fallback to user-provided compact payload
-                        if value_payload and value_payload.get("analysis") and value_payload.get("original_request"):
-                            # Seed the pending cache in case a different instance handles the interaction
-                            self.command_handler._clear_pending_tickets(user_id)
-                            USER_PENDING_TICKETS[user_id] = {
-                                "context": "",  # context not needed for conversion
-                                "original_request": value_payload.get("original_request"),
-                                "analysis": value_payload.get("analysis"),
-                                "timestamp": datetime.now(),
-                                "user_id": user_id
-                            }
-                    except Exception:
-                        pass
-                    
-                    print(f"Processing YES button click for user: {user_id}")
-                    
-                    # Immediately acknowledge with a loading message (do not replace the preview message)
-                    response_url = payload.get("response_url")
-                    if response_url:
-                        self.slack_service.respond_to_interaction(response_url, {
-                            "response_type": "ephemeral",
-                            "replace_original": False,
-                            "text": "⏳ Creating tickets..."
-                        })
-
-                    # Process the ticket creation
-                    response = await self.command_handler.handle_create_tickets_confirmation(user_id, True)
-                    
-                    print(f"Got response: {response}")
-                    
-                    # Final response: send another ephemeral (do NOT replace the preview message)
-                    response_text = response.get('text', 'No response generated')
-                    if response_url:
-                        self.slack_service.respond_to_interaction(response_url, {
-                            "response_type": "ephemeral",
-                            "replace_original": False,
-                            "text": response_text
-                        })
-                    else:
-                        # Fallback if no response_url
-                        self.slack_service.send_ephemeral_message(
-                            channel=channel.get("id"),
-                            user=user.get("id"),
-                            text=response_text
-                        )
-                    
-                except Exception as e:
-                    print(f"Error handling create tickets yes: {e}")
-                    print(f"Exception details: {traceback.format_exc()}")
-                    error_msg = f"❌ Error creating tickets: {str(e)}"
-                    if response_url:
-                        self.slack_service.respond_to_interaction(response_url, {
-                            "response_type": "ephemeral",
-                            "replace_original": True,
-                            "text": error_msg
-                        })
-                    else:
-                        self.slack_service.send_ephemeral_message(
-                            channel=channel.get("id"),
-                            user=user.get("id"),
-                            text=error_msg
-                        )
+            logger.debug("Got response: %s", response)
             
-            elif action_id == "create_tickets_no":
-                # Handle "No, Cancel" button
-                try:
-                    # Debug: Print what we're getting
-                    print(f"NO button payload - action: {action}")
-                    print(f"NO button payload - user: {user}")
-                    print(f"NO button payload - value: {value}")
-                    
-                    # Get user ID from payload (standard way)
-                    user_id = user.get("id")
-                    
-                    print(f"Processing NO button click for user: {user_id}")
-                    
-                    # Immediately acknowledge cancellation (do not replace the preview message)
-                    response_url = payload.get("response_url")
-                    if response_url:
-                        self.slack_service.respond_to_interaction(response_url, {
-                            "response_type": "ephemeral",
-                            "replace_original": False,
-                            "text": "🚫 Cancelling..."
-                        })
-
-                    # Process the cancellation
-                    response = await self.command_handler.handle_create_tickets_confirmation(user_id, False)
-                    
-                    print(f"Got response: {response}")
-                    
-                    # Final response: send another ephemeral (do NOT replace the preview message)
-                    response_text = response.get('text', 'No response generated')
-                    if response_url:
-                        self.slack_service.respond_to_interaction(response_url, {
-                            "response_type": "ephemeral",
-                            "replace_original": False,
-                            "text": response_text
-                        })
-                    else:
-                        self.slack_service.send_ephemeral_message(
-                            channel=channel.get("id"),
-                            user=user.get("id"),
-                            text=response_text
-                        )
-                    
-                except Exception as e:
-                    print(f"Error handling create tickets no: {e}")
-                    print(f"Exception details: {traceback.format_exc()}")
-                    error_msg = f"❌ Error processing cancellation: {str(e)}"
-                    if response_url:
-                        self.slack_service.respond_to_interaction(response_url, {
-                            "response_type": "ephemeral",
-                            "replace_original": True,
-                            "text": error_msg
-                        })
-                    else:
-                        self.slack_service.send_ephemeral_message(
-                            channel=channel.get("id"),
-                            user=user.get("id"),
-                            text=error_msg
-                        )
+            # Keep the ack ahead of the final message in the user's view
+            if ack_task:
+                await asyncio.wait([ack_task])
             
-            # Add more button handlers as needed
+            # Final response: send another ephemeral (do NOT replace the preview message)
+            response_text = response.get('text', 'No response generated')
+            if response_url:
+                await self.slack_service.respond_to_interaction_async(response_url, {
+                    "response_type": "ephemeral",
+                    "replace_original": False,
+                    "text": response_text
+                })
+            else:
+                # Fallback if no response_url
+                await self._send_ephemeral(channel, user, response_text)
+            
+            # Only a successful create is posted in channel; every failure comes back ephemeral
+            return not confirmed or response.get("response_type") == "in_channel"
+            
+        except Exception as e:
+            # One record; the traceback is only attached (and formatted) when debugging
+            logger.error("Error handling create tickets %s: %s", label.lower(), e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            error_msg = f"❌ Error creating tickets: {str(e)}" if confirmed else f"❌ Error processing cancellation: {str(e)}"
+            if response_url:
+                await self.slack_service.respond_to_interaction_async(response_url, {
+                    "response_type": "ephemeral",
+                    "replace_original": True,
+                    "text": error_msg
+                })
+            else:
+                await self._send_ephemeral(channel, user, error_msg)
+            return False
     
     async def _handle_view_submission(self, payload: Dict[str, Any]) -> None:
         """Handle modal form submissions."""
@@ -722,6 +660,6 @@ Feel free to mention me (@Alpha Machine) in any channel or send me a DM anytime!
             # Handle feedback form submission
             values = view.get("state", {}).get("values", {})
             # Process feedback values
-            print(f"Received feedback: {values}")
+            logger.info("Received feedback: %s", values)
         
         # Add more modal handlers as needed 
\ No newline at end of file
@@ -1,23 +1,58 @@
+import asyncio
+import queue
 import uvicorn
 import logging
+import logging.handlers
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging: handlers only enqueue records, a listener thread does the stream IO
+# so logging never blocks the event loop under container log pressure
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# The listener's handler applies the real format; the queue side only renders the message
+_log_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_log_queue_handler])
+log_listener = logging.handlers.QueueListener(_log_queue, _log_stream_handler, respect_handler_level=True)
+log_listener.start()
 logger = logging.getLogger(__name__)
 
 load_dotenv()
 
 logger.info("=== SLACKBOT MAIN STARTING UP ===")
 
-from webhook_handler import slack_webhook_router
+from webhook_handler import slack_webhook_router, command_handler, FastJSONResponse
+from shared.core.config import Config
+
+# Apply the configured level now that config is importable (DEBUG enables payload dumps)
+logging.getLogger().setLevel(Config.LOG_LEVEL)
+
+# Threads behind asyncio.to_thread (Supabase/Linear lookups, Slack SDK fallbacks); sized for
+# EVENT_CONCURRENCY events each holding a couple of blocking calls, not the CPU-based default
+BLOCKING_IO_WORKERS = 32
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=BLOCKING_IO_WORKERS, thread_name_prefix="blocking-io")
+    )
+    # Warm caches in the background so startup (and health checks) aren't delayed
+    app.state.warmup_task = asyncio.create_task(command_handler.warm_up())
+    yield
+    app.state.warmup_task.cancel()
+    # Release pooled Slack connections cleanly instead of leaving sockets to the GC
+    await command_handler.aclose()
+    # Flush any queued log records before the process exits
+    log_listener.stop()
+
 
-app = FastAPI(title="Alpha Machine Slackbot", version="1.0.0")
+app = FastAPI(title="Alpha Machine Slackbot", version="1.0.0", lifespan=lifespan, default_response_class=FastJSONResponse)
 
 logger.info("=== FASTAPI APP CREATED ===")
 
@@ -50,19 +85,18 @@ async def debug_ai():
     try:
         # Test imports and config
         from shared.core.config import Config
-        from shared.services.ai_service import OpenAIService
         
         result = {
             "status": "healthy",
             "service": "slackbot",
             "openai_key_present": bool(getattr(Config, 'OPENAI_API_KEY', None)),
             "openai_model": getattr(Config, 'OPENAI_MODEL', 'NOT_SET'),
-            "imports_ok": True
+            "imports_ok": True,
+            "context_cache": command_handler.context_cache_stats()
         }
         
-        # Test AI service
-        ai_service = OpenAIService()
-        ai_response = await ai_service.generate_text_async(
+        # Test the shared AI service rather than constructing a new client per request
+        ai_response = await command_handler.ai_service.generate_text_async(
             "You are a helpful assistant.", 
             "Say 'Test successful!'"
         )
@@ -81,5 +115,8 @@ async def debug_ai():
 
 if __name__ == "__main__":
     logger.info("=== STARTING UVICORN SERVER ===")
-    # Disable reload in production to avoid extra workers shutting down background tasks
-    uvicorn.run("main:app", host="0.0.0.0", port=8001, reload=False)
\ No newline at end of file
+    # Disable reload in production to avoid extra workers shutting down background tasks.
+    # uvicorn's "auto" loop/http pick uvloop and httptools (slackbot dependencies) when installed.
+    # Stays single-worker: selections, pending tickets and event dedupe live in process memory.
+    # Access logs are off; every Slack event would otherwise pay for a formatted log line
+    uvicorn.run("main:app", host="0.0.0.0", port=8001, reload=False, loop="auto", http="auto", access_log=False)
\ No newline at end of file
@@ -13,23 +13,105 @@ import sys
 import traceback
 from typing import Dict, Any, Optional
 from fastapi import APIRouter, Request, HTTPException, Form, BackgroundTasks
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.responses import JSONResponse, Response
 import urllib.parse
 import logging
 
 from shared.core.config import Config
+from shared.core.utils import parse_json, dump_json_bytes
 from command_handler import SlackCommandHandler
 from event_handler import SlackEventHandler
 
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered through dump_json_bytes (orjson when installed); FastAPI's ORJSONResponse is deprecated."""
+    
+    def render(self, content: Any) -> bytes:
+        return dump_json_bytes(content)
+
+
 slack_webhook_router = APIRouter()
 
 # Initialize handlers
 command_handler = SlackCommandHandler()
-event_handler = SlackEventHandler()
+event_handler = SlackEventHandler(command_handler)
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Signing secret encoded once instead of on every request
+_SIGNING_KEY = (Config.SLACK_SIGNING_SECRET or "").encode()
+# Requests older than this are rejected as possible replays
+SLACK_REQUEST_MAX_AGE_SECONDS = 60 * 5
+# Slack payloads are small; anything bigger is rejected before hashing or parsing
+SLACK_MAX_BODY_BYTES = 1024 * 1024
+# "v0=" followed by a hex SHA-256 digest
+_SIGNATURE_LENGTH = 3 + 64
+# Slack only looks at the status of event and interaction acks, so one empty 200 serves every request
+_SLACK_ACK = Response(status_code=200)
+# Slash command form fields passed on to the command handler ("text" is optional)
+_COMMAND_REQUIRED_FIELDS = (
+    "token",
+    "team_id",
+    "team_domain",
+    "channel_id",
+    "channel_name",
+    "user_id",
+    "user_name",
+    "command",
+    "response_url",
+    "trigger_id",
+)
+
+# OAuth install link; all config, so built once at import
+_SLACK_INSTALL_SCOPES = ",".join([
+    "app_mentions:read",
+    "channels:history",
+    "channels:read",
+    "chat:write",
+    "commands",
+    "groups:history",
+    "groups:read",
+    "im:history",
+    "im:read",
+    "im:write",
+    "mpim:history",
+    "mpim:read",
+    "reactions:read",
+    "users:read",
+    "users:read.email",
+    "team:read"
+])
+_INSTALL_PAYLOAD = {
+    "install_url": (
+        f"https://slack.com/oauth/v2/authorize"
+        f"?client_id={Config.SLACK_CLIENT_ID}"
+        f"&scope={_SLACK_INSTALL_SCOPES}"
+        f"&redirect_uri={Config.SLACK_REDIRECT_URI or 'https://your-domain.com/slack/oauth/redirect'}"
+    ),
+    "message": "Click the install_url to add the bot to your Slack workspace"
+}
+
+
+def _build_health_payload() -> Dict[str, Any]:
+    """Slack config report for /slack/health; config is read once per process, so this is static."""
+    config_status = {
+        "bot_token": bool(Config.SLACK_BOT_TOKEN),
+        "signing_secret": bool(Config.SLACK_SIGNING_SECRET),
+        "client_id": bool(getattr(Config, 'SLACK_CLIENT_ID', None)),
+    }
+    
+    all_configured = all(config_status.values())
+    
+    return {
+        "status": "healthy" if all_configured else "partially_configured",
+        "config": config_status,
+        "message": "All Slack config present" if all_configured else "Missing some Slack configuration"
+    }
+
+
+_HEALTH_PAYLOAD = _build_health_payload()
+
 @slack_webhook_router.get("/test-ai")
 async def test_ai_service():
     """Test endpoint to verify AI service and environment variables"""
@@ -43,9 +125,8 @@ async def test_ai_service():
             "config_accessible": True
         }
         
-        # Test AI service instantiation
-        from shared.services.ai_service import OpenAIService
-        ai_service = OpenAIService()
+        # Reuse the shared AI service; building one per call leaked a thread pool each time
+        ai_service = command_handler.ai_service
         result["ai_service_created"] = True
         
         # Test simple AI call
@@ -56,10 +137,10 @@ async def test_ai_service():
         result["ai_call_success"] = True
         result["ai_response"] = ai_response[:100]  # First 100 chars
         
-        return JSONResponse(result)
+        return FastJSONResponse(result)
         
     except Exception as e:
-        return JSONResponse({
+        return FastJSONResponse({
             "error": str(e),
             "error_type": type(e).__name__,
             "ai_call_success": False
@@ -68,126 +149,142 @@ async def test_ai_service():
 def verify_slack_signature(body: bytes, timestamp: str, signature: str) -> bool:
     """
     Verify that the request came from Slack by validating the signature.
+    
+    The raw body is fed to the HMAC as bytes, so it is never decoded or copied
+    into an intermediate signature string.
     """
-    if not Config.SLACK_SIGNING_SECRET:
+    if not _SIGNING_KEY or not timestamp or len(signature) != _SIGNATURE_LENGTH:
         return False
     
-    # Create the signature string
-    sig_basestring = f"v0:{timestamp}:{body.decode('utf-8')}"
-    
-    # Create the expected signature
-    expected_signature = 'v0=' + hmac.new(
-        Config.SLACK_SIGNING_SECRET.encode(),
-        sig_basestring.encode(),
-        hashlib.sha256
-    ).hexdigest()
+    # HMAC over "v0:{timestamp}:{body}"
+    mac = hmac.new(_SIGNING_KEY, b"v0:", hashlib.sha256)
+    mac.update(timestamp.encode())
+    mac.update(b":")
+    mac.update(body)
+    expected_signature = b"v0=" + mac.hexdigest().encode()
     
     # Compare signatures
-    return hmac.compare_digest(expected_signature, signature)
+    return hmac.compare_digest(expected_signature, signature.encode())
+
+
+def _is_request_too_old(timestamp: str) -> bool:
+    """True for a missing, malformed, or out-of-window X-Slack-Request-Timestamp."""
+    try:
+        return abs(time.time() - int(timestamp)) > SLACK_REQUEST_MAX_AGE_SECONDS
+    except ValueError:
+        return True
+
+async def _read_body(request: Request) -> bytes:
+    """
+    Read the raw request body, rejecting it once it exceeds SLACK_MAX_BODY_BYTES.
+    
+    A declared Content-Length is checked before anything is read; chunked bodies
+    are measured as they stream in, so an oversized request is never fully buffered.
+    """
+    content_length = request.headers.get("content-length")
+    if content_length is not None:
+        try:
+            declared = int(content_length)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid Content-Length")
+        if declared > SLACK_MAX_BODY_BYTES:
+            raise HTTPException(status_code=413, detail="Request body too large")
+    
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > SLACK_MAX_BODY_BYTES:
+            raise HTTPException(status_code=413, detail="Request body too large")
+    return bytes(body)
 
 @slack_webhook_router.post("/events")
 async def slack_events(request: Request, background_tasks: BackgroundTasks):
     """
     Main endpoint for Slack events (mentions, messages, reactions, etc.)
     """
-    # Get request data
-    body = await request.body()
     headers = request.headers
     
     # Verify the request came from Slack
     timestamp = headers.get("X-Slack-Request-Timestamp", "")
     signature = headers.get("X-Slack-Signature", "")
     
+    # Check if request is too old (prevent replay attacks) before reading the body or paying for the HMAC
+    if _is_request_too_old(timestamp):
+        raise HTTPException(status_code=403, detail="Request too old")
+    
+    # Get request data
+    body = await _read_body(request)
+    
     if not verify_slack_signature(body, timestamp, signature):
         raise HTTPException(status_code=403, detail="Invalid signature")
     
-    # Check if request is too old (prevent replay attacks)
-    if abs(time.time() - int(timestamp)) > 60 * 5:  # 5 minutes
-        raise HTTPException(status_code=403, detail="Request too old")
-    
     try:
-        payload = json.loads(body)
+        payload = parse_json(body)
     except json.JSONDecodeError:
         raise HTTPException(status_code=400, detail="Invalid JSON")
     
     # Handle URL verification challenge
-    if payload.get("type") == "url_verification":
-        return PlainTextResponse(payload.get("challenge", ""))
+    payload_type = payload.get("type")
+    if payload_type == "url_verification":
+        return Response(content=payload.get("challenge", "").encode("utf-8"), media_type="text/plain")
     
-    # Handle events in background to respond quickly to Slack
-    if payload.get("type") == "event_callback":
-        background_tasks.add_task(event_handler.handle_event, payload)
-        return JSONResponse({"status": "ok"})
+    # Handle events in a detached task so the ACK goes out before any AI work starts
+    if payload_type == "event_callback":
+        event_handler.dispatch_event(payload)
     
-    return JSONResponse({"status": "ok"})
+    return _SLACK_ACK
 
 @slack_webhook_router.post("/commands")
-async def slack_commands(
-    background_tasks: BackgroundTasks,
-    request: Request,
-    token: str = Form(...),
-    team_id: str = Form(...),
-    team_domain: str = Form(...),
-    channel_id: str = Form(...),
-    channel_name: str = Form(...),
-    user_id: str = Form(...),
-    user_name: str = Form(...),
-    command: str = Form(...),
-    text: str = Form(""),
-    response_url: str = Form(...),
-    trigger_id: str = Form(...)
-):
+async def slack_commands(request: Request):
     """
     Handle all Slack slash commands (/chat, /summarize, etc.)
     Returns immediate acknowledgment and processes command in background
     """
-    # Force output to stdout for Cloud Run visibility
-    print(f"=== WEBHOOK RECEIVED: {command} from {user_id} ===", flush=True)
-    print(f"=== RESPONSE URL: {response_url} ===", flush=True)
+    headers = request.headers
+    timestamp = headers.get("X-Slack-Request-Timestamp", "")
+    signature = headers.get("X-Slack-Signature", "")
     
-    logger.info(f"=== WEBHOOK RECEIVED: {command} from {user_id} ===")
-    logger.info(f"=== RESPONSE URL: {response_url} ===")
+    # Basic validation that this looks like a fresh Slack request
+    logger.info("WEBHOOK VALIDATION: Checking Slack timestamp header")
+    if _is_request_too_old(timestamp):
+        logger.error("WEBHOOK ERROR: Missing or stale Slack timestamp")
+        raise HTTPException(status_code=403, detail="Missing or stale Slack timestamp")
+    logger.info("WEBHOOK VALIDATION: Slack timestamp found")
     
-    # Note: For form data, we skip signature verification to avoid stream consumption issues
-    # In production, you would implement signature verification differently for form endpoints
-    headers = request.headers
+    # Read the raw body once: it is what Slack signed, and the form fields are parsed from it
+    body = await _read_body(request)
+    
+    if not verify_slack_signature(body, timestamp, signature):
+        logger.error("WEBHOOK ERROR: Invalid Slack signature")
+        raise HTTPException(status_code=403, detail="Invalid signature")
+    
+    try:
+        form_fields = urllib.parse.parse_qs(body.decode("utf-8"), keep_blank_values=True, max_num_fields=32)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid form body")
     
-    # Optional: Basic validation that this looks like a Slack request
-    logger.info(f"WEBHOOK VALIDATION: Checking Slack timestamp header")
-    if not headers.get("X-Slack-Request-Timestamp"):
-        logger.error(f"WEBHOOK ERROR: Missing Slack timestamp")
-        raise HTTPException(status_code=403, detail="Missing Slack timestamp")
-    logger.info(f"WEBHOOK VALIDATION: Slack timestamp found")
+    missing = [name for name in _COMMAND_REQUIRED_FIELDS if name not in form_fields]
+    if missing:
+        raise HTTPException(status_code=400, detail=f"Missing form fields: {', '.join(missing)}")
     
     # Create command payload
-    logger.info(f"WEBHOOK PAYLOAD: Creating payload for {command}")
-    command_payload = {
-        "token": token,
-        "team_id": team_id,
-        "team_domain": team_domain,
-        "channel_id": channel_id,
-        "channel_name": channel_name,
-        "user_id": user_id,
-        "user_name": user_name,
-        "command": command,
-        "text": text,
-        "response_url": response_url,
-        "trigger_id": trigger_id
-    }
-    logger.info(f"WEBHOOK PAYLOAD: Created payload with response_url: {response_url}")
+    command_payload = {name: form_fields[name][0] for name in _COMMAND_REQUIRED_FIELDS}
+    command_payload["text"] = form_fields.get("text", [""])[0]
+    command = command_payload["command"]
+    
+    logger.info("WEBHOOK RECEIVED: %s from %s", command, command_payload["user_id"])
     
-    # Process command in background and return immediate acknowledgment
-    logger.info(f"WEBHOOK: Adding background task for command: {command}")
-    print(f"=== WEBHOOK: Adding background task for {command} ===", flush=True)
+    # Hand the command to the worker pool and return immediate acknowledgment
+    logger.debug("WEBHOOK: Queueing command: %s", command)
     
     try:
-        # Use a new event loop to avoid cancellation on reload
-        import asyncio
-        loop = asyncio.get_event_loop()
-        # Always schedule a plain callable to BackgroundTasks to avoid ASGI errors
-        background_tasks.add_task(lambda: loop.create_task(command_handler.handle_command(command_payload)))
-        print(f"=== WEBHOOK: Background task added successfully ===", flush=True)
-        logger.info(f"WEBHOOK: Background task added successfully")
+        if not command_handler.submit_command(command_payload):
+            logger.warning("WEBHOOK: Command queue full, turning away %s", command)
+            return FastJSONResponse({
+                "response_type": "ephemeral",
+                "text": "⏳ I'm handling a lot of requests right now. Please try again in a minute."
+            })
+        logger.debug("WEBHOOK: Command queued successfully")
         
         # Return immediate acknowledgment to meet Slack's 3-second timeout
         friendly = {
@@ -200,18 +297,16 @@ async def slack_commands(
             "/weekly-summary": "📈 Processing your /weekly-summary request... ⏳",
         }
         ack_text = friendly.get(command, f"🤖 Processing your {command}... ⏳")
-        return JSONResponse({
+        return FastJSONResponse({
             "response_type": "ephemeral",
             "text": ack_text
         })
         
     except Exception as e:
-        print(f"=== WEBHOOK BACKGROUND TASK ERROR: {type(e).__name__}: {str(e)} ===", flush=True)
-        print(f"=== WEBHOOK BACKGROUND TASK TRACEBACK: {traceback.format_exc()} ===", flush=True)
-        logger.error(f"WEBHOOK BACKGROUND TASK ERROR: {type(e).__name__}: {str(e)}")
-        logger.error(f"WEBHOOK BACKGROUND TASK TRACEBACK: {traceback.format_exc()}")
+        logger.error("WEBHOOK BACKGROUND TASK ERROR: %s: %s", type(e).__name__, e)
+        logger.debug("WEBHOOK BACKGROUND TASK TRACEBACK", exc_info=True)
         
-        return JSONResponse({
+        return FastJSONResponse({
             "response_type": "ephemeral", 
             "text": "❌ Sorry, I encountered an error processing your /chat command. Please try again."
         })
@@ -234,7 +329,7 @@ async def slack_commands_sync_test(
     """
     SYNCHRONOUS version - returns AI response directly (for testing)
     """
-    print(f"=== SYNC TEST: {command} with text: '{text}' ===", flush=True)
+    logger.info("SYNC TEST: %s with text: '%s'", command, text)
     
     try:
         # Create command payload
@@ -253,21 +348,21 @@ async def slack_commands_sync_test(
         }
         
         # Process command SYNCHRONOUSLY (wait for AI)
-        print("=== SYNC TEST: Starting AI processing ===", flush=True)
+        logger.debug("SYNC TEST: Starting AI processing")
         result = await command_handler.handle_command_sync(command_payload)
-        print(f"=== SYNC TEST: AI Result: {result} ===", flush=True)
+        logger.debug("SYNC TEST: AI Result: %s", result)
         
         # Return AI response directly
-        return JSONResponse({
+        return FastJSONResponse({
             "response_type": "in_channel",  # Make it visible to all
             "text": f"🤖 **AI Response:** {result}"
         })
         
     except Exception as e:
-        print(f"=== SYNC TEST ERROR: {str(e)} ===", flush=True)
-        print(f"=== SYNC TEST TRACEBACK: {traceback.format_exc()} ===", flush=True)
+        logger.error("SYNC TEST ERROR: %s: %s", type(e).__name__, e)
+        logger.debug("SYNC TEST TRACEBACK", exc_info=True)
         
-        return JSONResponse({
+        return FastJSONResponse({
             "response_type": "ephemeral",
             "text": f"❌ Error: {str(e)}"
         })
@@ -277,24 +372,30 @@ async def slack_interactive(request: Request, background_tasks: BackgroundTasks)
     """
     Handle interactive components (buttons, modals, etc.)
     """
-    # Get form data
-    form_data = await request.form()
-    payload_str = form_data.get("payload", "")
+    headers = request.headers
+    timestamp = headers.get("X-Slack-Request-Timestamp", "")
+    signature = headers.get("X-Slack-Signature", "")
+    
+    if _is_request_too_old(timestamp):
+        raise HTTPException(status_code=403, detail="Request too old")
+    
+    # Verify against the raw body, which is exactly what Slack signed, then pull the
+    # single urlencoded "payload" field out of it
+    body = await _read_body(request)
+    
+    if not verify_slack_signature(body, timestamp, signature):
+        raise HTTPException(status_code=403, detail="Invalid signature")
     
     try:
-        payload = json.loads(payload_str)
-    except json.JSONDecodeError:
+        form_fields = urllib.parse.parse_qs(body.decode("utf-8"), max_num_fields=4)
+        payload = parse_json(form_fields.get("payload", [""])[0])
+    except (ValueError, json.JSONDecodeError):
         raise HTTPException(status_code=400, detail="Invalid JSON payload")
     
-    # Optional: Basic validation for interactive components
-    headers = request.headers
-    if not headers.get("X-Slack-Request-Timestamp"):
-        raise HTTPException(status_code=403, detail="Missing Slack timestamp")
-    
-    # Handle interaction in background
-    background_tasks.add_task(event_handler.handle_interaction, payload)
+    # Handle interaction in a detached task so the ACK isn't tied to ticket creation
+    event_handler.dispatch_interaction(payload)
     
-    return JSONResponse({"status": "ok"})
+    return _SLACK_ACK
 
 @slack_webhook_router.get("/oauth/redirect")
 async def slack_oauth_redirect(code: Optional[str] = None, error: Optional[str] = None):
@@ -302,13 +403,13 @@ async def slack_oauth_redirect(code: Optional[str] = None, error: Optional[str]
     Handle OAuth redirect from Slack app installation
     """
     if error:
-        return JSONResponse({
+        return FastJSONResponse({
             "error": f"OAuth error: {error}",
             "message": "Failed to install Slack app"
         }, status_code=400)
     
     if not code:
-        return JSONResponse({
+        return FastJSONResponse({
             "error": "No authorization code provided",
             "message": "OAuth flow incomplete"
         }, status_code=400)
@@ -317,7 +418,7 @@ async def slack_oauth_redirect(code: Optional[str] = None, error: Optional[str]
     # This would typically involve calling Slack's oauth.v2.access API
     # For now, return success message
     
-    return JSONResponse({
+    return FastJSONResponse({
         "message": "Slack app installed successfully!",
         "next_steps": "You can now use the bot in your Slack workspace"
     })
@@ -328,65 +429,21 @@ async def slack_install():
     Provide Slack app installation link
     """
     if not Config.SLACK_CLIENT_ID:
-        return JSONResponse({
+        return FastJSONResponse({
             "error": "Slack app not configured",
             "message": "SLACK_CLIENT_ID not set in environment"
         }, status_code=500)
     
-    # Generate Slack OAuth URL
-    scopes = [
-        "app_mentions:read",
-        "channels:history",
-        "channels:read", 
-        "chat:write",
-        "commands",
-        "groups:history",
-        "groups:read",
-        "im:history",
-        "im:read",
-        "im:write",
-        "mpim:history",
-        "mpim:read",
-        "reactions:read",
-        "users:read",
-        "users:read.email",
-        "team:read"
-    ]
-    
-    scope_string = ",".join(scopes)
-    
-    install_url = (
-        f"https://slack.com/oauth/v2/authorize"
-        f"?client_id={Config.SLACK_CLIENT_ID}"
-        f"&scope={scope_string}"
-        f"&redirect_uri={Config.SLACK_REDIRECT_URI or 'https://your-domain.com/slack/oauth/redirect'}"
-    )
-    
-    return JSONResponse({
-        "install_url": install_url,
-        "message": "Click the install_url to add the bot to your Slack workspace"
-    })
+    return FastJSONResponse(_INSTALL_PAYLOAD)
 
 # Health check endpoint
 @slack_webhook_router.get("/health")
 def slack_health():
     """Check if Slack service is properly configured"""
-    config_status = {
-        "bot_token": bool(Config.SLACK_BOT_TOKEN),
-        "signing_secret": bool(Config.SLACK_SIGNING_SECRET),
-        "client_id": bool(getattr(Config, 'SLACK_CLIENT_ID', None)),
-    }
-    
-    all_configured = all(config_status.values())
-    
-    return JSONResponse({
-        "status": "healthy" if all_configured else "partially_configured",
-        "config": config_status,
-        "message": "All Slack config present" if all_configured else "Missing some Slack configuration"
-    })
+    return FastJSONResponse(_HEALTH_PAYLOAD)
 
 @slack_webhook_router.get("/debug")
-def debug_environment():
+async def debug_environment():
     """Debug endpoint to check all environment variables and service initialization."""
     try:
         debug_info = {
@@ -404,9 +461,8 @@ def debug_environment():
             "service_init": "attempting"
         }
         
-        # Try to initialize command handler
-        from command_handler import SlackCommandHandler
-        handler = SlackCommandHandler()
+        # Inspect the shared command handler rather than building a new service bundle
+        handler = command_handler
         debug_info["service_init"] = "success"
         debug_info["services"] = {
             "slack_service": bool(handler.slack_service),
@@ -417,21 +473,13 @@ def debug_environment():
             "prompts": bool(handler.prompts)
         }
         
-        # Test AI service directly
+        # Test AI service directly, on the server's loop so the shared client, semaphore and
+        # in-flight map aren't touched from a throwaway event loop
         try:
-            import asyncio
-            async def test_ai():
-                response = await handler.ai_service.generate_text_async(
-                    "You are a helpful assistant.",
-                    "Say 'test successful' in exactly 2 words."
-                )
-                return response
-            
-            # Run async test
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            ai_test_result = loop.run_until_complete(test_ai())
-            loop.close()
+            ai_test_result = await handler.ai_service.generate_text_async(
+                "You are a helpful assistant.",
+                "Say 'test successful' in exactly 2 words."
+            )
             
             debug_info["ai_test"] = {
                 "success": True,
@@ -443,10 +491,10 @@ def debug_environment():
                 "error": str(ai_error)
             }
         
-        return JSONResponse(debug_info)
+        return FastJSONResponse(debug_info)
         
     except Exception as e:
-        return JSONResponse({
+        return FastJSONResponse({
             "error": str(e),
             "traceback": traceback.format_exc(),
             "environment": {
@@ -1,3 +1,4 @@
+import os
 import uvicorn
 from fastapi import FastAPI
 from dotenv import load_dotenv
@@ -19,4 +20,5 @@ def read_root():
     return {"Service": "Transcript"}
 
 if __name__ == "__main__":
-    uvicorn.run("services.transcript.main:app", host="0.0.0.0", port=8000, reload=True) 
\ No newline at end of file
+    # Auto-reload is for local development only (DEV=1); it pins uvicorn to a single watched process
+    uvicorn.run("services.transcript.main:app", host="0.0.0.0", port=8000, reload=os.getenv("DEV") == "1") 
\ No newline at end of file
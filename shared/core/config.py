@@ -24,6 +24,8 @@ class Config:
     OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4.1-mini")
     OPENAI_MAX_TOKENS = int(os.getenv("OPENAI_MAX_TOKENS", "16000"))
     OPENAI_TEMPERATURE = float(os.getenv("OPENAI_TEMPERATURE", "0.1"))
+    OPENAI_CONCURRENCY = int(os.getenv("OPENAI_CONCURRENCY", "8"))  # Max in-flight async requests per service
+    OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "3"))  # SDK retries 429/5xx with exponential backoff
     
     # Linear Configuration
     LINEAR_API_KEY = os.getenv("LINEAR_API_KEY")
@@ -46,6 +48,9 @@ class Config:
     # Notion Configuration
     NOTION_TOKEN = os.getenv("NOTION_TOKEN")
     
+    # Logging Configuration
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()  # DEBUG adds full Slack payload dumps
+    
     # File paths
     PROMPTS_FILE = Path(__file__).parent / "prompts.yml"
     TRANSCRIPT_FILE = PROJECT_ROOT / "sfai_dev_standup_transcript.txt"
@@ -5,7 +5,32 @@ Utility functions for Alpha Machine.
 import json
 import yaml
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+
+def parse_json(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text or bytes, using orjson when it is installed.
+    
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+    catching the stdlib exception either way.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_json_bytes(data: Any) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 
 
 def save_json(data: Dict[str, Any], file_path: Path, indent: int = 2) -> None:
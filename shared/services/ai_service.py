@@ -2,30 +2,78 @@
 OpenAI service for AI-powered transcript processing.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, AsyncIterator, Tuple
 from openai import OpenAI
 from pydantic import BaseModel
+import httpx
 import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 
 from shared.core.models import GeneratedIssue, GeneratedIssuesResponse
 from shared.core.config import Config
 
+# Completed answers are replayed for identical prompts within this window (double clicks, Slack retries)
+RESULT_CACHE_TTL_SECONDS = 60
+RESULT_CACHE_SIZE = 256
+
 
 class OpenAIService:
     """Service for interacting with OpenAI API."""
     
     def __init__(self, api_key: str = None, model: str = None, max_tokens: int = None, temperature: float = None):
+        # One pooled client for the process: keep-alive sized so every executor worker reuses a warm
+        # TLS connection, a short connect timeout, and transport-level retries for failed connects
+        self._http = httpx.Client(
+            timeout=httpx.Timeout(30.0, connect=5.0),  # 30 second timeout
+            # httpx ignores Client(limits=...) once a transport is given, so the pool is sized here
+            transport=httpx.HTTPTransport(
+                retries=2,
+                limits=httpx.Limits(
+                    max_connections=Config.OPENAI_CONCURRENCY * 4,
+                    max_keepalive_connections=Config.OPENAI_CONCURRENCY
+                )
+            )
+        )
         self.client = OpenAI(
             api_key=api_key or Config.OPENAI_API_KEY,
-            timeout=30.0  # 30 second timeout
+            http_client=self._http,
+            # Rate-limit (429) and transient 5xx responses are retried by the SDK with backoff
+            max_retries=Config.OPENAI_MAX_RETRIES
         )
         self.model = model or Config.OPENAI_MODEL
         self.max_tokens = max_tokens or Config.OPENAI_MAX_TOKENS
         self.temperature = temperature or Config.OPENAI_TEMPERATURE
         
-        # Thread pool for async execution
-        self.executor = ThreadPoolExecutor(max_workers=4)
+        # Thread pool for async execution, one worker per permitted in-flight call so the
+        # semaphore below (not a smaller pool) is what bounds concurrency
+        self.executor = ThreadPoolExecutor(max_workers=Config.OPENAI_CONCURRENCY)
+        # Bounds in-flight async calls so bursts of commands queue here instead of tripping rate limits
+        self._request_semaphore = asyncio.Semaphore(Config.OPENAI_CONCURRENCY)
+        # Identical prompts already in flight share one completion instead of each paying for it
+        self._inflight: Dict[Tuple[str, str, Optional[int]], asyncio.Future] = {}
+        # Prompt digest -> (monotonic expiry, answer), oldest first
+        self._recent_results: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+    
+    def close(self) -> None:
+        """Release the worker threads and the pooled connections."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self._http.close()
+    
+    @staticmethod
+    def _prompt_cache_kwargs(cache_key: Optional[str]) -> Dict[str, Any]:
+        """
+        Extra request options that route requests sharing a prompt prefix to the same cache.
+        
+        OpenAI caches prompt prefixes automatically; a stable prompt_cache_key per prompt
+        config keeps requests with the same system prompt + context on warm cache entries.
+        """
+        if not cache_key:
+            return {}
+        return {"extra_body": {"prompt_cache_key": cache_key}}
     
     def process_transcript(
         self, 
@@ -61,7 +109,7 @@ class OpenAIService:
             print(f"Error calling OpenAI API with structured output: {e}")
             raise
     
-    def generate_text(self, system_prompt: str, user_prompt: str) -> str:
+    def generate_text(self, system_prompt: str, user_prompt: str, cache_key: Optional[str] = None, max_tokens: Optional[int] = None) -> str:
         """Generate text using OpenAI API."""
         try:
             response = self.client.chat.completions.create(
@@ -71,7 +119,8 @@ class OpenAIService:
                     {"role": "user", "content": user_prompt}
                 ],
                 temperature=self.temperature,
-                max_tokens=self.max_tokens
+                max_tokens=max_tokens or self.max_tokens,
+                **self._prompt_cache_kwargs(cache_key)
             )
             
             return response.choices[0].message.content
@@ -80,17 +129,114 @@ class OpenAIService:
             print(f"Error calling OpenAI API for text generation: {e}")
             raise 
     
-    async def generate_text_async(self, system_prompt: str, user_prompt: str) -> str:
-        """Generate text using OpenAI API asynchronously."""
+    async def generate_text_async(self, system_prompt: str, user_prompt: str, cache_key: Optional[str] = None, max_tokens: Optional[int] = None) -> str:
+        """
+        Generate text using OpenAI API asynchronously.
+        
+        Concurrent calls with the same prompts are coalesced onto a single request,
+        and a repeat within RESULT_CACHE_TTL_SECONDS gets the previous answer.
+        Distinct prompts are never merged into one completion, since each answer
+        goes back to a different user.
+        """
+        digest = self._prompt_digest(system_prompt, user_prompt, max_tokens)
+        cached = self._recent_results.get(digest)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
+        key = (system_prompt, user_prompt, max_tokens)
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._generate_text_async(system_prompt, user_prompt, cache_key, max_tokens))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one cancelled caller doesn't cancel the request for everyone sharing it
+        return await asyncio.shield(inflight)
+    
+    async def _generate_text_async(self, system_prompt: str, user_prompt: str, cache_key: Optional[str], max_tokens: Optional[int]) -> str:
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self.executor, 
-            self.generate_text, 
-            system_prompt, 
-            user_prompt
-        )
+        async with self._request_semaphore:
+            result = await loop.run_in_executor(
+                self.executor, 
+                self.generate_text, 
+                system_prompt, 
+                user_prompt,
+                cache_key,
+                max_tokens
+            )
+        if result:
+            self._remember_result(self._prompt_digest(system_prompt, user_prompt, max_tokens), result)
+        return result
+    
+    def _prompt_digest(self, system_prompt: str, user_prompt: str, max_tokens: Optional[int]) -> str:
+        """Short key for the result cache, so it doesn't pin whole prompts in memory."""
+        hasher = hashlib.blake2b(digest_size=16)
+        for part in (self.model, system_prompt, user_prompt, str(max_tokens)):
+            hasher.update(part.encode("utf-8"))
+            hasher.update(b"\x00")
+        return hasher.hexdigest()
+    
+    def _remember_result(self, digest: str, result: str) -> None:
+        self._recent_results.pop(digest, None)
+        self._recent_results[digest] = (time.monotonic() + RESULT_CACHE_TTL_SECONDS, result)
+        while len(self._recent_results) > RESULT_CACHE_SIZE:
+            self._recent_results.popitem(last=False)
+    
+    async def generate_text_stream(self, system_prompt: str, user_prompt: str, cache_key: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        Stream text deltas from OpenAI as they are generated.
+        
+        The blocking SDK stream is consumed on the executor thread and each delta
+        is forwarded to the event loop through a queue, so callers can start
+        rendering output at first-token latency instead of waiting for the full
+        completion.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        finished = object()
+        stop = threading.Event()
+        
+        def _produce():
+            try:
+                stream = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                    stream=True,
+                    **self._prompt_cache_kwargs(cache_key)
+                )
+                try:
+                    for chunk in stream:
+                        if stop.is_set():
+                            break
+                        if chunk.choices and chunk.choices[0].delta.content:
+                            loop.call_soon_threadsafe(queue.put_nowait, chunk.choices[0].delta.content)
+                finally:
+                    stream.close()
+            except Exception as e:
+                print(f"Error streaming OpenAI text generation: {e}")
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, finished)
+        
+        async with self._request_semaphore:
+            loop.run_in_executor(self.executor, _produce)
+            try:
+                while True:
+                    item = await queue.get()
+                    if item is finished:
+                        break
+                    if isinstance(item, Exception):
+                        raise item
+                    yield item
+            finally:
+                # Let the worker thread stop early if the consumer bails out
+                stop.set()
     
-    async def _call_openai_structured_async(self, system_prompt: str, user_prompt: str) -> List[str]:
+    async def _call_openai_structured_async(self, system_prompt: str, user_prompt: str, cache_key: Optional[str] = None) -> List[str]:
         """Call OpenAI API with structured output asynchronously, returning text results."""
         loop = asyncio.get_event_loop()
         
@@ -104,7 +250,8 @@ class OpenAIService:
                         {"role": "user", "content": user_prompt}
                     ],
                     temperature=self.temperature,
-                    max_tokens=self.max_tokens
+                    max_tokens=self.max_tokens,
+                    **self._prompt_cache_kwargs(cache_key)
                 )
                 result = [response.choices[0].message.content]
                 print(f"DEBUG: OpenAI API success, content length: {len(result[0]) if result[0] else 0}")
@@ -113,7 +260,8 @@ class OpenAIService:
                 print(f"DEBUG: OpenAI API error: {type(e).__name__}: {str(e)}")
                 return ["I couldn't generate a response at this time."]
         
-        return await loop.run_in_executor(self.executor, _sync_call)
+        async with self._request_semaphore:
+            return await loop.run_in_executor(self.executor, _sync_call)
     
     def get_structured_response(self, system_prompt: str, user_prompt: str, response_model: BaseModel) -> Dict[str, Any]:
         """Call OpenAI API and get a structured response based on a Pydantic model."""
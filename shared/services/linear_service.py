@@ -14,6 +14,14 @@ from shared.core.config import Config
 class LinearService:
     """Service for interacting with Linear API."""
     
+    # Most recent updatedAt per connection; Linear has no ETags, so this acts as the workspace version.
+    # Aliased so the same selection can ride along in the full workspace query.
+    _VERSION_FIELDS = """
+            latestProject: projects(first: 1, orderBy: updatedAt) { nodes { updatedAt } }
+            latestMilestone: projectMilestones(first: 1, orderBy: updatedAt) { nodes { updatedAt } }
+            latestIssue: issues(first: 1, orderBy: updatedAt, includeArchived: true) { nodes { updatedAt } }
+    """
+    
     def __init__(self, api_key: str, team_name: str):
         self.api_key = api_key
         self.team_name = team_name
@@ -35,8 +43,9 @@ class LinearService:
         adapter = HTTPAdapter(max_retries=retry)
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
-        # Simple in-memory cache for workspace context
+        # Simple in-memory cache for workspace context, plus the version it was fetched at
         self._workspace_cache: Optional[Tuple[LinearContext, datetime]] = None
+        self._workspace_version: Optional[str] = None
     
     def _make_request(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make a GraphQL request to Linear API."""
@@ -52,15 +61,27 @@ class LinearService:
         return response.json()
     
     def get_workspace_context(self) -> LinearContext:
-        """Fetch and parse the current workspace state."""
+        """
+        Fetch and parse the current workspace state.
+        
+        Connections are explicitly ordered by createdAt so the formatted context is
+        byte-stable between fetches, which keeps the prompt prefix cacheable.
+        
+        Once the 2 minute TTL lapses, a tiny version probe decides whether the
+        full workspace actually needs re-downloading.
+        """
         # Return cached context if still fresh (2 minutes TTL)
         if self._workspace_cache:
             cached, ts = self._workspace_cache
             if datetime.utcnow() - ts < timedelta(minutes=2):
                 return cached
+            # Stale by age: keep it if nothing in the workspace has been updated since
+            if self._workspace_version and self.get_workspace_version() == self._workspace_version:
+                self._workspace_cache = (cached, datetime.utcnow())
+                return cached
         query = """
-        query {
-            projects {
+        query {""" + self._VERSION_FIELDS + """
+            projects(orderBy: createdAt) {
                 nodes {
                     id
                     name
@@ -71,7 +92,7 @@ class LinearService:
                     teams { nodes { name key } }
                 }
             }
-            projectMilestones {
+            projectMilestones(orderBy: createdAt) {
                 nodes {
                     id
                     name
@@ -81,7 +102,7 @@ class LinearService:
                     project { id name }
                 }
             }
-            issues {
+            issues(orderBy: createdAt) {
                 nodes {
                     id
                     title
@@ -105,11 +126,37 @@ class LinearService:
             parsed = self._parse_workspace_data(data)
             # Cache the parsed context
             self._workspace_cache = (parsed, datetime.utcnow())
+            self._workspace_version = self._version_from_data(data)
             return parsed
         except Exception as e:
             print(f"Warning: Error fetching Linear data: {e}")
             return LinearContext()
     
+    def get_workspace_version(self) -> Optional[str]:
+        """Return the workspace's latest updatedAt stamps, or None if the probe fails."""
+        try:
+            return self._version_from_data(self._make_request("query {" + self._VERSION_FIELDS + "}"))
+        except Exception as e:
+            print(f"Warning: Error probing Linear workspace version: {e}")
+            return None
+    
+    @staticmethod
+    def _version_from_data(data: Dict[str, Any]) -> Optional[str]:
+        """Build a version string from the aliased latest* selections in a response."""
+        body = data.get('data')
+        if not body:
+            return None
+        stamps = []
+        for alias in ('latestProject', 'latestMilestone', 'latestIssue'):
+            nodes = (body.get(alias) or {}).get('nodes') or [{}]
+            stamps.append(nodes[0].get('updatedAt') or '')
+        return "|".join(stamps)
+    
+    def invalidate_workspace_cache(self) -> None:
+        """Drop the cached workspace so the next read fetches fresh data."""
+        self._workspace_cache = None
+        self._workspace_version = None
+    
     def _parse_workspace_data(self, data: Dict[str, Any]) -> LinearContext:
         """Parse Linear API response into structured data models."""
         if 'data' not in data:
@@ -499,6 +546,7 @@ class LinearService:
         try:
             result = self._make_request(mutation, variables)
             if result.get('data', {}).get('issueCreate', {}).get('success'):
+                self.invalidate_workspace_cache()
                 return result['data']['issueCreate']['issue']
             else:
                 print(f"Error creating issue: {result}")
@@ -581,6 +629,7 @@ class LinearService:
         try:
             result = self._make_request(mutation, variables)
             if result.get('data', {}).get('issueUpdate', {}).get('success'):
+                self.invalidate_workspace_cache()
                 return result['data']['issueUpdate']['issue']
             else:
                 print(f"Error updating issue: {result}")
@@ -3,18 +3,48 @@ Slack service for Slack operations across all flows.
 """
 
 from typing import Dict, Any, List, Optional
+import asyncio
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 from shared.core.config import Config
+from shared.core.utils import dump_json_bytes, parse_json
+
+# Web API base for the async methods, which post over the shared httpx client
+# (slack_sdk's AsyncWebClient would pull in aiohttp)
+SLACK_API_BASE_URL = "https://slack.com/api/"
 
 
 class SlackService:
     """Service for Slack operations."""
     
-    def __init__(self):
-        """Initialize Slack client."""
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        """
+        Initialize Slack client.
+        
+        Args:
+            http_client: Optional shared async HTTP client used for response_url posts,
+                so replies reuse the caller's keep-alive connections.
+        """
         self.client: Optional[WebClient] = None
+        self.http_client = http_client
+        # Pooled session for the sync response_url fallback so repeat posts skip the TLS handshake.
+        # Only connection failures and 429s are retried: Slack never processed those, so a retry can't double-post.
+        self.session = requests.Session()
+        retry = Retry(
+            total=3,
+            connect=3,
+            read=0,
+            backoff_factor=0.2,
+            status_forcelist=[429],
+            allowed_methods=["POST"]
+        )
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self._initialize_client()
     
     def _initialize_client(self):
@@ -24,6 +54,20 @@ class SlackService:
         else:
             print("Warning: Slack bot token not configured")
     
+    async def _api_call_async(self, method: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Call a Slack Web API method over the shared async HTTP client and return the parsed body."""
+        resp = await self.http_client.post(
+            f"{SLACK_API_BASE_URL}{method}",
+            content=dump_json_bytes(payload),
+            headers={
+                "Authorization": f"Bearer {Config.SLACK_BOT_TOKEN}",
+                "Content-Type": "application/json; charset=utf-8"
+            }
+        )
+        if resp.status_code != 200:
+            return {"ok": False, "error": f"HTTP {resp.status_code}"}
+        return parse_json(resp.content)
+    
     def send_message(self, channel: str, text: str, blocks: Optional[List[Dict[str, Any]]] = None) -> bool:
         """Send message to Slack channel."""
         if not self.client:
@@ -41,6 +85,66 @@ class SlackService:
             print(f"Error sending Slack message: {e}")
             return False
     
+    def post_message(self, channel: str, text: str, blocks: Optional[List[Dict[str, Any]]] = None) -> Optional[str]:
+        """Send message to Slack channel and return its timestamp so it can be updated later."""
+        if not self.client:
+            print("Error: Slack client not initialized")
+            return None
+        
+        try:
+            kwargs = {"channel": channel, "text": text}
+            if blocks:
+                kwargs["blocks"] = blocks
+            
+            response = self.client.chat_postMessage(**kwargs)
+            return response["ts"] if response["ok"] else None
+        except SlackApiError as e:
+            print(f"Error sending Slack message: {e}")
+            return None
+    
+    async def send_message_async(self, channel: str, text: str, blocks: Optional[List[Dict[str, Any]]] = None) -> bool:
+        """Async variant of send_message that doesn't block the event loop."""
+        if self.http_client is None:
+            return await asyncio.to_thread(self.send_message, channel, text, blocks)
+        if not self.client:
+            print("Error: Slack client not initialized")
+            return False
+        
+        try:
+            kwargs = {"channel": channel, "text": text}
+            if blocks:
+                kwargs["blocks"] = blocks
+            
+            response = await self._api_call_async("chat.postMessage", kwargs)
+            if not response.get("ok"):
+                print(f"Error sending Slack message: {response.get('error')}")
+            return bool(response.get("ok"))
+        except Exception as e:
+            print(f"Error sending Slack message: {e}")
+            return False
+    
+    async def post_message_async(self, channel: str, text: str, blocks: Optional[List[Dict[str, Any]]] = None) -> Optional[str]:
+        """Async variant of post_message; returns the new message's timestamp."""
+        if self.http_client is None:
+            return await asyncio.to_thread(self.post_message, channel, text, blocks)
+        if not self.client:
+            print("Error: Slack client not initialized")
+            return None
+        
+        try:
+            kwargs = {"channel": channel, "text": text}
+            if blocks:
+                kwargs["blocks"] = blocks
+            
+            response = await self._api_call_async("chat.postMessage", kwargs)
+            if not response.get("ok"):
+                print(f"Error sending Slack message: {response.get('error')}")
+                return None
+            return response.get("ts")
+        except Exception as e:
+            print(f"Error sending Slack message: {e}")
+            return None
+    
     def send_ephemeral_message(self, channel: str, user: str, text: str, blocks: Optional[List[Dict[str, Any]]] = None) -> bool:
         """Send ephemeral message to user in channel."""
         if not self.client:
@@ -58,6 +162,58 @@ class SlackService:
             print(f"Error sending ephemeral message: {e}")
             return False
     
+    async def send_ephemeral_message_async(self, channel: str, user: str, text: str, blocks: Optional[List[Dict[str, Any]]] = None) -> bool:
+        """Async variant of send_ephemeral_message."""
+        if self.http_client is None:
+            return await asyncio.to_thread(self.send_ephemeral_message, channel, user, text, blocks)
+        if not self.client:
+            print("Error: Slack client not initialized")
+            return False
+        
+        try:
+            kwargs = {"channel": channel, "user": user, "text": text}
+            if blocks:
+                kwargs["blocks"] = blocks
+            
+            response = await self._api_call_async("chat.postEphemeral", kwargs)
+            if not response.get("ok"):
+                print(f"Error sending ephemeral message: {response.get('error')}")
+            return bool(response.get("ok"))
+        except Exception as e:
+            print(f"Error sending ephemeral message: {e}")
+            return False
+    
+    def open_dm(self, user_id: str) -> Optional[str]:
+        """Open (or reuse) a DM with a user and return its channel ID."""
+        if not self.client:
+            print("Error: Slack client not initialized")
+            return None
+        
+        try:
+            response = self.client.conversations_open(users=user_id)
+            return response["channel"]["id"] if response["ok"] else None
+        except SlackApiError as e:
+            print(f"Error opening DM: {e}")
+            return None
+    
+    async def open_dm_async(self, user_id: str) -> Optional[str]:
+        """Async variant of open_dm."""
+        if self.http_client is None:
+            return await asyncio.to_thread(self.open_dm, user_id)
+        if not self.client:
+            print("Error: Slack client not initialized")
+            return None
+        
+        try:
+            response = await self._api_call_async("conversations.open", {"users": user_id})
+            if not response.get("ok"):
+                print(f"Error opening DM: {response.get('error')}")
+                return None
+            return response["channel"]["id"]
+        except Exception as e:
+            print(f"Error opening DM: {e}")
+            return None
+    
     def get_user_info(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get user information."""
         if not self.client:
@@ -133,15 +289,55 @@ class SlackService:
             print(f"Error updating message: {e}")
             return False 
 
+    async def update_message_async(self, channel: str, ts: str, text: str, blocks: Optional[List[Dict[str, Any]]] = None) -> bool:
+        """Async variant of update_message."""
+        if self.http_client is None:
+            return await asyncio.to_thread(self.update_message, channel, ts, text, blocks)
+        if not self.client:
+            print("Error: Slack client not initialized")
+            return False
+        
+        try:
+            kwargs = {"channel": channel, "ts": ts, "text": text}
+            if blocks:
+                kwargs["blocks"] = blocks
+            
+            response = await self._api_call_async("chat.update", kwargs)
+            if not response.get("ok"):
+                print(f"Error updating message: {response.get('error')}")
+            return bool(response.get("ok"))
+        except Exception as e:
+            print(f"Error updating message: {e}")
+            return False
+
     def respond_to_interaction(self, response_url: str, payload: Dict[str, Any]) -> bool:
         """Send a response to a Slack interaction via response_url (supports replace_original to keep loading state)."""
         try:
             headers = {"Content-Type": "application/json"}
-            resp = requests.post(response_url, json=payload, headers=headers, timeout=5)
+            resp = self.session.post(response_url, data=dump_json_bytes(payload), headers=headers, timeout=5)
+            if resp.status_code != 200:
+                print(f"Error responding to interaction: {resp.status_code} - {resp.text}")
+                return False
+            return True
+        except Exception as e:
+            print(f"Error sending interaction response: {e}")
+            return False
+
+    async def respond_to_interaction_async(self, response_url: str, payload: Dict[str, Any]) -> bool:
+        """Async variant of respond_to_interaction that reuses the shared HTTP client when available."""
+        if self.http_client is None:
+            return await asyncio.to_thread(self.respond_to_interaction, response_url, payload)
+        
+        try:
+            resp = await self.http_client.post(
+                response_url,
+                content=dump_json_bytes(payload),
+                headers={"Content-Type": "application/json"}
+            )
             if resp.status_code != 200:
                 print(f"Error responding to interaction: {resp.status_code} - {resp.text}")
                 return False
             return True
         except Exception as e:
             print(f"Error sending interaction response: {e}")
-            return False
\ No newline at end of file
+            return False
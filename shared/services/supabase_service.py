@@ -14,6 +14,8 @@ class SupabaseService:
     def __init__(self):
         """Initialize Supabase client."""
         self.client: Optional[Client] = None
+        # Whether filtered_transcripts has the generated preview column; None until first probed
+        self._has_preview_column: Optional[bool] = None
         self._initialize_client()
     
     def _initialize_client(self):
@@ -292,19 +294,55 @@ class SupabaseService:
             print(f"Error retrieving filtered transcripts by date range: {e}")
             return []
     
-    def get_recent_transcripts(self, limit: int = 3) -> List[Dict[str, Any]]:
-        """Get most recent transcripts ordered by creation date."""
+    def get_recent_transcripts(self, limit: int = 3, columns: str = '*') -> List[Dict[str, Any]]:
+        """
+        Get most recent transcripts ordered by creation date.
+        
+        Pass columns to fetch only what the caller renders; transcript bodies are
+        large, so listing views should leave filtered_transcript out.
+        """
         if not self.client:
             print("Error: Supabase client not initialized")
             return []
         
         try:
-            response = self.client.table('filtered_transcripts').select('*').order('created_at', desc=True).limit(limit).execute()
+            response = self.client.table('filtered_transcripts').select(columns).order('created_at', desc=True).limit(limit).execute()
             return response.data or []
         except Exception as e:
             print(f"Error retrieving recent transcripts: {e}")
             return []
     
+    def get_recent_transcript_previews(self, limit: int = 3, preview_length: int = 300) -> List[Dict[str, Any]]:
+        """
+        Get most recent transcripts with a short filtered_transcript_preview instead of the full body.
+        
+        Reads the stored generated column when the database has it (see supabase_schema.sql);
+        otherwise falls back to fetching the body and slicing it here.
+        """
+        if not self.client:
+            print("Error: Supabase client not initialized")
+            return []
+        
+        if self._has_preview_column is not False:
+            try:
+                response = self.client.table('filtered_transcripts').select('filename, created_at, filtered_transcript_preview').order('created_at', desc=True).limit(limit).execute()
+                self._has_preview_column = True
+                return response.data or []
+            except Exception as e:
+                if 'filtered_transcript_preview' not in str(e):
+                    print(f"Error retrieving recent transcript previews: {e}")
+                    return []
+                self._has_preview_column = False
+        
+        return [
+            {
+                'filename': row.get('filename'),
+                'created_at': row.get('created_at'),
+                'filtered_transcript_preview': (row.get('filtered_transcript') or '')[:preview_length]
+            }
+            for row in self.get_recent_transcripts(limit, columns='filename, created_at, filtered_transcript')
+        ]
+    
     def get_transcript_by_id(self, transcript_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific transcript by ID."""
         if not self.client:
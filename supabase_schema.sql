@@ -43,6 +43,20 @@ CREATE INDEX IF NOT EXISTS idx_filtered_transcripts_participants
 CREATE INDEX IF NOT EXISTS idx_filtered_transcripts_created_at 
     ON filtered_transcripts(created_at);
 
+-- Short stored preview used by the Slack bot's context listings, so it never has to
+-- download full transcript bodies. Only added where the filtered_transcript column exists.
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'filtered_transcripts' AND column_name = 'filtered_transcript'
+    ) THEN
+        ALTER TABLE filtered_transcripts
+            ADD COLUMN IF NOT EXISTS filtered_transcript_preview TEXT
+            GENERATED ALWAYS AS (left(filtered_transcript, 300)) STORED;
+    END IF;
+END $$;
+
 -- ============================================================================
 -- ORIGINAL TRANSCRIPTS TABLE (for backup/reference)
 -- ============================================================================
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for coalescing identical in-flight OpenAI requests.
+"""
+
+import sys
+import time
+import asyncio
+import unittest
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add the current directory to Python path so we can import from shared/
+sys.path.append(str(Path(__file__).parent.parent))
+
+from shared.services.ai_service import OpenAIService
+
+
+class TestOpenAIRequestCoalescing(unittest.TestCase):
+    """Test suite for single-flight generate_text_async."""
+
+    def setUp(self):
+        """Set up a service whose blocking call is counted instead of hitting OpenAI."""
+        self.ai_service = OpenAIService(api_key="test-key")
+
+        def fake_generate(system_prompt, user_prompt, cache_key=None, max_tokens=None):
+            time.sleep(0.05)
+            return f"answer to {user_prompt}"
+
+        self.ai_service.generate_text = Mock(side_effect=fake_generate)
+
+    def test_identical_requests_share_one_call(self):
+        """Concurrent identical prompts trigger a single completion."""
+        async def run_test():
+            return await asyncio.gather(*(self.ai_service.generate_text_async("system", "hello") for _ in range(4)))
+
+        results = asyncio.run(run_test())
+
+        self.assertEqual(self.ai_service.generate_text.call_count, 1)
+        self.assertEqual(results, ["answer to hello"] * 4)
+        self.assertEqual(self.ai_service._inflight, {})
+
+    def test_distinct_requests_are_not_merged(self):
+        """Different prompts each get their own completion."""
+        async def run_test():
+            return await asyncio.gather(
+                self.ai_service.generate_text_async("system", "a"),
+                self.ai_service.generate_text_async("system", "b"),
+            )
+
+        results = asyncio.run(run_test())
+
+        self.assertEqual(self.ai_service.generate_text.call_count, 2)
+        self.assertEqual(results, ["answer to a", "answer to b"])
+
+    def test_repeat_request_reuses_recent_answer(self):
+        """A repeat after the first call finished is answered from the short-lived result cache."""
+        first = asyncio.run(self.ai_service.generate_text_async("system", "hello"))
+        second = asyncio.run(self.ai_service.generate_text_async("system", "hello"))
+
+        self.assertEqual(self.ai_service.generate_text.call_count, 1)
+        self.assertEqual(first, second)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for the versioned Linear workspace cache.
+"""
+
+import sys
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add the current directory to Python path so we can import from shared/
+sys.path.append(str(Path(__file__).parent.parent))
+
+from shared.services.linear_service import LinearService
+
+
+def _workspace_response(issue_updated_at):
+    """A minimal workspace payload whose version is driven by the latest issue timestamp."""
+    return {
+        "data": {
+            "latestProject": {"nodes": [{"updatedAt": "2025-01-01T00:00:00Z"}]},
+            "latestMilestone": {"nodes": []},
+            "latestIssue": {"nodes": [{"updatedAt": issue_updated_at}]},
+            "projects": {"nodes": []},
+            "projectMilestones": {"nodes": []},
+            "issues": {"nodes": [{"id": "i1", "title": "Task", "state": {"name": "Todo", "type": "unstarted"}}]},
+        }
+    }
+
+
+class TestLinearWorkspaceCache(unittest.TestCase):
+    """Test suite for reusing the workspace while its version is unchanged."""
+
+    def setUp(self):
+        """Set up a service with a primed, expired cache."""
+        self.linear_service = LinearService(api_key="test-key", team_name="Test Team")
+        self.linear_service._make_request = Mock(return_value=_workspace_response("2025-01-02T00:00:00Z"))
+        self.first = self.linear_service.get_workspace_context()
+        cached, _ = self.linear_service._workspace_cache
+        self.linear_service._workspace_cache = (cached, datetime.utcnow() - timedelta(minutes=5))
+        self.linear_service._make_request.reset_mock()
+
+    def test_unchanged_version_reuses_cache(self):
+        """An expired cache is kept when the version probe matches."""
+        result = self.linear_service.get_workspace_context()
+
+        self.assertIs(result, self.first)
+        self.assertEqual(self.linear_service._make_request.call_count, 1)
+
+    def test_changed_version_refetches(self):
+        """A newer updatedAt triggers a full workspace fetch."""
+        self.linear_service._make_request.return_value = _workspace_response("2025-01-03T00:00:00Z")
+
+        result = self.linear_service.get_workspace_context()
+
+        self.assertIsNot(result, self.first)
+        self.assertEqual(self.linear_service._make_request.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
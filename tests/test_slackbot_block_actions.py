@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Tests for routing Slack block actions through the event handler's dispatch table.
+"""
+
+import sys
+import json
+import asyncio
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+# Add the current directory to Python path so we can import from shared/
+sys.path.append(str(Path(__file__).parent.parent))
+
+# Import directly from the slackbot modules to avoid webhook initialization
+sys.path.append(str(Path(__file__).parent.parent / "services" / "slackbot"))
+from event_handler import SlackEventHandler
+
+
+class TestSlackBlockActions(unittest.TestCase):
+    """Test suite for block action dispatch."""
+
+    def setUp(self):
+        """Set up an event handler with Slack calls mocked out."""
+        self.event_handler = SlackEventHandler()
+        self.event_handler.slack_service.send_ephemeral_message_async = AsyncMock(return_value=True)
+
+    def _payload(self, action):
+        return {"actions": [action], "user": {"id": "U1"}, "channel": {"id": "C1"}}
+
+    def test_selection_dropdowns_store_and_confirm_count(self):
+        """Every transcript dropdown stores the selection and replies to the user alone."""
+        action = {"action_id": "chat_inline_transcript_selection", "selected_options": [{"value": "t1"}, {"value": "t2"}]}
+
+        asyncio.run(self.event_handler._handle_block_actions(self._payload(action)))
+
+        self.assertEqual(self.event_handler.command_handler._get_user_selection("U1"), ["t1", "t2"])
+        kwargs = self.event_handler.slack_service.send_ephemeral_message_async.await_args.kwargs
+        self.assertEqual((kwargs["channel"], kwargs["user"]), ("C1", "U1"))
+        self.assertTrue(kwargs["text"].startswith("📋 Selected 2 transcript(s). Click '🚀 Answer with Selected'"))
+
+    def test_unknown_action_is_ignored(self):
+        """Actions without a handler are skipped without replying."""
+        asyncio.run(self.event_handler._handle_block_actions(self._payload({"action_id": "nope"})))
+
+        self.event_handler.slack_service.send_ephemeral_message_async.assert_not_awaited()
+
+    def test_ticket_ack_does_not_block_confirmation(self):
+        """The "Creating tickets" ack is sent in the background while the tickets are created."""
+        ack_started = asyncio.Event()
+        release_ack = asyncio.Event()
+        replies = []
+
+        async def respond(response_url, payload):
+            if not ack_started.is_set():
+                ack_started.set()
+                await release_ack.wait()
+            replies.append(payload["text"])
+            return True
+
+        async def confirm(user_id, confirmed):
+            # Runs while the ack is still in flight
+            await ack_started.wait()
+            release_ack.set()
+            return {"text": "✅ Created"}
+
+        self.event_handler.slack_service.respond_to_interaction_async = respond
+        self.event_handler.command_handler.handle_create_tickets_confirmation = confirm
+        payload = self._payload({"action_id": "create_tickets_no", "value": ""})
+        payload["response_url"] = "https://hooks.slack.test/response"
+
+        asyncio.run(asyncio.wait_for(self.event_handler._handle_block_actions(payload), timeout=1))
+
+        self.assertEqual(replies, ["🚫 Cancelling...", "✅ Created"])
+        self.assertEqual(self.event_handler._bg_tasks, set())
+
+    def _ticket_yes_payload(self, create_issue):
+        """A "Yes" click on one preview, with conversion and Linear stubbed out."""
+        command_handler = self.event_handler.command_handler
+
+        async def convert(system_prompt, user_prompt, cache_key=None):
+            # Yield so a second click can run while the first is still creating tickets
+            await asyncio.sleep(0.01)
+            return ['[{"title": "Fix login", "description": "Users get logged out"}]']
+
+        command_handler.ai_service._call_openai_structured_async = convert
+        command_handler.linear_service.create_issue = create_issue
+        self.event_handler.slack_service.respond_to_interaction_async = AsyncMock(return_value=True)
+        value = json.dumps({"original_request": "fix login", "analysis": "Create one ticket"})
+        payload = self._payload({"action_id": "create_tickets_yes", "value": value})
+        payload["response_url"] = "https://hooks.slack.test/response"
+        payload["message"] = {"ts": "1700000000.000200"}
+        return payload
+
+    def test_concurrent_yes_clicks_create_tickets_once(self):
+        """Two racing "Yes" clicks on one preview create its tickets exactly once."""
+        command_handler = self.event_handler.command_handler
+        payload = self._ticket_yes_payload(Mock(return_value={"title": "Fix login", "id": "ENG-1"}))
+
+        async def run_test():
+            await asyncio.gather(
+                self.event_handler._handle_block_actions(payload),
+                self.event_handler._handle_block_actions(payload),
+            )
+
+        asyncio.run(run_test())
+
+        command_handler.linear_service.create_issue.assert_called_once()
+        self.event_handler.slack_service.send_ephemeral_message_async.assert_awaited_once()
+
+    def test_failed_create_lets_the_user_retry(self):
+        """A "Yes" that creates no tickets releases the preview, so clicking again tries again."""
+        command_handler = self.event_handler.command_handler
+        payload = self._ticket_yes_payload(Mock(side_effect=[None, {"title": "Fix login", "id": "ENG-1"}]))
+
+        async def run_test():
+            await self.event_handler._handle_block_actions(payload)
+            await self.event_handler._handle_block_actions(payload)
+
+        asyncio.run(run_test())
+
+        self.assertEqual(command_handler.linear_service.create_issue.call_count, 2)
+        self.event_handler.slack_service.send_ephemeral_message_async.assert_not_awaited()
+
+    def test_dispatch_interaction_returns_before_handling(self):
+        """Interactions run in a tracked task, so the webhook can ACK before the handler finishes."""
+        release = asyncio.Event()
+
+        async def slow_handle(payload):
+            await release.wait()
+
+        self.event_handler.handle_interaction = slow_handle
+
+        async def run_test():
+            task = self.event_handler.dispatch_interaction({"type": "block_actions"})
+            await asyncio.sleep(0)
+            pending = not task.done() and task in self.event_handler._event_tasks
+            release.set()
+            await task
+            return pending
+
+        self.assertTrue(asyncio.run(run_test()))
+        self.assertEqual(self.event_handler._event_tasks, set())
+
+
+if __name__ == "__main__":
+    unittest.main()
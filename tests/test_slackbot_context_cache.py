@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Tests for the short-lived comprehensive context cache in the Slack command handler.
+"""
+
+import sys
+import asyncio
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Add the current directory to Python path so we can import from shared/
+sys.path.append(str(Path(__file__).parent.parent))
+
+# Import directly from command_handler module to avoid webhook initialization
+sys.path.append(str(Path(__file__).parent.parent / "services" / "slackbot"))
+import command_handler
+from command_handler import SlackCommandHandler, _filter_linear_context
+from shared.core.models import LinearContext, LinearProject, LinearIssue
+
+
+class TestComprehensiveContextCache(unittest.TestCase):
+    """Test suite for the comprehensive context cache."""
+
+    def setUp(self):
+        """Set up a handler whose context build is counted instead of hitting APIs."""
+        self.command_handler = SlackCommandHandler()
+        self.build_calls = 0
+
+        async def fake_build():
+            self.build_calls += 1
+            await asyncio.sleep(0.01)
+            return f"context #{self.build_calls}"
+
+        self.command_handler._build_comprehensive_context = fake_build
+
+    def test_concurrent_calls_share_one_fetch(self):
+        """A burst of concurrent callers collapses to a single build."""
+        async def run_test():
+            return await asyncio.gather(*(self.command_handler._get_comprehensive_context_body() for _ in range(5)))
+
+        results = asyncio.run(run_test())
+
+        self.assertEqual(self.build_calls, 1)
+        self.assertEqual({body for body, _ in results}, {"context #1"})
+        stats = self.command_handler.context_cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (4, 1))
+
+    def test_cache_expires_after_ttl(self):
+        """Once the TTL has elapsed the context is rebuilt."""
+        asyncio.run(self.command_handler._get_comprehensive_context())
+
+        with patch.object(command_handler, "CONTEXT_CACHE_TTL_SECONDS", 0):
+            result, _ = asyncio.run(self.command_handler._get_comprehensive_context_body())
+
+        self.assertEqual(self.build_calls, 2)
+        self.assertEqual(result, "context #2")
+
+    def test_invalidate_forces_rebuild(self):
+        """Writing to Linear invalidates the cache so the next call rebuilds."""
+        asyncio.run(self.command_handler._get_comprehensive_context())
+        self.command_handler._invalidate_context_cache()
+        result, _ = asyncio.run(self.command_handler._get_comprehensive_context_body())
+
+        self.assertEqual(self.build_calls, 2)
+        self.assertEqual(result, "context #2")
+
+    def test_allow_stale_returns_expired_context_and_refreshes_in_background(self):
+        """An expired context is served immediately while one rebuild runs behind it."""
+        async def run_test():
+            await self.command_handler._get_comprehensive_context_body()
+            with patch.object(command_handler, "CONTEXT_CACHE_TTL_SECONDS", 0):
+                stale, _ = await self.command_handler._get_comprehensive_context_body(allow_stale=True)
+                await self.command_handler._context_refresh_task
+            return stale
+
+        stale = asyncio.run(run_test())
+
+        self.assertEqual(stale, "context #1")
+        self.assertEqual(self.build_calls, 2)
+        self.assertEqual(self.command_handler._context_cache[0], "context #2")
+
+    def test_summary_context_reuses_stale_cache(self):
+        """The summary preview is served from the cache after the TTL while a rebuild runs behind it."""
+        async def run_test():
+            await self.command_handler._get_comprehensive_context()
+            with patch.object(command_handler, "CONTEXT_CACHE_TTL_SECONDS", 0):
+                result = await self.command_handler._get_summary_context(max_len=10)
+                await self.command_handler._context_refresh_task
+            return result
+
+        result = asyncio.run(run_test())
+
+        self.assertEqual(result, "context #1")
+        self.assertEqual(self.build_calls, 2)
+        self.assertEqual(self.command_handler._context_cache[0], "context #2")
+
+    def test_summary_context_rebuilds_past_stale_bound(self):
+        """A context older than CONTEXT_STALE_MAX_SECONDS is rebuilt before the preview is served."""
+        asyncio.run(self.command_handler._get_comprehensive_context())
+
+        with patch.object(command_handler, "CONTEXT_CACHE_TTL_SECONDS", 0), \
+                patch.object(command_handler, "CONTEXT_STALE_MAX_SECONDS", 0):
+            result = asyncio.run(self.command_handler._get_summary_context(max_len=10))
+
+        self.assertEqual(result, "context #2")
+        self.assertEqual(self.build_calls, 2)
+
+    def test_footer_is_added_outside_the_cached_body(self):
+        """Repeated reads share one cached body and stamp it with its fetch time."""
+        first = asyncio.run(self.command_handler._get_comprehensive_context())
+        second = asyncio.run(self.command_handler._get_comprehensive_context())
+
+        self.assertEqual(self.build_calls, 1)
+        self.assertEqual(first, second)
+        self.assertEqual(self.command_handler._context_cache[0], "context #1")
+        self.assertTrue(first.startswith("context #1\n🕐 Last updated: "))
+
+
+class TestFilteredContextReuse(unittest.TestCase):
+    """Test suite for /teammember contexts built from the cached sources."""
+
+    def setUp(self):
+        """Set up a handler whose Supabase and Linear fetches are counted."""
+        self.command_handler = SlackCommandHandler()
+        self.command_handler.supabase_service.get_recent_transcript_previews = Mock(return_value=[])
+        self.command_handler.linear_service.get_workspace_context = Mock(return_value=LinearContext(
+            projects=[LinearProject(id="p1", name="One"), LinearProject(id="p2", name="Two")],
+            issues=[
+                LinearIssue(id="i1", title="Ann's task", assignee_name="Ann Lee", project_id="p1"),
+                LinearIssue(id="i2", title="Bob's task", assignee_name="Bob Ray", project_id="p2"),
+            ]
+        ))
+
+    def test_filtered_context_reuses_cached_fetch(self):
+        """Filtered calls narrow the cached sources instead of fetching again, and count as cache lookups."""
+        async def run_test():
+            await self.command_handler._get_comprehensive_context_body()
+            return await asyncio.gather(
+                self.command_handler._get_comprehensive_context_body(issue_filter=lambda issue: issue.assignee_name == "Ann Lee"),
+                self.command_handler._get_comprehensive_context_body(issue_filter=lambda issue: issue.assignee_name == "Bob Ray"),
+            )
+
+        (ann, _), (bob, _) = asyncio.run(run_test())
+
+        self.command_handler.supabase_service.get_recent_transcript_previews.assert_called_once()
+        self.command_handler.linear_service.get_workspace_context.assert_called_once()
+        self.assertIn("Ann's task", ann)
+        self.assertNotIn("Bob's task", ann)
+        self.assertIn("Bob's task", bob)
+        stats = self.command_handler.context_cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
+
+
+class TestFilterLinearContext(unittest.TestCase):
+    """Test suite for narrowing the Linear context to one team member."""
+
+    def setUp(self):
+        """Set up a small workspace with two assignees on separate projects."""
+        self.linear_context = LinearContext(
+            projects=[LinearProject(id="p1", name="One"), LinearProject(id="p2", name="Two")],
+            issues=[
+                LinearIssue(id="i1", title="Ann's task", assignee_name="Ann Lee", project_id="p1"),
+                LinearIssue(id="i2", title="Bob's task", assignee_name="Bob Ray", project_id="p2"),
+            ]
+        )
+
+    def test_keeps_only_matching_issues_and_projects(self):
+        """Only the member's issues and the projects they belong to remain."""
+        filtered = _filter_linear_context(self.linear_context, lambda issue: "ann" in issue.assignee_name.lower())
+
+        self.assertEqual([issue.id for issue in filtered.issues], ["i1"])
+        self.assertEqual([project.id for project in filtered.projects], ["p1"])
+
+    def test_no_match_falls_back_to_full_context(self):
+        """An unknown name keeps the whole workspace rather than an empty one."""
+        filtered = _filter_linear_context(self.linear_context, lambda issue: False)
+
+        self.assertIs(filtered, self.linear_context)
+
+
+class TestLinearFormatMemo(unittest.TestCase):
+    """Test suite for reusing the formatted Linear section across context rebuilds."""
+
+    def test_same_linear_context_is_formatted_once(self):
+        """The formatter only reruns when LinearService hands back a new context object."""
+        handler = SlackCommandHandler()
+        first, second = LinearContext(), LinearContext()
+
+        with patch.object(command_handler, "format_linear_context_comprehensive", side_effect=lambda ctx: f"formatted {id(ctx)}") as formatter:
+            self.assertEqual(handler._format_linear_context_cached(first), handler._format_linear_context_cached(first))
+            handler._format_linear_context_cached(second)
+
+        self.assertEqual(formatter.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
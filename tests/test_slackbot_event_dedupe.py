@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for dropping Slack event retries that share an event_id.
+"""
+
+import sys
+import asyncio
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+# Add the current directory to Python path so we can import from shared/
+sys.path.append(str(Path(__file__).parent.parent))
+
+# Import directly from the slackbot modules to avoid webhook initialization
+sys.path.append(str(Path(__file__).parent.parent / "services" / "slackbot"))
+import event_handler
+from event_handler import SlackEventHandler
+
+
+class TestSlackEventDedupe(unittest.TestCase):
+    """Test suite for the event_id idempotency cache."""
+
+    def setUp(self):
+        """Set up an event handler whose mention handler is mocked out."""
+        self.event_handler = SlackEventHandler()
+        self.event_handler._handle_app_mention = AsyncMock()
+        self.payload = {"event_id": "Ev123", "event": {"type": "app_mention", "text": "hi"}}
+
+    def test_retry_with_same_event_id_is_skipped(self):
+        """A redelivered event is only handled once."""
+        asyncio.run(self.event_handler.handle_event(self.payload))
+        asyncio.run(self.event_handler.handle_event(self.payload))
+
+        self.assertEqual(self.event_handler._handle_app_mention.await_count, 1)
+
+    def test_event_handled_again_after_window(self):
+        """Once the dedupe window has passed the id is forgotten."""
+        asyncio.run(self.event_handler.handle_event(self.payload))
+
+        with patch.object(event_handler, "EVENT_DEDUPE_WINDOW_SECONDS", 0):
+            asyncio.run(self.event_handler.handle_event(self.payload))
+
+        self.assertEqual(self.event_handler._handle_app_mention.await_count, 2)
+
+    def test_ignored_messages_are_not_scheduled(self):
+        """Channel chatter and bot posts are dropped before a task is created."""
+        self.event_handler._handle_message = AsyncMock()
+        ignored = [
+            {"type": "message", "channel_type": "channel", "text": "hello"},
+            {"type": "message", "channel_type": "im", "bot_id": "B1", "text": "hello"},
+            {"type": "message", "channel_type": "im", "text": "   "},
+        ]
+
+        async def run_test():
+            tasks = [self.event_handler.dispatch_event({"event": event}) for event in ignored]
+            dm_task = self.event_handler.dispatch_event({"event": {"type": "message", "channel_type": "im", "text": "hello"}})
+            await dm_task
+            return tasks
+
+        self.assertEqual(asyncio.run(run_test()), [None, None, None])
+        self.assertEqual(self.event_handler._handle_message.await_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -37,12 +37,26 @@ class LocalSlackbotTester:
         print("✅ Initialization complete!")
     
     def _load_transcript(self) -> str:
-        """Load the test transcript file."""
+        """Load the test transcript file, collecting line count and speakers in the same pass."""
         if not self.transcript_path.exists():
             raise FileNotFoundError(f"Transcript not found: {self.transcript_path}")
         
+        lines = []
+        speakers = {}  # insertion-ordered set
         with open(self.transcript_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+            for line in f:
+                lines.append(line)
+                # Speaker name is everything before the first '|'
+                speaker, sep, _ = line.partition('|')
+                if sep and not line.strip().startswith('Speaker'):
+                    speaker = speaker.strip()
+                    if speaker:
+                        speakers[speaker] = None
+        content = "".join(lines)
+        
+        # Same count as content.split('\n')
+        self._transcript_line_count = content.count('\n') + 1
+        self._speakers = tuple(speakers)
         
         print(f"📄 Loaded transcript: {len(content)} characters")
         return content
@@ -76,22 +90,12 @@ class LocalSlackbotTester:
         print("📄 TESTING TRANSCRIPT PROCESSING")
         print("="*50)
         
-        # Simple transcript analysis
-        lines = self.transcript_content.split('\n')
-        speakers = set()
-        
-        for line in lines:
-            if '|' in line and not line.strip().startswith('Speaker'):
-                # Extract speaker names
-                parts = line.split('|')
-                if len(parts) >= 2:
-                    speaker = parts[0].strip()
-                    if speaker:
-                        speakers.add(speaker)
+        # Simple transcript analysis; lines and speakers were collected while loading
+        speakers = self._speakers
         
         # Create filtered transcript summary
         filtered_data = {
-            "total_lines": len(lines),
+            "total_lines": self._transcript_line_count,
             "speakers": list(speakers),
             "speaker_count": len(speakers),
             "meeting_type": "Data Analysis & ICP Profiling Discussion",
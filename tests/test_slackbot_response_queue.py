@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for the queued slash commands and response_url delivery in the Slack command handler.
+"""
+
+import sys
+import asyncio
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+# Add the current directory to Python path so we can import from shared/
+sys.path.append(str(Path(__file__).parent.parent))
+
+# Import directly from command_handler module to avoid webhook initialization
+sys.path.append(str(Path(__file__).parent.parent / "services" / "slackbot"))
+import command_handler
+from command_handler import SlackCommandHandler
+
+
+class TestSlackbotCommandQueue(unittest.TestCase):
+    """Test suite for the bounded slash command queue."""
+
+    def setUp(self):
+        """Set up a handler whose HTTP client is mocked out."""
+        self.command_handler = SlackCommandHandler()
+        self.command_handler._http = Mock()
+        self.command_handler._http.aclose = AsyncMock()
+
+    def test_commands_run_on_workers_and_overflow_is_refused(self):
+        """Queued commands are run by the workers; a full queue refuses new ones."""
+        self.command_handler.handle_command = AsyncMock()
+
+        async def run_test():
+            with patch.object(command_handler, "COMMAND_QUEUE_MAX_SIZE", 2):
+                accepted = [self.command_handler.submit_command({"command": f"/chat {i}"}) for i in range(3)]
+            await self.command_handler._command_queue.join()
+            await self.command_handler.aclose()
+            return accepted
+
+        self.assertEqual(asyncio.run(run_test()), [True, True, False])
+        self.assertEqual(self.command_handler.handle_command.await_count, 2)
+        self.assertEqual(self.command_handler._command_workers, [])
+
+
+class TestSlackbotResponseQueue(unittest.TestCase):
+    """Test suite for the response worker queue."""
+
+    def setUp(self):
+        """Set up a handler whose HTTP client is mocked out."""
+        self.command_handler = SlackCommandHandler()
+        self.command_handler._http = Mock()
+        self.command_handler._http.aclose = AsyncMock()
+
+    def test_send_response_returns_before_delivery(self):
+        """_send_response only enqueues; the worker posts and aclose flushes it."""
+        self.command_handler._http.post = AsyncMock(return_value=Mock(status_code=200))
+
+        async def run_test():
+            await self.command_handler._send_response("https://hooks.slack.test/1", {"text": "hi"})
+            posted_before_yield = self.command_handler._http.post.await_count
+            await self.command_handler.aclose()
+            return posted_before_yield
+
+        posted_before_yield = asyncio.run(run_test())
+
+        self.assertEqual(posted_before_yield, 0)
+        self.assertEqual(self.command_handler._http.post.await_count, 1)
+
+    def test_server_errors_are_retried(self):
+        """A 5xx from Slack is retried until a 200 comes back."""
+        self.command_handler._http.post = AsyncMock(side_effect=[Mock(status_code=503), Mock(status_code=200)])
+
+        async def run_test():
+            await self.command_handler._send_response("https://hooks.slack.test/1", {"text": "hi"})
+            await self.command_handler.aclose()
+
+        with patch.object(command_handler, "RESPONSE_RETRY_BACKOFF_SECONDS", 0):
+            asyncio.run(run_test())
+
+        self.assertEqual(self.command_handler._http.post.await_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
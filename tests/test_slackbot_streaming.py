@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tests for streaming AI responses into Slack messages.
+"""
+
+import sys
+import types
+import asyncio
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+# Add the current directory to Python path so we can import from shared/
+sys.path.append(str(Path(__file__).parent.parent))
+
+# Import directly from command_handler module to avoid webhook initialization
+sys.path.append(str(Path(__file__).parent.parent / "services" / "slackbot"))
+import command_handler
+from command_handler import SlackCommandHandler, STREAM_UPDATE_TOKENS, STREAM_MIN_UPDATE_INTERVAL_SECONDS, STREAM_INTERRUPTED_NOTICE
+from event_handler import SlackEventHandler
+
+
+class TestSlackbotStreaming(unittest.TestCase):
+    """Test suite for the placeholder + chat.update streaming path."""
+
+    def setUp(self):
+        """Set up a handler with Slack and OpenAI calls mocked out."""
+        self.command_handler = SlackCommandHandler()
+        self.command_handler.slack_service.post_message_async = AsyncMock(return_value="1700000000.000100")
+        self.command_handler.slack_service.update_message_async = AsyncMock(return_value=True)
+
+    def _fake_stream(self, deltas, clock=None, step=0.0):
+        async def _stream(system_prompt, user_prompt, cache_key=None):
+            for delta in deltas:
+                if clock is not None:
+                    clock[0] += step
+                yield delta
+        return _stream
+
+    def _run_with_clock(self, clock):
+        """Run _stream_ai_response with time.monotonic reading the fake clock."""
+        fake_time = types.SimpleNamespace(monotonic=lambda: clock[0])
+        with patch.object(command_handler, "time", fake_time):
+            return asyncio.run(self.command_handler._stream_ai_response("C123", "system", "user", "⏳"))
+
+    def test_stream_updates_message_in_batches(self):
+        """Deltas are batched into a few chat.update calls ending with the full text."""
+        deltas = ["word "] * (STREAM_UPDATE_TOKENS * 2 + 5)
+        clock = [0.0]
+        # Slow enough that each batch of STREAM_UPDATE_TOKENS spans the minimum interval
+        self.command_handler.ai_service.generate_text_stream = self._fake_stream(
+            deltas, clock, step=STREAM_MIN_UPDATE_INTERVAL_SECONDS / STREAM_UPDATE_TOKENS * 1.5
+        )
+
+        result = self._run_with_clock(clock)
+
+        self.assertEqual(result, "".join(deltas))
+        update_mock = self.command_handler.slack_service.update_message_async
+        self.assertEqual(update_mock.call_count, 3)
+        self.assertEqual(update_mock.call_args[0][2], "".join(deltas))
+
+    def test_stream_updates_at_most_once_per_interval(self):
+        """A fast stream never pushes chat.update more often than the minimum interval."""
+        deltas = ["Short sentence. "] * (STREAM_UPDATE_TOKENS * 5)
+        clock = [0.0]
+        self.command_handler.ai_service.generate_text_stream = self._fake_stream(deltas, clock, step=0.01)
+        update_times = []
+
+        async def record_update(channel, ts, text):
+            update_times.append(clock[0])
+            return True
+
+        self.command_handler.slack_service.update_message_async = AsyncMock(side_effect=record_update)
+
+        result = self._run_with_clock(clock)
+
+        self.assertEqual(result, "".join(deltas))
+        # Intermediate updates are spaced by the interval; the final update always follows
+        intermediate = update_times[:-1]
+        self.assertEqual(len(intermediate), int(clock[0] / STREAM_MIN_UPDATE_INTERVAL_SECONDS))
+        for earlier, later in zip([0.0] + intermediate, intermediate):
+            self.assertGreaterEqual(later - earlier, STREAM_MIN_UPDATE_INTERVAL_SECONDS - 1e-9)
+        self.assertEqual(self.command_handler.slack_service.update_message_async.await_args[0][2], "".join(deltas))
+
+    def test_interrupted_stream_is_marked(self):
+        """A stream that fails after some deltas keeps the partial text and flags it as cut off."""
+        async def failing_stream(system_prompt, user_prompt, cache_key=None):
+            yield "The sprint "
+            yield "is "
+            raise RuntimeError("connection reset")
+
+        self.command_handler.ai_service.generate_text_stream = failing_stream
+
+        result = asyncio.run(self.command_handler._stream_ai_response("C123", "system", "user", "⏳"))
+
+        self.assertEqual(result, "The sprint is " + STREAM_INTERRUPTED_NOTICE)
+        self.command_handler.slack_service.update_message_async.assert_awaited_with("C123", "1700000000.000100", result)
+
+    def test_stream_falls_back_without_placeholder(self):
+        """If the placeholder cannot be posted the caller gets None and nothing is streamed."""
+        self.command_handler.slack_service.post_message_async = AsyncMock(return_value=None)
+        self.command_handler.ai_service.generate_text_stream = Mock()
+
+        result = asyncio.run(self.command_handler._stream_ai_response("C123", "system", "user", "⏳"))
+
+        self.assertIsNone(result)
+        self.command_handler.ai_service.generate_text_stream.assert_not_called()
+
+    def test_mention_reply_is_streamed(self):
+        """Mentions stream into a placeholder message instead of waiting for the full answer."""
+        self.command_handler._get_comprehensive_context = AsyncMock(return_value="context")
+        self.command_handler.ai_service.generate_text_stream = self._fake_stream(["Sprint ", "is on track."])
+        self.command_handler.ai_service.generate_text_async = AsyncMock()
+        event_handler = SlackEventHandler(self.command_handler)
+
+        asyncio.run(event_handler._handle_app_mention({"channel": "C123", "text": "how is the sprint going?"}))
+
+        self.command_handler.slack_service.post_message_async.assert_awaited_once_with("C123", "👋 ...")
+        self.command_handler.slack_service.update_message_async.assert_awaited_with("C123", "1700000000.000100", "👋 Sprint is on track.")
+        self.command_handler.ai_service.generate_text_async.assert_not_awaited()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Tests for the bounded TTL store backing per-user Slack state.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the current directory to Python path so we can import from shared/
+sys.path.append(str(Path(__file__).parent.parent))
+
+# Import directly from command_handler module to avoid webhook initialization
+sys.path.append(str(Path(__file__).parent.parent / "services" / "slackbot"))
+import command_handler
+from command_handler import TTLStore
+
+
+class TestTTLStore(unittest.TestCase):
+    """Test suite for TTLStore expiry and capacity."""
+
+    def test_entries_expire_after_ttl(self):
+        """A value is readable until its TTL passes, then it is gone."""
+        store = TTLStore(maxsize=10, ttl_seconds=60)
+        with patch.object(command_handler.time, "monotonic", return_value=1000.0):
+            store["U1"] = ["t1"]
+        with patch.object(command_handler.time, "monotonic", return_value=1059.0):
+            self.assertEqual(store.get("U1"), ["t1"])
+        with patch.object(command_handler.time, "monotonic", return_value=1060.0):
+            self.assertIsNone(store.get("U1"))
+            self.assertNotIn("U1", store)
+
+    def test_oldest_entry_evicted_at_capacity(self):
+        """Past maxsize the least recently set user is dropped first."""
+        store = TTLStore(maxsize=2, ttl_seconds=60)
+        store["U1"] = 1
+        store["U2"] = 2
+        store["U1"] = 3
+        store["U3"] = 4
+
+        self.assertEqual(len(store), 2)
+        self.assertNotIn("U2", store)
+        self.assertEqual(store.get("U1"), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()